@@ -4,319 +4,297 @@ import os
 # This adds the 'backend' directory to Python's path, allowing imports from the 'app' folder
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+import numpy as np
 
-# This is a crucial step to ensure the script can find your calculation modules.
-# It adds the 'backend/app' directory to Python's path.
+from app.cache import CachedResponse, ResponseCache
+from app.calculations.material_properties import MaterialProperties
+from app.handlers import HANDLERS, NUMERIC_INPUTS, evaluate, evaluate_batch
+from app.inventory import LEVELS, FireLoadInventory
+from app.materials import MaterialCatalog
+from app.sensitivity import evaluate_with_jacobian, sensitivity_report
+from app.serialization import negotiate
+from app.streaming import CSV, NDJSON, decode_lines, iter_csv_rows, iter_ndjson_rows, stream_results
 
+# --- Flask App Setup ---
+app = Flask(__name__)
+# Allow requests from your frontend (we'll specify the real URL later)
+CORS(app) 
 
-# Now you can import your calculator
-from app.calculations.area_volume import AreaVolumeCalculator
-from app.calculations.flashover import FlashoverCalculator
-from app.utils.unit_converter import UnitConverter
-# backend/api.py
-from app.calculations.flashover import FlashoverCalculator
-from app.calculations.flame_height import FlameHeightCalculator # <-- ADD THIS LINE
-from app.utils.unit_converter import UnitConverter
+# Upper bound on the number of items accepted by /api/batch in one request
+MAX_BATCH_ITEMS = int(os.environ.get('MAX_BATCH_ITEMS', 100000))
+# Rows evaluated per vectorized call by the streaming route
+STREAM_CHUNK_ROWS = int(os.environ.get('STREAM_CHUNK_ROWS', 4096))
 
-# backend/api.py
-from app.calculations.flame_height import FlameHeightCalculator
-from app.calculations.radiation import RadiationCalculator # <-- ADD THIS LINE
-from app.utils.unit_converter import UnitConverter
 
-# backend/api.py
-from app.calculations.radiation import RadiationCalculator
-from app.calculations.t_squared import TSquaredCalculator # <-- ADD THIS LINE
-from app.utils.unit_converter import UnitConverter
+def _cache_backend():
+    # Optional shared cache, e.g. RESPONSE_CACHE_URL=redis://localhost:6379/0
+    url = os.environ.get('RESPONSE_CACHE_URL')
+    if not url:
+        return None
+    import redis
+    return redis.Redis.from_url(url)
 
-# backend/api.py
-from app.calculations.t_squared import TSquaredCalculator
-from app.calculations.heat_release import HeatReleaseCalculator # <-- ADD THIS LINE
-from app.utils.unit_converter import UnitConverter
 
-# backend/api.py
-from app.calculations.heat_release import HeatReleaseCalculator
-from app.calculations.material_properties import MaterialProperties # <-- ADD OR VERIFY THIS IMPORT
-from app.utils.unit_converter import UnitConverter
+# Largest page /api/materials returns
+MATERIALS_PAGE_LIMIT = int(os.environ.get('MATERIALS_PAGE_LIMIT', 500))
 
-# --- Flask App Setup ---
-app = Flask(__name__)
-# Allow requests from your frontend (we'll specify the real URL later)
-CORS(app) 
+
+# Results of the single-item routes; RESPONSE_CACHE_SIZE=0 turns caching off
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', 4096)),
+    ttl=float(os.environ.get('RESPONSE_CACHE_TTL', 3600)),
+    precision=int(os.environ.get('RESPONSE_CACHE_PRECISION', 12)),
+    backend=_cache_backend(),
+    numeric_fields=NUMERIC_INPUTS,
+    # Results depend on the material database being served
+    scope=MaterialProperties.data_version,
+)
 
 # --- API Endpoints ---
 
+def _single(calculator):
+    """
+    Evaluates one JSON payload with the same vectorized handler /api/batch uses,
+    returning 400 with the error message if the calculation failed.
+    Responses are served from response_cache when an equivalent request was seen,
+    and a matching If-None-Match gets a 304.
+    """
+    payload = request.json
+    if not response_cache.enabled:
+        return _respond_single(calculator, payload)
+
+    key = response_cache.key(calculator, payload)
+    cached = response_cache.get(key)
+    status = 'HIT'
+    if cached is None:
+        response = _respond_single(calculator, payload)
+        cached = CachedResponse(response.status_code, response.get_data())
+        response_cache.set(key, cached)
+        status = 'MISS'
+
+    if cached.status == 200 and cached.etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(cached.body, status=cached.status, mimetype='application/json')
+    response.set_etag(cached.etag)
+    response.headers['X-Cache'] = status
+    return response
+
+def _respond_single(calculator, payload):
+    result = evaluate(calculator, [payload])[0]
+    if "error" in result:
+        response = jsonify(result)
+        response.status_code = 400
+        return response
+    return jsonify(result)
+
 # Create an endpoint for the rectangular compartment calculation
 # This function will be triggered by visiting http://127.0.0.1:5000/api/rectangular_area_volume
 @app.route('/api/rectangular_area_volume', methods=['POST'])
 def rectangular_area_volume():
-    # Get the data (length, width, height) sent from the frontend
-    data = request.json
-    try:
-        # Call your existing calculator class
-        result = AreaVolumeCalculator.rectangular_compartment(
-            length=float(data['length']),
-            width=float(data['width']),
-            height=float(data['height']),
-            units=data.get('units', 'SI') # Use 'SI' as a default
-        )
-        # Send the successful result back to the frontend in JSON format
-        return jsonify(result)
-    except (ValueError, KeyError) as e:
-        # If something goes wrong (e.g., missing data), send an error message
-        return jsonify({"error": str(e)}), 400
-    
-    # --- ADD THIS ENTIRE NEW ENDPOINT ---
-# backend/api.py
+    # Returns total_surface_area, floor_area, wall_area and volume
+    return _single('rectangular_area_volume')
 
 @app.route('/api/flashover', methods=['POST'])
 def flashover():
-    data = request.json
-    try:
-        # --- Get all data from the frontend ---
-        room_length_in = float(data['roomLength'])
-        room_width_in = float(data['roomWidth'])
-        room_height_in = float(data['roomHeight'])
-        opening_width_in = float(data['openingWidth'])
-        opening_height_in = float(data['openingHeight'])
-        surface_material = data['surfaceMaterial']
-        units = data.get('units', 'SI')
-
-        # --- THIS IS THE NEW, CRUCIAL PART ---
-        # Convert all incoming dimensions to SI (meters) before any calculations
-        if units.lower() == 'imperial':
-            room_length = UnitConverter.length_converter(room_length_in, 'ft', 'm')
-            room_width = UnitConverter.length_converter(room_width_in, 'ft', 'm')
-            room_height = UnitConverter.length_converter(room_height_in, 'ft', 'm')
-            opening_width = UnitConverter.length_converter(opening_width_in, 'ft', 'm')
-            opening_height = UnitConverter.length_converter(opening_height_in, 'ft', 'm')
-        else:
-            room_length = room_length_in
-            room_width = room_width_in
-            room_height = room_height_in
-            opening_width = opening_width_in
-            opening_height = opening_height_in
-        
-        # --- Now calculate areas using ONLY SI units ---
-        At = 2 * (room_length * room_width + room_length * room_height + room_width * room_height)
-        A0 = opening_width * opening_height
-        H0 = opening_height
-
-        # --- Call the simplified calculation methods (they only speak SI) ---
-        q_mqh = FlashoverCalculator.mccaffrey_correlation(At, A0, H0, surface_material)
-        q_babrauskas = FlashoverCalculator.babrauskas_correlation(A0, H0)
-        q_thomas = FlashoverCalculator.thomas_correlation(At, A0, H0)
-
-        results_si = { "mqh": q_mqh, "thomas": q_thomas, "babrauskas": q_babrauskas }
-
-        # --- Convert the FINAL result back to imperial if needed ---
-        if units.lower() == 'imperial':
-            final_results = {
-                "mqh": UnitConverter.heat_release_converter(results_si["mqh"], 'kW', 'BTU/s'),
-                "thomas": UnitConverter.heat_release_converter(results_si["thomas"], 'kW', 'BTU/s'),
-                "babrauskas": UnitConverter.heat_release_converter(results_si["babrauskas"], 'kW', 'BTU/s')
-            }
-            return jsonify(final_results)
-        
-        return jsonify(results_si)
-
-    except Exception as e:
-            print(f"--- ERROR in point_source_radiation_endpoint: {e} ---") # <-- ADD THIS LINE
-            return jsonify({"error": str(e)}), 400
-    # --- ADD THIS ENTIRE NEW ENDPOINT ---
-
-# Paste this entire function into api.py
-
-# Replace the old flame_height_endpoint with this one in api.py
+    # Room and opening dimensions are converted to SI, results (kW) back to BTU/s if imperial
+    return _single('flashover')
 
 @app.route('/api/flame_height', methods=['POST'])
 def flame_height_endpoint():
-    try:
-        data = request.json
-        mode = data.get('calculateMode')
-        units = data.get('units', 'SI')
-        
-        hrr_in = float(data.get('heatRelease') or 0)
-        diameter_in = float(data.get('diameter') or 0)
-        flame_height_in = float(data.get('flameHeight') or 0)
-
-        # 1. Convert all inputs to SI units first
-        if units.lower() == 'imperial':
-            hrr_si = UnitConverter.heat_release_converter(hrr_in, 'btu/s', 'kw')
-            diameter_si = UnitConverter.length_converter(diameter_in, 'ft', 'm')
-            flame_height_si = UnitConverter.length_converter(flame_height_in, 'ft', 'm')
-        else:
-            hrr_si = hrr_in
-            diameter_si = diameter_in
-            flame_height_si = flame_height_in
-
-        # 2. Perform the calculation in SI units
-        result_si = 0
-        if mode == 'flameHeight':
-            result_si = FlameHeightCalculator.calculate_flame_height(Q=hrr_si, D=diameter_si)
-        elif mode == 'heatRelease':
-            if flame_height_si <= 0 or diameter_si <= 0:
-                raise ValueError("Flame Height and Diameter must be positive.")
-            numerator = flame_height_si + (1.02 * diameter_si)
-            result_si = (numerator / 0.235)**2.5
-        elif mode == 'diameter':
-            if flame_height_si <= 0 or hrr_si <= 0:
-                raise ValueError("Flame Height and Heat Release Rate must be positive.")
-            numerator = (0.235 * (hrr_si**0.4)) - flame_height_si
-            if numerator <= 0:
-                raise ValueError("Flame height is too large for the given Heat Release Rate.")
-            result_si = numerator / 1.02
-        else:
-            raise ValueError(f"Invalid calculation mode: {mode}")
-
-        # 3. Prepare the final value, converting the output if necessary
-        final_value = 0
-        if units.lower() == 'imperial':
-            # We need to convert the SI result to Imperial units
-            if mode == 'heatRelease':
-                final_value = UnitConverter.heat_release_converter(result_si, 'kw', 'btu/s')
-            else:  # This handles 'flameHeight' and 'diameter'
-                final_value = UnitConverter.length_converter(result_si, 'm', 'ft')
-        else:
-            # If SI, the result is already in the correct units
-            final_value = result_si
-
-        return jsonify({"value": final_value})
+    # calculateMode picks the unknown: 'flameHeight', 'heatRelease' or 'diameter'
+    return _single('flame_height')
 
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-    
- # --- ADD THIS ENTIRE NEW ENDPOINT ---
 @app.route('/api/point_source_radiation', methods=['POST'])
 def point_source_radiation_endpoint():
-    try:
-        data = request.json
-        units = data.get('units', 'SI')
+    return _single('point_source_radiation')
 
-        hrr_in = float(data.get('heatRelease') or 0)
-        distance_in = float(data.get('distance') or 0)
-        rad_fraction = float(data.get('radiativeFraction') or 0)
-
-        # 1. Convert inputs to SI
-        if units.lower() == 'imperial':
-            hrr_si = UnitConverter.heat_release_converter(hrr_in, 'btu/s', 'kw')
-            distance_si = UnitConverter.length_converter(distance_in, 'ft', 'm')
-        else:
-            hrr_si = hrr_in
-            distance_si = distance_in
-
-        # 2. Perform calculation in SI
-        result_si = RadiationCalculator.calculate_heat_flux(Q=hrr_si, R=distance_si, Xr=rad_fraction)
-
-        # 3. Convert output if necessary
-        final_value = result_si
-        if units.lower() == 'imperial':
-            # The point source formula gives heat flux (kW/m^2), which needs a specific converter
-            final_value = UnitConverter.heat_flux_converter(result_si, 'kw/m2', 'btu/ft2/s')
-
-        return jsonify({"value": final_value})
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400   
-    
-    # --- ADD THIS ENTIRE NEW ENDPOINT ---
 @app.route('/api/t_squared_growth', methods=['POST'])
 def t_squared_growth_endpoint():
-    try:
-        data = request.json
-        mode = data.get('calculateMode')
-        units = data.get('units', 'SI')
-        growth_rate = data.get('growthRate', 'medium')
-
-        time_in = float(data.get('time') or 0)
-        hrr_in = float(data.get('heatRelease') or 0)
-        custom_alpha_in = float(data.get('customAlpha') or 0)
-
-        # Determine alpha in SI units
-        if growth_rate == 'custom':
-            if units.lower() == 'imperial':
-                alpha_si = UnitConverter.alpha_converter(custom_alpha_in, 'btu/s3', 'kw/s2')
-            else:
-                alpha_si = custom_alpha_in
-        else:
-            alpha_si = TSquaredCalculator.GROWTH_COEFFICIENTS.get(growth_rate)
-
-        if alpha_si is None:
-            raise ValueError(f"Invalid growth rate: {growth_rate}")
-
-        # Convert other inputs to SI
-        if units.lower() == 'imperial':
-            hrr_si = UnitConverter.heat_release_converter(hrr_in, 'btu/s', 'kw')
-        else:
-            hrr_si = hrr_in
-
-        # Perform calculation
-        result_si = 0
-        if mode == 'heatRelease':
-            result_si = TSquaredCalculator.calculate_hrr(alpha=alpha_si, time=time_in)
-        elif mode == 'time':
-            result_si = TSquaredCalculator.calculate_time(alpha=alpha_si, hrr=hrr_si)
-
-        # Convert final result back to imperial if needed
-        final_value = result_si
-        if units.lower() == 'imperial':
-            if mode == 'heatRelease':
-                final_value = UnitConverter.heat_release_converter(result_si, 'kw', 'btu/s')
-            # Time is already in seconds, no conversion needed for 'time' mode
-
-        return jsonify({"value": final_value})
+    # calculateMode is 'heatRelease' (HRR at time) or 'time' (time to HRR)
+    return _single('t_squared_growth')
 
-    except Exception as e:
-        return jsonify({"error": str(e)}), 400
-    
-    # --- ADD THIS ENTIRE NEW ENDPOINT ---
 @app.route('/api/heat_release', methods=['POST'])
 def heat_release_endpoint():
+    return _single('heat_release')
+
+@app.route('/api/batch', methods=['POST'])
+def batch_endpoint():
+    """
+    Evaluates many calculations in one round trip. The body is either a list of
+    payloads or {"items": [...]}; each payload is what the matching single route
+    accepts plus a "calculator" key naming it (e.g. "flashover", "flame_height").
+    Returns {"results": [...]} in request order, with {"error": ...} per failed item.
+    """
+    data = request.json
+    items = data.get('items') if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return jsonify({"error": "Batch body must be a list of items or {\"items\": [...]}"}), 400
+    if len(items) > MAX_BATCH_ITEMS:
+        return jsonify({"error": f"Batch is limited to {MAX_BATCH_ITEMS} items"}), 413
+
+    return _serialized({"results": evaluate_batch(items)})
+
+@app.route('/api/stream/<calculator>', methods=['POST'])
+def stream_endpoint(calculator):
+    """
+    Bulk-evaluates a scenario file for one calculator (e.g. /api/stream/flashover).
+    The body is NDJSON (one payload per line) or CSV with a header row, chosen by
+    Content-Type. It is read incrementally and evaluated STREAM_CHUNK_ROWS rows at
+    a time, and results stream back in the same format, one row per input row.
+    """
+    if calculator not in HANDLERS:
+        return jsonify({"error": f"Unknown calculator: {calculator}"}), 404
+    content_type = request.mimetype if request.mimetype == CSV else NDJSON
     try:
-        data = request.json
-        units = data.get('units', 'SI')
-        material_key = data.get('material')
-        area_in = float(data.get('burningArea') or 0)
-        manual_mass_flux = data.get('manualMassFlux') # Can be None
-
-        # Convert area input to SI
-        if units.lower() == 'imperial':
-            area_si = UnitConverter.area_converter(area_in, 'ft2', 'm2')
-        else:
-            area_si = area_in
-
-        # Mass flux is always provided in g/m²-s from the frontend
-        manual_mass_flux_si = float(manual_mass_flux) if manual_mass_flux else None
-
-        # Perform calculation in SI
-        result_si = HeatReleaseCalculator.calculate_hrr(
-            material_key=material_key,
-            burning_area=area_si,
-            manual_mass_flux=manual_mass_flux_si
-        )
-
-        # Convert output if necessary
-        final_value = result_si
-        if units.lower() == 'imperial':
-            final_value = UnitConverter.heat_release_converter(result_si, 'kw', 'btu/s')
-
-        return jsonify({"value": final_value})
+        serializer = negotiate(None, request.args.get('precision'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    except Exception as e:
+    body = stream_results(calculator, decode_lines(request.stream), content_type, STREAM_CHUNK_ROWS, serializer)
+    return Response(stream_with_context(body), mimetype=content_type)
+    
+@app.route('/api/fire_load_inventory', methods=['POST'])
+def fire_load_inventory_endpoint():
+    """
+    Aggregates a per-item survey inventory into fire loads per room, floor or
+    building (?level=..., rooms by default). The body is NDJSON or CSV rows with
+    material, mass, room, floor and building; rows with an area and no material
+    give a room's floor area (m²). Rows are consumed a chunk at a time, so the
+    body is never held in memory. Returns the group totals and the rejected rows
+    as {message: {"rows": count, "first_row": number}}.
+    """
+    level = request.args.get('level', 'room')
+    if level not in LEVELS:
+        return jsonify({"error": f"Level must be one of {', '.join(LEVELS)}"}), 400
+    lines = decode_lines(request.stream)
+    rows = iter_csv_rows(lines) if request.mimetype == CSV else iter_ndjson_rows(lines)
+    inventory = FireLoadInventory()
+    inventory.add_rows(rows, STREAM_CHUNK_ROWS)
+
+    totals = inventory.totals(level)
+    density = totals.pop('fire_load_density')
+    groups = {name: totals.pop(name) for name in LEVELS if name in totals}
+    return _serialized({
+        **groups,
+        **{name: totals[name] for name in ('items', 'mass', 'energy', 'floor_area')},
+        "fire_load_density": density.values,
+        "rows": inventory.rows,
+        "errors": {message: {"rows": count, "first_row": first}
+                   for message, (count, first) in inventory.errors.items()},
+    })
+
+@app.route('/api/jacobian', methods=['POST'])
+def jacobian_endpoint():
+    """
+    Values and analytic partial derivatives of a correlation in one call.
+    The body is {"calculator": name, "inputs": {name: value or list}} with SI inputs
+    and a runner calculator name (e.g. "mqh_temperature", "natural_vent_flow").
+    Returns {"values": {output: [...]}, "jacobian": {output: {input: [...]}}, "errors": [...]}.
+    """
+    data = request.json or {}
+    try:
+        results, jacobian = evaluate_with_jacobian(data.get('calculator'), data.get('inputs') or {})
+    except (ValueError, TypeError) as e:
+        return jsonify({"error": str(e)}), 400
+    errors = next(iter(results.values())).errors()
+    return _serialized({
+        "values": {name: result.values for name, result in results.items()},
+        "jacobian": {
+            output: {name: np.asarray(partial, dtype=float) for name, partial in partials.items()}
+            for output, partials in jacobian.items()
+        },
+        "errors": errors,
+    })
+
+@app.route('/api/sensitivity', methods=['POST'])
+def sensitivity_endpoint():
+    """
+    Sensitivity report of one base case: values, gradients, elasticities and
+    tornado chart data. The body is {"calculator": name, "inputs": {...}, "variation": 0.1}.
+    """
+    data = request.json or {}
+    try:
+        report = sensitivity_report(data.get('calculator'), data.get('inputs') or {},
+                                    float(data.get('variation', 0.1)))
+    except (ValueError, TypeError) as e:
         return jsonify({"error": str(e)}), 400
+    return _serialized(report)
+
+def _serialized(obj, status=200):
+    """
+    Encodes a response object, which may hold NumPy arrays, in the format the
+    request negotiated (see app.serialization): JSON by default, raw float
+    arrays for Accept: application/x-float-arrays, and ?precision= rounds
+    floats to that many significant digits.
+    """
+    try:
+        serializer = negotiate(request.accept_mimetypes, request.args.get('precision'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return Response(serializer.dumps(obj), status=status, mimetype=serializer.media_type)
+
+@app.route('/api/cache_stats', methods=['GET'])
+def cache_stats_endpoint():
+    # Hit/miss counters of the single-item response cache
+    return jsonify(response_cache.stats())
     
     # --- ADD THIS ENTIRE NEW ENDPOINT ---
 @app.route('/api/materials', methods=['GET'])
 def get_materials():
+    """
+    Lists the fuels as {key: {name, heat_of_combustion, mass_flux}}, optionally filtered:
+    ?q= key or name prefix, ?has_mass_flux=true|false, ?min_hoc= / ?max_hoc= (MJ/kg).
+    With ?limit= (and ?offset=) returns one page instead:
+    {"total", "offset", "limit", "materials": {key: ...}}.
+    Bodies are pre-serialized and carry an ETag; If-None-Match gets a 304.
+    """
     try:
-        # Use the new helper method to get all fuel data
-        all_fuels = MaterialProperties.get_all_fuels()
-        return jsonify(all_fuels)
+        query = _materials_query(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        body, etag = MaterialCatalog.current().page(**query)
     except Exception as e:
         # Return an error if something goes wrong
         return jsonify({"error": str(e)}), 500
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # Let clients keep the list but revalidate it, which is a 304 when unchanged
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def _materials_query(args) -> dict:
+    def number(name, kind=float):
+        value = args.get(name)
+        if value is None or value == '':
+            return None
+        try:
+            return kind(value)
+        except ValueError:
+            raise ValueError(f"Invalid {name}: {value}")
+
+    has_mass_flux = args.get('has_mass_flux')
+    if has_mass_flux is not None:
+        if has_mass_flux.lower() not in ('true', 'false', '1', '0'):
+            raise ValueError(f"Invalid has_mass_flux: {has_mass_flux}")
+        has_mass_flux = has_mass_flux.lower() in ('true', '1')
+
+    offset, limit = number('offset', int) or 0, number('limit', int)
+    if offset < 0 or (limit is not None and limit < 1):
+        raise ValueError("Offset cannot be negative and limit must be positive")
+    return {
+        'prefix': args.get('q') or None,
+        'has_mass_flux': has_mass_flux,
+        'min_hoc': number('min_hoc'),
+        'max_hoc': number('max_hoc'),
+        'offset': offset,
+        'limit': None if limit is None else min(limit, MATERIALS_PAGE_LIMIT),
+    }
     
 # --- Main entry point to run the server ---
 # This file no longer needs a __main__ block to run the server.
-# The new top-level app.py handles that.
\ No newline at end of file
+# The top-level asgi.py serves these routes in production (uvicorn asgi:app).
\ No newline at end of file
@@ -0,0 +1,251 @@
+# backend/app/asgi.py
+"""
+ASGI serving of the calculation API.
+
+AsgiServer wraps the Flask app (api.app) so that an ASGI server such as
+uvicorn serves exactly the same routes. Each request is handled by a
+coroutine on the event loop; the Flask view itself, which is CPU-bound NumPy
+work, runs in a bounded thread pool so the loop stays free to accept and
+answer other requests. Bodies stream both ways: the view reads the request
+body as the client sends it and each chunk of a streamed response is sent as
+soon as the view produces it, one pool task per chunk.
+
+Routes are limited separately (RouteLimit). A route runs at most
+`concurrency` requests at once, queues up to `queue` more, and answers 503
+with Retry-After beyond that, so a burst on one route is pushed back to its
+clients instead of piling up in memory. Heavy routes (batch, streams,
+inventories, Jacobians) run in their own 'batch' pool, so long requests
+cannot take every worker away from the small interactive calls.
+
+NumPy releases the GIL inside most array operations, so the threads of one
+process overlap their calculations; run several server processes to use
+more cores than that.
+"""
+
+import asyncio
+import contextvars
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads of the interactive and batch pools
+ASGI_INTERACTIVE_WORKERS = int(os.environ.get('ASGI_INTERACTIVE_WORKERS', 8))
+ASGI_BATCH_WORKERS = int(os.environ.get('ASGI_BATCH_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+# Seconds clients are asked to wait after a 503
+ASGI_RETRY_AFTER = int(os.environ.get('ASGI_RETRY_AFTER', 1))
+
+
+class RouteLimit:
+    """
+    Admission control of one route: at most `concurrency` requests run at once
+    in the named pool and at most `queue` more wait for a slot.
+    """
+
+    __slots__ = ('concurrency', 'queue', 'pool', 'active', '_slots')
+
+    def __init__(self, concurrency: int, queue: int, pool: str = 'interactive'):
+        if concurrency < 1 or queue < 0:
+            raise ValueError("Concurrency must be positive and queue length non-negative")
+        self.concurrency = concurrency
+        self.queue = queue
+        self.pool = pool
+        # Requests admitted and not finished, running or waiting
+        self.active = 0
+        self._slots = None
+
+    def admit(self) -> bool:
+        """Admits a request unless every slot and queue place is taken."""
+        if self.active >= self.concurrency + self.queue:
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        # Created on first use, inside the server's event loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        return self._slots
+
+
+def default_limits() -> dict:
+    """Path prefix -> RouteLimit for the heavy routes of api.py; other routes share DEFAULT_LIMIT."""
+    return {
+        '/api/batch': RouteLimit(2, 8, 'batch'),
+        '/api/stream/': RouteLimit(2, 4, 'batch'),
+        '/api/fire_load_inventory': RouteLimit(1, 4, 'batch'),
+        '/api/jacobian': RouteLimit(2, 16, 'batch'),
+        '/api/sensitivity': RouteLimit(2, 16, 'batch'),
+    }
+
+
+class AsgiServer:
+    """
+    ASGI application serving a WSGI app (the Flask API) with async request
+    handling, worker pools and per-route limits (see the module docstring).
+
+    Args:
+        wsgi_app: The WSGI application, e.g. api.app
+        limits: Path prefix -> RouteLimit; the longest matching prefix applies
+        default_limit: RouteLimit of every other path
+        workers: Pool name -> number of threads; 'interactive' and 'batch' by default
+    """
+
+    def __init__(self, wsgi_app, limits: dict = None, default_limit: RouteLimit = None, workers: dict = None):
+        self.wsgi_app = wsgi_app
+        self.limits = default_limits() if limits is None else dict(limits)
+        self.default_limit = default_limit or RouteLimit(32, 256)
+        workers = workers or {'interactive': ASGI_INTERACTIVE_WORKERS, 'batch': ASGI_BATCH_WORKERS}
+        self.pools = {name: ThreadPoolExecutor(count, thread_name_prefix=f'asgi-{name}')
+                      for name, count in workers.items()}
+        for limit in list(self.limits.values()) + [self.default_limit]:
+            if limit.pool not in self.pools:
+                raise ValueError(f"Unknown worker pool: {limit.pool}")
+        # Longest prefixes first, so the most specific limit wins
+        self._prefixes = sorted(self.limits, key=len, reverse=True)
+
+    def limit_for(self, path: str) -> RouteLimit:
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self.limits[prefix]
+        return self.default_limit
+
+    def shutdown(self) -> None:
+        for pool in self.pools.values():
+            pool.shutdown(wait=True)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        limit = self.limit_for(scope['path'])
+        if not limit.admit():
+            await _send_json(send, 503, {"error": "Server is busy, retry later"},
+                             [(b'retry-after', str(ASGI_RETRY_AFTER).encode())])
+            return
+        try:
+            async with limit.slots:
+                await self._handle(scope, receive, send, self.pools[limit.pool])
+        finally:
+            limit.release()
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _handle(self, scope, receive, send, pool: ThreadPoolExecutor):
+        loop = asyncio.get_running_loop()
+        # Every step of one request runs in the same context, so Flask's request
+        # context stays valid while a streamed response moves between threads
+        context = contextvars.copy_context()
+
+        def run(function, *args):
+            return loop.run_in_executor(pool, context.run, function, *args)
+
+        environ = _environ(scope, io.BufferedReader(_RequestBody(receive, loop)))
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                   for name, value in headers]
+
+        body = await run(self.wsgi_app, environ, start_response)
+        try:
+            chunks = iter(body)
+            # Flask calls start_response before returning, but the WSGI spec allows
+            # it as late as the first chunk
+            chunk = await run(next, chunks, None)
+            await send({'type': 'http.response.start', 'status': response['status'],
+                        'headers': response['headers']})
+            while chunk is not None:
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                chunk = await run(next, chunks, None)
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            if hasattr(body, 'close'):
+                await run(body.close)
+
+
+class _RequestBody(io.RawIOBase):
+    """
+    The request body as a blocking stream for the WSGI app, fed by the ASGI
+    receive channel. Reads happen on a pool thread and wait for the event loop
+    to deliver the next part of the body.
+    """
+
+    def __init__(self, receive, loop):
+        self._receive = receive
+        self._loop = loop
+        self._buffer = b''
+        self._more = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer and self._more:
+            message = asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+            if message['type'] == 'http.disconnect':
+                self._more = False
+                break
+            self._buffer = message.get('body', b'')
+            self._more = message.get('more_body', False)
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _environ(scope, body) -> dict:
+    """The WSGI environ of an ASGI HTTP scope."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        # The body ends where the client's does, with or without a Content-Length
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        key = name if name in ('CONTENT_TYPE', 'CONTENT_LENGTH') else f'HTTP_{name}'
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+async def _send_json(send, status: int, payload: dict, headers: list = ()):
+    body = json.dumps(payload).encode()
+    await send({'type': 'http.response.start', 'status': status, 'headers': [
+        (b'content-type', b'application/json'), (b'content-length', str(len(body)).encode()), *headers,
+    ]})
+    await send({'type': 'http.response.body', 'body': body, 'more_body': False})
@@ -0,0 +1,197 @@
+# backend/app/cache.py
+"""
+Result cache for the deterministic calculation routes.
+
+Every single-item route is a pure function of its JSON payload, so a response
+can be reused for any request that canonicalizes to the same key: keys are
+sorted, the unit system is normalized ('imperial' / 'SI', any casing, missing
+means SI), and the fields a route parses as numbers (its numeric fields, e.g.
+handlers.NUMERIC_INPUTS) become floats rounded to a configurable number of
+significant digits, whether they were sent as numbers or numeric strings.
+Every other field is kept verbatim: material keys, and values such as
+manualMassFlux whose meaning depends on their JSON type ("0" vs 0), never
+share a key with a different spelling. Keys also include a scope, such as
+the version of the material data, so switching databases never serves
+results computed from the previous one.
+
+Entries live in an in-process LRU with a time-to-live. An optional shared
+backend (any client with redis-py style `get(key)` / `set(key, value, ex=ttl)`)
+is consulted on a local miss, so several server processes can share results.
+The backend only ever speeds things up: if it fails (connection refused,
+timeout, ...) the error is counted in the stats and the request carries on
+with the local LRU alone.
+Each cached body carries a strong ETag so clients can revalidate with
+If-None-Match and get a 304 instead of the body.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from .utils.units import is_imperial
+
+
+def _canonical_number(value, precision: int):
+    # Only called for numeric fields; anything that does not parse is kept as sent
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(f'{value:.{precision}g}')
+    if isinstance(value, str):
+        try:
+            return float(f'{float(value):.{precision}g}')
+        except ValueError:
+            return value
+    return value
+
+
+def canonical_key(calculator: str, payload, precision: int, numeric=(), scope: str = '') -> str:
+    """
+    Returns the cache key for one request: a digest of the scope, the calculator
+    name and the canonicalized payload. Only the top-level fields named in
+    `numeric` are canonicalized as numbers.
+    """
+    if isinstance(payload, dict):
+        payload = {key: _canonical_number(value, precision) if key in numeric else value
+                   for key, value in payload.items()}
+        payload.pop('calculator', None)
+        payload['units'] = 'imperial' if is_imperial(payload.get('units', 'SI')) else 'SI'
+    canonical = json.dumps([scope, calculator, payload], sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class CachedResponse:
+    """A cached status code and JSON body with its ETag."""
+
+    __slots__ = ('status', 'body', 'etag')
+
+    def __init__(self, status: int, body: bytes, etag: str = None):
+        self.status = status
+        self.body = body
+        self.etag = etag or etag_for(body)
+
+    def encode(self) -> bytes:
+        return b'%d %s\n' % (self.status, self.etag.encode()) + self.body
+
+    @staticmethod
+    def decode(data: bytes) -> 'CachedResponse':
+        header, body = data.split(b'\n', 1)
+        status, etag = header.split(b' ', 1)
+        return CachedResponse(int(status), body, etag.decode())
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU + TTL cache of CachedResponses with hit/miss counters.
+
+    Args:
+        max_entries: Entries kept in process; 0 disables the cache
+        ttl: Seconds an entry stays valid
+        precision: Significant digits numbers are rounded to in the key
+        backend: Optional shared store, see the module docstring
+        numeric_fields: Calculator name -> payload fields it parses as numbers;
+            all other fields are part of the key exactly as sent
+        scope: Optional callable returning a string that is part of every key,
+            e.g. MaterialProperties.data_version
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 3600, precision: int = 12, backend=None,
+                 numeric_fields: dict = None, scope=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.precision = precision
+        self.backend = backend
+        self.numeric_fields = {name: frozenset(fields) for name, fields in (numeric_fields or {}).items()}
+        self.scope = scope
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.backend_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(self, calculator: str, payload) -> str:
+        return canonical_key(calculator, payload, self.precision, self.numeric_fields.get(calculator, ()),
+                             self.scope() if self.scope is not None else '')
+
+    def get(self, key: str):
+        """Returns the CachedResponse for `key`, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, response = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+
+        if self.backend is not None:
+            try:
+                data = self.backend.get(key)
+            except Exception:
+                self._backend_failed()
+                data = None
+            if data is not None:
+                response = CachedResponse.decode(data)
+                self._store(key, response, now)
+                with self._lock:
+                    self.backend_hits += 1
+                return response
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        self._store(key, response, time.monotonic())
+        if self.backend is not None:
+            try:
+                self.backend.set(key, response.encode(), ex=max(int(self.ttl), 1))
+            except Exception:
+                self._backend_failed()
+
+    def _backend_failed(self) -> None:
+        with self._lock:
+            self.backend_errors += 1
+
+    def _store(self, key: str, response: CachedResponse, now: float) -> None:
+        with self._lock:
+            self._entries[key] = (now + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.backend_hits + self.misses
+            return {
+                'hits': self.hits,
+                'backend_hits': self.backend_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.backend_hits) / lookups if lookups else None,
+                'evictions': self.evictions,
+                'backend_errors': self.backend_errors,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+            }
@@ -1,4 +1,7 @@
 from ..utils.unit_converter import UnitConverter
+from ..utils.batch import MaskedValidator, as_arrays
+
+import numpy as np
 
 class AreaVolumeCalculator:
     """
@@ -25,9 +28,22 @@ class AreaVolumeCalculator:
                 - wall_area (m² if SI, ft² if imperial)
                 - volume (m³ if SI, ft³ if imperial)
         """
-        # Input validation
-        if any(dim <= 0 for dim in [length, width, height]):
-            raise ValueError("All dimensions must be positive")
+        results = AreaVolumeCalculator.rectangular_compartment_batch(length, width, height)
+        
+        # No conversion needed - calculations work the same in both unit systems
+        return {key: result.scalar() for key, result in results.items()}
+
+    @staticmethod
+    def rectangular_compartment_batch(length, width, height) -> dict:
+        """
+        Vectorized rectangular compartment geometry.
+
+        Returns:
+            Dictionary of BatchResults keyed like rectangular_compartment's result.
+        """
+        length, width, height = as_arrays(length, width, height)
+        check = MaskedValidator(length.shape)
+        check.require((length > 0) & (width > 0) & (height > 0), "All dimensions must be positive")
             
         # Calculate areas and volume
         floor_area = length * width
@@ -35,12 +51,11 @@ class AreaVolumeCalculator:
         total_surface_area = 2 * floor_area + wall_area
         volume = length * width * height
         
-        # No conversion needed - calculations work the same in both unit systems
         return {
-            'total_surface_area': total_surface_area,
-            'floor_area': floor_area,
-            'wall_area': wall_area,
-            'volume': volume
+            'total_surface_area': check.result(total_surface_area),
+            'floor_area': check.result(floor_area),
+            'wall_area': check.result(wall_area),
+            'volume': check.result(volume)
         }
     
     @staticmethod
@@ -60,23 +75,32 @@ class AreaVolumeCalculator:
                 - wall_area (m² if SI, ft² if imperial)
                 - volume (m³ if SI, ft³ if imperial)
         """
-        import math
-        
-        # Input validation
-        if any(dim <= 0 for dim in [diameter, height]):
-            raise ValueError("All dimensions must be positive")
+        results = AreaVolumeCalculator.cylindrical_compartment_batch(diameter, height)
+        return {key: result.scalar() for key, result in results.items()}
+
+    @staticmethod
+    def cylindrical_compartment_batch(diameter, height) -> dict:
+        """
+        Vectorized cylindrical compartment geometry.
+
+        Returns:
+            Dictionary of BatchResults keyed like cylindrical_compartment's result.
+        """
+        diameter, height = as_arrays(diameter, height)
+        check = MaskedValidator(diameter.shape)
+        check.require((diameter > 0) & (height > 0), "All dimensions must be positive")
             
         radius = diameter / 2
         
         # Calculate areas and volume
-        floor_area = math.pi * radius**2
-        wall_area = math.pi * diameter * height
+        floor_area = np.pi * radius**2
+        wall_area = np.pi * diameter * height
         total_surface_area = 2 * floor_area + wall_area
         volume = floor_area * height
         
         return {
-            'total_surface_area': total_surface_area,
-            'floor_area': floor_area,
-            'wall_area': wall_area,
-            'volume': volume
-        }
\ No newline at end of file
+            'total_surface_area': check.result(total_surface_area),
+            'floor_area': check.result(floor_area),
+            'wall_area': check.result(wall_area),
+            'volume': check.result(volume)
+        }
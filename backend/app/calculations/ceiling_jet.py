@@ -1,11 +1,17 @@
-from ..utils.unit_converter import UnitConverter
-import math
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from ..utils.units import LENGTH, TEMPERATURE_RISE, VELOCITY, UnitSchema
+
+import numpy as np
 
 class CeilingJetCalculator:
     """
     Calculates ceiling jet temperature and velocity based on NUREG-1805 methodology.
     Used for determining thermal conditions beneath the ceiling during fires.
     """
+
+    # Q is always in kW; geometry follows the requested unit system
+    TEMPERATURE_RISE_UNITS = UnitSchema(inputs={'H': LENGTH, 'r': LENGTH}, outputs={'value': TEMPERATURE_RISE})
+    VELOCITY_UNITS = UnitSchema(inputs={'H': LENGTH, 'r': LENGTH}, outputs={'value': VELOCITY})
     
     @staticmethod
     def calculate_temperature_rise(Q: float, H: float, r: float, units: str = 'SI') -> float:
@@ -23,29 +29,34 @@ class CeilingJetCalculator:
             
         Formula based on Alpert's ceiling jet correlation
         """
-        if Q <= 0:
-            raise ValueError("Heat release rate must be positive")
-        if H <= 0:
-            raise ValueError("Ceiling height must be positive")
-        if r <= 0:
-            raise ValueError("Radial distance must be positive")
-            
-        if units.lower() == 'imperial':
-            H = UnitConverter.length_converter(H, 'ft', 'm')
-            r = UnitConverter.length_converter(r, 'ft', 'm')
-            
-        # Calculate temperature rise for r/H <= 0.18
-        if r/H <= 0.18:
-            delta_T = (16.9 * Q**(2/3)) / H**(5/3)
-        # Calculate temperature rise for r/H > 0.18
-        else:
-            delta_T = (5.38 * (Q/r)**(2/3)) / H
-            
-        if units.lower() == 'imperial':
-            # Convert temperature rise from °C to °F
-            delta_T = delta_T * 1.8
-            
-        return delta_T
+        return CeilingJetCalculator.TEMPERATURE_RISE_UNITS.evaluate(
+            CeilingJetCalculator.calculate_temperature_rise_batch, units, Q=Q, H=H, r=r
+        ).scalar()
+
+    @staticmethod
+    def validate_inputs_batch(check: MaskedValidator, Q: np.ndarray, H: np.ndarray, r: np.ndarray) -> None:
+        """
+        Flags rows of a batch with non-positive Q, H or r.
+        """
+        check.require(Q > 0, "Heat release rate must be positive")
+        check.require(H > 0, "Ceiling height must be positive")
+        check.require(r > 0, "Radial distance must be positive")
+
+    @staticmethod
+    def calculate_temperature_rise_batch(Q, H, r) -> BatchResult:
+        """
+        Vectorized Alpert ceiling jet temperature rise (°C) for SI arrays of Q (kW), H and r (m).
+        """
+        Q, H, r = as_arrays(Q, H, r)
+        check = MaskedValidator(Q.shape)
+        CeilingJetCalculator.validate_inputs_batch(check, Q, H, r)
+
+        ok = check.ok
+        Q, H, r = safe(ok, Q), safe(ok, H), safe(ok, r)
+
+        delta_T = CeilingJetCalculator.alpert_temperature_rise(Q, H, r)
+
+        return check.result(delta_T)
     
     @staticmethod
     def calculate_velocity(Q: float, H: float, r: float, units: str = 'SI') -> float:
@@ -61,25 +72,50 @@ class CeilingJetCalculator:
         Returns:
             Maximum ceiling jet velocity (m/s if SI, ft/s if imperial)
         """
-        if Q <= 0:
-            raise ValueError("Heat release rate must be positive")
-        if H <= 0:
-            raise ValueError("Ceiling height must be positive")
-        if r <= 0:
-            raise ValueError("Radial distance must be positive")
-            
-        if units.lower() == 'imperial':
-            H = UnitConverter.length_converter(H, 'ft', 'm')
-            r = UnitConverter.length_converter(r, 'ft', 'm')
-            
-        # Calculate velocity for r/H <= 0.15
-        if r/H <= 0.15:
-            velocity = 0.96 * (Q/H)**(1/3)
-        # Calculate velocity for r/H > 0.15
-        else:
-            velocity = 0.195 * Q**(1/3) * H**(1/2) / r**(5/6)
-            
-        if units.lower() == 'imperial':
-            velocity = velocity * 3.28084  # Convert m/s to ft/s
-            
-        return velocity
\ No newline at end of file
+        return CeilingJetCalculator.VELOCITY_UNITS.evaluate(
+            CeilingJetCalculator.calculate_velocity_batch, units, Q=Q, H=H, r=r
+        ).scalar()
+
+    @staticmethod
+    def calculate_velocity_batch(Q, H, r) -> BatchResult:
+        """
+        Vectorized Alpert maximum ceiling jet velocity (m/s) for SI arrays of Q (kW), H and r (m).
+        """
+        Q, H, r = as_arrays(Q, H, r)
+        check = MaskedValidator(Q.shape)
+        CeilingJetCalculator.validate_inputs_batch(check, Q, H, r)
+
+        ok = check.ok
+        Q, H, r = safe(ok, Q), safe(ok, H), safe(ok, r)
+
+        velocity = CeilingJetCalculator.alpert_velocity(Q, H, r)
+
+        return check.result(velocity)
+
+    @staticmethod
+    def alpert_temperature_rise(Q, H, r):
+        """
+        Alpert temperature rise (°C) for SI arrays of Q (kW, may be 0), H and r (m, positive).
+
+        This is an unvalidated array kernel shared with time-stepping models that
+        call it on every step; inputs are expected to be physical already.
+        """
+        # Plume impingement region for r/H <= 0.18, ceiling jet region beyond it
+        return np.where(
+            r / H <= 0.18,
+            (16.9 * Q**(2/3)) / H**(5/3),
+            (5.38 * (Q / r)**(2/3)) / H,
+        )
+
+    @staticmethod
+    def alpert_velocity(Q, H, r):
+        """
+        Alpert maximum ceiling jet velocity (m/s) for SI arrays of Q (kW, may be 0),
+        H and r (m, positive). Unvalidated, like alpert_temperature_rise.
+        """
+        # Plume impingement region for r/H <= 0.15, ceiling jet region beyond it
+        return np.where(
+            r / H <= 0.15,
+            0.96 * (Q / H)**(1/3),
+            0.195 * Q**(1/3) * H**(1/2) / r**(5/6),
+        )
@@ -0,0 +1,165 @@
+# backend/app/calculations/design_fire.py
+
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from .flashover import FlashoverCalculator
+from .t_squared import TSquaredCalculator
+
+class DesignFireCalculator:
+    """
+    Generates design fire curves (HRR against time) built on the t-squared model:
+    t-squared growth, a plateau at the peak HRR, and a linear fuel-limited decay.
+    The peak is capped at the ventilation-limited HRR when vent dimensions are given.
+    All calculations are performed in SI units (kW, s, MJ, m).
+
+    Curves for many scenarios are generated at once on a shared time grid and
+    returned as one C-contiguous (time × scenario) array, so a model stepping
+    through time reads each time step as a contiguous row.
+    """
+
+    # Decay starts once this fraction of the fuel load has burnt (Eurocode / CIBSE convention)
+    DECAY_FRACTION = 0.7
+    # Ventilation-controlled burning rate: Q = 1500 * A0 * √H0 (kW)
+    VENTILATION_COEFFICIENT = 1500.0
+
+    @staticmethod
+    def time_grid(duration: float, time_step: float) -> np.ndarray:
+        """
+        Returns evenly spaced times (s) from 0 to `duration` inclusive.
+        """
+        if duration < 0 or time_step <= 0:
+            raise ValueError("Duration must be non-negative and time step must be positive.")
+        return np.arange(int(round(duration / time_step)) + 1) * float(time_step)
+
+    @staticmethod
+    def ventilation_limit_batch(A0, H0) -> BatchResult:
+        """
+        Vectorized ventilation-limited HRR (kW) for arrays of vent area A0 (m²) and height H0 (m).
+        """
+        A0, H0 = as_arrays(A0, H0)
+        check = MaskedValidator(A0.shape)
+        check.require((A0 > 0) & (H0 > 0), "All dimensions must be positive")
+
+        H0 = safe(check.ok, H0)
+        return check.result(DesignFireCalculator.VENTILATION_COEFFICIENT * A0 * np.sqrt(H0))
+
+    @staticmethod
+    def design_fire_curve(alpha: float, peak_hrr: float, time, fuel_load: float = None,
+                          A0: float = None, H0: float = None) -> np.ndarray:
+        """
+        Calculates one design fire curve.
+
+        Args:
+            alpha: Fire growth coefficient (kW/s²)
+            peak_hrr: Fuel-controlled peak heat release rate (kW)
+            time: Times at which to evaluate the curve (s)
+            fuel_load: Total fuel load (MJ); None for no decay
+            A0, H0: Vent area (m²) and height (m); None for no ventilation limit
+
+        Returns:
+            HRR (kW) at each time.
+        """
+        hrr = DesignFireCalculator.design_fire_curve_batch(
+            alpha, peak_hrr, time,
+            fuel_load=np.inf if fuel_load is None else fuel_load,
+            A0=np.nan if A0 is None else A0,
+            H0=np.nan if H0 is None else H0,
+        )['hrr']
+        code = int(hrr.codes[0])
+        if code:
+            raise ValueError(hrr.messages[code - 1])
+        return hrr.values[:, 0]
+
+    @staticmethod
+    def design_fire_curve_batch(alpha, peak_hrr, time, fuel_load=np.inf, A0=np.nan, H0=np.nan,
+                                At=np.nan, wall_material='gypsum_board') -> dict:
+        """
+        Vectorized design fire curves for 1-D arrays of scenarios.
+
+        Per-scenario inputs (scalars or arrays, broadcast together):
+            alpha: Fire growth coefficient (kW/s²)
+            peak_hrr: Fuel-controlled peak HRR (kW)
+            fuel_load: Total fuel load (MJ); inf for no decay
+            A0, H0: Vent area (m²) and height (m); NaN for no ventilation limit
+            At, wall_material: Total surface area (m²) and lining, used with A0 and H0
+                for the MQH flashover threshold; At NaN skips the flashover check
+
+        `time` is the shared 1-D time grid (s), e.g. from time_grid().
+
+        Returns:
+            Dictionary containing:
+                - time: the time grid
+                - hrr: BatchResult whose values are the (time × scenario) HRR (kW);
+                  its codes are per scenario and failed scenarios are NaN columns
+                - peak_hrr: BatchResult of the HRR each scenario actually peaks at (kW)
+                - flashover_time: BatchResult of the time the MQH flashover threshold is
+                  reached (s), inf where it never is
+        """
+        time = np.asarray(time, dtype=float)
+        if time.ndim != 1 or (time.size and (time[0] < 0 or np.any(np.diff(time) < 0))):
+            raise ValueError("Time must be a non-negative, increasing 1-D array.")
+
+        alpha, peak_hrr, fuel_load, A0, H0, At = (
+            np.atleast_1d(v) for v in as_arrays(alpha, peak_hrr, fuel_load, A0, H0, At)
+        )
+        check = MaskedValidator(alpha.shape)
+        check.require(alpha > 0, "Alpha must be positive.")
+        check.require(peak_hrr > 0, "Peak HRR must be positive.")
+        check.require(fuel_load > 0, "Fuel load must be positive.")
+
+        # Ventilation limit, only for scenarios that describe a vent
+        vented = ~(np.isnan(A0) & np.isnan(H0))
+        vent_limit = DesignFireCalculator.ventilation_limit_batch(A0, H0)
+        check.absorb(vent_limit, where=vented)
+        ok = check.ok
+        Q_peak = np.where(vented, np.fmin(peak_hrr, vent_limit.values), peak_hrr)
+        alpha, Q_peak, fuel_load = safe(ok, alpha), safe(ok, Q_peak), safe(ok, fuel_load)
+
+        # Growth reaches the (capped) peak at t = sqrt(Q / α)
+        t_peak = TSquaredCalculator.calculate_time_batch(alpha, Q_peak).values
+
+        # Decay starts once DECAY_FRACTION of the fuel has burnt: during growth if the
+        # fuel runs short, otherwise part way along the plateau
+        energy = fuel_load * 1000  # kJ
+        decay_energy = DesignFireCalculator.DECAY_FRACTION * energy
+        growth_energy = alpha * t_peak**3 / 3
+        decays_in_growth = growth_energy >= decay_energy
+        t_decay = np.where(
+            decays_in_growth,
+            np.cbrt(3 * decay_energy / alpha),
+            t_peak + (decay_energy - growth_energy) / Q_peak,
+        )
+        Q_decay = np.where(decays_in_growth, alpha * t_decay**2, Q_peak)
+        # The remaining fuel burns out along a linear decay to zero
+        decays = np.isfinite(t_decay)
+        decay_duration = safe(decays, 2 * (1 - DesignFireCalculator.DECAY_FRACTION) * energy / Q_decay)
+        t_decay_start = safe(decays, t_decay, np.inf)
+
+        # (time × scenario) curve: Q = α t² capped at the peak, then the decay
+        t = time[:, None]
+        hrr = alpha * t**2
+        np.minimum(hrr, Q_peak, out=hrr)
+        decay = Q_decay * np.clip(1 - (t - safe(decays, t_decay, 0.0)) / decay_duration, 0, 1)
+        hrr = np.where(t < t_decay_start, hrr, decay)
+
+        # Flashover once the curve reaches the MQH threshold
+        checks_flashover = ~np.isnan(At) & ok
+        threshold = FlashoverCalculator.mccaffrey_correlation_batch(
+            np.where(checks_flashover, At, 1.0), A0, H0, wall_material
+        )
+        check.absorb(threshold, where=checks_flashover)
+        reached = checks_flashover & check.ok & (threshold.values <= Q_decay)
+        flashover_time = np.where(
+            reached,
+            TSquaredCalculator.calculate_time_batch(alpha, np.where(reached, threshold.values, 0.0)).values,
+            np.inf,
+        )
+        hrr[:, ~check.ok] = np.nan
+
+        return {
+            'time': time,
+            'hrr': BatchResult(np.ascontiguousarray(hrr), check.codes, tuple(check.messages)),
+            'peak_hrr': check.result(Q_decay),
+            'flashover_time': check.result(flashover_time),
+        }
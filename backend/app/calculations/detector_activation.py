@@ -0,0 +1,153 @@
+# backend/app/calculations/detector_activation.py
+
+import numpy as np
+
+from ..utils.batch import MaskedValidator, as_arrays, safe
+from ..utils.units import ALPHA, HEAT_RELEASE, LENGTH, RTI, TEMPERATURE, UnitSchema
+from .ceiling_jet import CeilingJetCalculator
+
+class DetectorActivationCalculator:
+    """
+    Activation of heat detectors and sprinklers under a growing t-squared fire.
+
+    The link temperature follows the RTI model
+
+        dT_d/dt = √u / RTI · (T_g - T_d) - C / RTI · (T_d - T_amb)
+
+    where the gas temperature T_g and velocity u are the quasi-steady Alpert
+    ceiling jet at the link (CeilingJetCalculator) for the current HRR
+    Q = α t², capped at the peak HRR. C is the conduction factor of the link.
+
+    Every detector position is solved against every fire at once: positions
+    (H, r, RTI, activation temperature) form one axis of the result and fires
+    (α, peak HRR) the other, and all cells advance together through one time loop.
+    Within a step the gas is taken at its midpoint state and the linear link
+    equation is integrated exactly, so the update stays stable for any step size.
+    """
+
+    # Q is computed from α; the conduction factor C is always SI, (m/s)^1/2
+    ACTIVATION_UNITS = UnitSchema(
+        inputs={
+            'H': LENGTH, 'r': LENGTH, 'rti': RTI, 'activation_temp': TEMPERATURE,
+            'alpha': ALPHA, 'peak_hrr': HEAT_RELEASE, 'ambient_temp': TEMPERATURE,
+        },
+        outputs={'hrr': HEAT_RELEASE},
+    )
+
+    @staticmethod
+    def activation_time(H: float, r: float, rti: float, activation_temp: float, alpha: float,
+                        peak_hrr: float = np.inf, ambient_temp: float = 20.0, conduction: float = 0.0,
+                        units: str = 'SI') -> dict:
+        """
+        Calculates when a detector or sprinkler activates.
+
+        Args:
+            H: Ceiling height above the fire (m if SI, ft if imperial)
+            r: Radial distance of the link from the fire axis (m if SI, ft if imperial)
+            rti: Response time index ((m·s)^1/2 if SI, (ft·s)^1/2 if imperial)
+            activation_temp: Rated activation temperature (°C if SI, °F if imperial)
+            alpha: Fire growth coefficient (kW/s² if SI, BTU/s³ if imperial)
+            peak_hrr: HRR at which growth stops (kW if SI, BTU/s if imperial)
+            ambient_temp: Ambient and initial link temperature (°C if SI, °F if imperial)
+            conduction: Conduction factor C ((m/s)^1/2)
+            units: 'SI' for metric or 'imperial' for US units
+
+        Returns:
+            Dictionary containing:
+                - activation_time: Time from ignition to activation (s)
+                - hrr: HRR at activation (kW if SI, BTU/s if imperial)
+        """
+        results = DetectorActivationCalculator.ACTIVATION_UNITS.evaluate(
+            DetectorActivationCalculator.activation_time_batch, units,
+            H=H, r=r, rti=rti, activation_temp=activation_temp, alpha=alpha, peak_hrr=peak_hrr,
+            ambient_temp=ambient_temp, conduction=conduction,
+        )
+        return {name: result.scalar() for name, result in results.items()}
+
+    @staticmethod
+    def activation_time_batch(H, r, rti, activation_temp, alpha, peak_hrr=np.inf, ambient_temp=20.0,
+                              conduction=0.0, dt: float = 1.0, t_max: float = 3600.0) -> dict:
+        """
+        Vectorized activation times for SI arrays.
+
+        Args:
+            H, r, rti, activation_temp, conduction: Detector positions and links;
+                broadcast together to the position shape P
+            alpha, peak_hrr: Fires; broadcast together to the fire shape F
+            ambient_temp: Ambient temperature (°C), broadcast to P + F
+            dt: Time step (s)
+            t_max: Simulated time (s); links still cold by then report an error
+
+        Returns:
+            Dictionary of BatchResults with shape P + F sharing the same validation:
+                - activation_time (s)
+                - hrr (kW)
+        """
+        H, r, rti, activation_temp, conduction = as_arrays(H, r, rti, activation_temp, conduction)
+        alpha, peak_hrr = as_arrays(alpha, peak_hrr)
+        if dt <= 0 or t_max <= 0:
+            raise ValueError("Time step and duration must be positive")
+
+        # Positions along the leading axes, fires along the trailing ones
+        positions, fires = H.shape, alpha.shape
+        expand = (Ellipsis,) + (np.newaxis,) * len(fires)
+        H, r, rti, activation_temp, conduction = (v[expand] for v in (H, r, rti, activation_temp, conduction))
+        shape = positions + fires
+        ambient_temp = np.broadcast_to(np.asarray(ambient_temp, dtype=float), shape)
+
+        check = MaskedValidator(shape)
+        check.require(np.broadcast_to(H > 0, shape), "Ceiling height must be positive")
+        check.require(np.broadcast_to(r > 0, shape), "Radial distance must be positive")
+        check.require(np.broadcast_to((rti > 0) & (conduction >= 0), shape),
+                      "Response time index must be positive and conduction factor non-negative")
+        check.require(np.broadcast_to((alpha > 0) & (peak_hrr > 0), shape),
+                      "Growth coefficient and peak HRR must be positive")
+        check.require(activation_temp > ambient_temp, "Activation temperature must exceed ambient temperature")
+
+        ok = check.ok
+        H, r, rti = safe(ok, np.broadcast_to(H, shape)), safe(ok, np.broadcast_to(r, shape)), \
+            safe(ok, np.broadcast_to(rti, shape))
+        conduction = np.broadcast_to(conduction, shape)
+        fire_alpha, fire_peak = np.broadcast_to(alpha, shape), np.broadcast_to(peak_hrr, shape)
+        # Links start at ambient; solve in terms of the rise above it
+        threshold = np.where(ok, activation_temp - ambient_temp, np.inf)
+
+        time_at = np.full(shape, np.nan)
+        # Only the cells still waiting to activate are stepped
+        active = np.flatnonzero(ok)
+        H, r, rti, conduction, alpha, peak_hrr, threshold = (
+            v.ravel()[active] for v in (H, r, rti, conduction, fire_alpha, fire_peak, threshold)
+        )
+        rise = np.zeros(active.size)
+        t = 0.0
+        while active.size and t < t_max:
+            step = min(dt, t_max - t)
+            middle = t + step / 2
+            Q = np.minimum(alpha * middle**2, peak_hrr)
+            gas = CeilingJetCalculator.alpert_temperature_rise(Q, H, r)
+            root_u = np.sqrt(CeilingJetCalculator.alpert_velocity(Q, H, r))
+
+            # Exact solution of the linear link equation with the gas held at its midpoint state
+            rate = (root_u + conduction) / rti
+            target = root_u * gas / (root_u + conduction)
+            new_rise = target + (rise - target) * np.exp(-rate * step)
+
+            fired = new_rise >= threshold
+            if fired.any():
+                fraction = (threshold[fired] - rise[fired]) / (new_rise[fired] - rise[fired])
+                time_at.ravel()[active[fired]] = t + fraction * step
+                keep = ~fired
+                active, rise = active[keep], new_rise[keep]
+                H, r, rti, conduction, alpha, peak_hrr, threshold = (
+                    v[keep] for v in (H, r, rti, conduction, alpha, peak_hrr, threshold)
+                )
+            else:
+                rise = new_rise
+            t += step
+
+        check.require(~np.isnan(time_at), f"Not activated within {t_max:g} s")
+        hrr = np.minimum(fire_alpha * np.nan_to_num(time_at)**2, fire_peak)
+        return {
+            'activation_time': check.result(time_at),
+            'hrr': check.result(hrr),
+        }
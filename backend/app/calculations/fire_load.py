@@ -1,4 +1,5 @@
 from ..utils.unit_converter import UnitConverter
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
 
 class FireLoadCalculator:
     """
@@ -19,15 +20,22 @@ class FireLoadCalculator:
         Returns:
             Fire load density (MJ/m² if SI, BTU/ft² if imperial)
         """
-        if total_energy <= 0:
-            raise ValueError("Total energy must be positive")
-        if floor_area <= 0:
-            raise ValueError("Floor area must be positive")
+        return FireLoadCalculator.calculate_fire_load_density_batch(total_energy, floor_area).scalar()
+
+    @staticmethod
+    def calculate_fire_load_density_batch(total_energy, floor_area) -> BatchResult:
+        """
+        Vectorized fire load density for arrays of total energy and floor area.
+        """
+        total_energy, floor_area = as_arrays(total_energy, floor_area)
+        check = MaskedValidator(total_energy.shape)
+        check.require(total_energy > 0, "Total energy must be positive")
+        check.require(floor_area > 0, "Floor area must be positive")
             
         # Calculate density
-        density = total_energy / floor_area
+        density = total_energy / safe(check.ok, floor_area)
         
-        return density
+        return check.result(density)
     
     @staticmethod
     def calculate_total_fire_load(masses: list, heats_of_combustion: list, units: str = 'SI') -> float:
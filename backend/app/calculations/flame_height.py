@@ -1,5 +1,9 @@
 # backend/app/calculations/flame_height.py
 
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+
 class FlameHeightCalculator:
     """
     Calculates flame height based on Heskestad's correlation.
@@ -20,13 +24,53 @@ class FlameHeightCalculator:
             
         Formula: L = 0.235 * Q^(2/5) - 1.02 * D
         """
-        if Q <= 0 or D <= 0:
-            raise ValueError("Heat Release Rate and Diameter must be positive.")
-            
+        return FlameHeightCalculator.calculate_flame_height_batch(Q, D).scalar()
+
+    @staticmethod
+    def calculate_flame_height_batch(Q, D) -> BatchResult:
+        """
+        Vectorized Heskestad flame height (m) for arrays of Q (kW) and D (m).
+        """
+        Q, D = as_arrays(Q, D)
+        check = MaskedValidator(Q.shape)
+        check.require((Q > 0) & (D > 0), "Heat Release Rate and Diameter must be positive.")
+
+        Q = safe(check.ok, Q)
         flame_height = 0.235 * (Q**0.4) - 1.02 * D
-        
-        # The result is negative or zero, it means no visible flame, return 0.
-        if flame_height < 0:
-            return 0
-            
-        return flame_height
\ No newline at end of file
+
+        # A negative or zero result means no visible flame, report 0.
+        flame_height = np.maximum(flame_height, 0.0)
+
+        return check.result(flame_height)
+
+    @staticmethod
+    def calculate_heat_release_batch(L, D) -> BatchResult:
+        """
+        Vectorized inverse of Heskestad's correlation: the HRR (kW) that gives
+        flame height L (m) for fire diameter D (m).
+
+        Formula: Q = ((L + 1.02 * D) / 0.235)^(5/2)
+        """
+        L, D = as_arrays(L, D)
+        check = MaskedValidator(L.shape)
+        check.require((L > 0) & (D > 0), "Flame Height and Diameter must be positive.")
+
+        numerator = safe(check.ok, L + (1.02 * D))
+        return check.result((numerator / 0.235)**2.5)
+
+    @staticmethod
+    def calculate_diameter_batch(Q, L) -> BatchResult:
+        """
+        Vectorized inverse of Heskestad's correlation: the fire diameter (m) that
+        gives flame height L (m) for heat release rate Q (kW).
+
+        Formula: D = (0.235 * Q^(2/5) - L) / 1.02
+        """
+        Q, L = as_arrays(Q, L)
+        check = MaskedValidator(Q.shape)
+        check.require((L > 0) & (Q > 0), "Flame Height and Heat Release Rate must be positive.")
+
+        numerator = (0.235 * (safe(check.ok, Q)**0.4)) - L
+        check.require(numerator > 0, "Flame height is too large for the given Heat Release Rate.")
+
+        return check.result(numerator / 1.02)
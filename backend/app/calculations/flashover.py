@@ -1,23 +1,38 @@
 from ..utils.unit_converter import UnitConverter
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
 from .material_properties import MaterialProperties
 
+import numpy as np
+
 class FlashoverCalculator:
     """
     Calculates minimum heat release rate required for flashover using NUREG-1805
     methodologies. All calculations are performed in SI units.
+
+    Each correlation has a `_batch` version that accepts NumPy arrays and returns a
+    BatchResult; the scalar methods are thin wrappers around them.
     """
-    
+
     @staticmethod
     def validate_compartment_inputs(At: float, A0: float, H0: float, units: str = 'SI') -> bool:
         """
         Validates compartment dimensions according to NUREG-1805.
         """
-        if any(val <= 0 for val in [At, A0, H0]):
-            raise ValueError("All dimensions must be positive")
-        if A0 > At:
-            raise ValueError("Vent area cannot exceed total surface area")
+        At, A0, H0 = as_arrays(At, A0, H0)
+        check = MaskedValidator(At.shape)
+        FlashoverCalculator.validate_compartment_inputs_batch(check, At, A0, H0)
+        check.result(0.0).scalar()
         return True
 
+    @staticmethod
+    def validate_compartment_inputs_batch(check: MaskedValidator, At: np.ndarray, A0: np.ndarray,
+                                          H0: np.ndarray) -> None:
+        """
+        Flags rows of a batch that fail the NUREG-1805 compartment checks.
+        """
+        check.require((At > 0) & (A0 > 0) & (H0 > 0), "All dimensions must be positive")
+        check.require(A0 <= At, "Vent area cannot exceed total surface area")
+
     @staticmethod
     def mccaffrey_correlation(At: float, A0: float, H0: float, wall_material: str = 'gypsum_board',
                              units: str = 'SI') -> float:
@@ -25,15 +40,29 @@ class FlashoverCalculator:
         Calculates minimum HRR for flashover using MQH method.
         Assumes all inputs (At, A0, H0) are in SI units (m², m).
         """
-        FlashoverCalculator.validate_compartment_inputs(At, A0, H0, units)
-        
+        return FlashoverCalculator.mccaffrey_correlation_batch(At, A0, H0, wall_material).scalar()
+
+    @staticmethod
+    def mccaffrey_correlation_batch(At, A0, H0, wall_material='gypsum_board') -> BatchResult:
+        """
+        Vectorized MQH flashover HRR (kW). `wall_material` may be a single key or
+        an array of keys, one per row.
+        """
+        At, A0, H0 = as_arrays(At, A0, H0)
+        check = MaskedValidator(At.shape)
+        FlashoverCalculator.validate_compartment_inputs_batch(check, At, A0, H0)
+
         # Get material thermal properties
-        hk = MaterialProperties.get_thermal_properties(wall_material)['conductivity']
-        
+        materials = np.broadcast_to(np.asarray(wall_material, dtype=str), At.shape)
+        hk = MaterialProperties.thermal_table().gather(materials, 'conductivity', check)
+
+        ok = check.ok
+        At, A0, H0, hk = (safe(ok, v) for v in (At, A0, H0, hk))
+
         # Calculate minimum HRR for flashover (result is in kW)
-        Q = 610 * (hk * At * A0 * (H0**0.5))**0.5
-        
-        return Q
+        Q = 610 * np.sqrt(hk * At * A0 * np.sqrt(H0))
+
+        return check.result(Q)
 
     @staticmethod
     def babrauskas_correlation(A0: float, H0: float, units: str = 'SI') -> float:
@@ -41,13 +70,23 @@ class FlashoverCalculator:
         Calculates minimum HRR for flashover using Babrauskas method.
         Assumes all inputs (A0, H0) are in SI units (m², m).
         """
-        if any(val <= 0 for val in [A0, H0]):
-            raise ValueError("All dimensions must be positive")
-            
+        return FlashoverCalculator.babrauskas_correlation_batch(A0, H0).scalar()
+
+    @staticmethod
+    def babrauskas_correlation_batch(A0, H0) -> BatchResult:
+        """
+        Vectorized Babrauskas flashover HRR (kW).
+        """
+        A0, H0 = as_arrays(A0, H0)
+        check = MaskedValidator(A0.shape)
+        check.require((A0 > 0) & (H0 > 0), "All dimensions must be positive")
+
+        H0 = safe(check.ok, H0)
+
         # Calculate minimum HRR for flashover (result is in kW)
-        Q = 750 * A0 * (H0**0.5)
-        
-        return Q
+        Q = 750 * A0 * np.sqrt(H0)
+
+        return check.result(Q)
 
     @staticmethod
     def thomas_correlation(At: float, A0: float, H0: float, units: str = 'SI') -> float:
@@ -55,9 +94,20 @@ class FlashoverCalculator:
         Calculates minimum HRR for flashover using Thomas method.
         Assumes all inputs (At, A0, H0) are in SI units (m², m).
         """
-        FlashoverCalculator.validate_compartment_inputs(At, A0, H0, units)
-            
+        return FlashoverCalculator.thomas_correlation_batch(At, A0, H0).scalar()
+
+    @staticmethod
+    def thomas_correlation_batch(At, A0, H0) -> BatchResult:
+        """
+        Vectorized Thomas flashover HRR (kW).
+        """
+        At, A0, H0 = as_arrays(At, A0, H0)
+        check = MaskedValidator(At.shape)
+        FlashoverCalculator.validate_compartment_inputs_batch(check, At, A0, H0)
+
+        H0 = safe(check.ok, H0)
+
         # Calculate minimum HRR for flashover (result is in kW)
-        Q = 7.8 * At + 378 * A0 * (H0**0.5)
-        
-        return Q
\ No newline at end of file
+        Q = 7.8 * At + 378 * A0 * np.sqrt(H0)
+
+        return check.result(Q)
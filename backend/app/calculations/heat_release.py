@@ -1,5 +1,8 @@
 # backend/app/calculations/heat_release.py
 
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays
 from .material_properties import MaterialProperties
 
 class HeatReleaseCalculator:
@@ -13,18 +16,36 @@ class HeatReleaseCalculator:
         """
         Calculates the Heat Release Rate (HRR) in kW.
         """
-        if burning_area < 0:
-            raise ValueError("Burning area cannot be negative.")
+        if manual_mass_flux is None:
+            manual_mass_flux = np.nan
+        return HeatReleaseCalculator.calculate_hrr_batch(material_key, burning_area, manual_mass_flux).scalar()
+
+    @staticmethod
+    def calculate_hrr_batch(material_key, burning_area, manual_mass_flux=np.nan) -> BatchResult:
+        """
+        Vectorized HRR (kW). `material_key` may be one key or an array of keys;
+        rows with a NaN `manual_mass_flux` fall back to the database value.
+        """
+        burning_area, manual_mass_flux = as_arrays(burning_area, manual_mass_flux)
+        check = MaskedValidator(burning_area.shape)
+        check.require(burning_area >= 0, "Burning area cannot be negative.")
 
-        # --- THIS IS THE CORRECTED LOGIC ---
         # Get the specific properties needed for this calculation
-        heat_of_combustion = MaterialProperties.get_heat_of_combustion(material_key, 'SI') # In MJ/kg
+        keys = np.broadcast_to(np.asarray(material_key, dtype=str), burning_area.shape)
+        has_manual = ~np.isnan(manual_mass_flux)
+        fuels = MaterialProperties.fuel_table()
+        indices = fuels.lookup(keys, check)
+        heat_of_combustion = fuels.take(
+            'heat_of_combustion', indices, check,
+            missing_message="Heat of combustion not available for material: {key}"
+        )  # In MJ/kg
 
         # Use the provided manual mass flux if it exists, otherwise get it from the database
-        if manual_mass_flux is not None:
-            mass_flux = manual_mass_flux # In g/m²-s
-        else:
-            mass_flux = MaterialProperties.get_mass_burning_flux(material_key, 'SI') # In g/m²-s
+        database_flux = fuels.take(
+            'mass_flux', indices, check,
+            missing_message="Mass flux not available for material: {key}", exempt=has_manual
+        )  # In g/m²-s
+        mass_flux = np.where(has_manual, manual_mass_flux, database_flux)
 
         # Convert mass flux from g/m²-s to kg/m²-s for the formula
         mass_loss_rate_per_area = mass_flux / 1000.0
@@ -33,4 +54,4 @@ class HeatReleaseCalculator:
         # Note: heat_of_combustion from our database is in MJ/kg, so we multiply by 1000 to get kJ/kg.
         heat_release_rate = mass_loss_rate_per_area * burning_area * (heat_of_combustion * 1000)
 
-        return heat_release_rate
\ No newline at end of file
+        return check.result(heat_release_rate)
@@ -0,0 +1,110 @@
+# backend/app/calculations/material_database.py
+"""
+On-disk columnar material database.
+
+A database is a directory with one sub-directory per table, 'fuels' (heat of
+combustion, mass flux) and 'linings' (thermal properties of wall linings):
+
+    <database>/fuels/meta.json            {"format": 1, "count": n, "fields": [...]}
+    <database>/fuels/keys.npy             material keys, fixed-width unicode
+    <database>/fuels/names.npy            display names
+    <database>/fuels/<field>.npy          float64, n + 1 values, the last NaN
+
+Every array is a plain .npy file opened with mmap_mode='r', so loading a table
+of thousands of entries reads only the small header and each process that
+opens the same files shares their pages through the OS page cache instead of
+parsing its own copy. Build a database from JSON with
+
+    python -m app.calculations.material_database source.json output_dir
+
+where source.json holds {"fuels": {key: {...}}, "linings": {key: {...}}} in the
+same shape as MaterialProperties.FUELS and THERMAL_PROPERTIES.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from .material_properties import MaterialProperties, MaterialTable
+
+FORMAT_VERSION = 1
+# Database sub-directory -> built-in dictionary it replaces
+TABLES = {
+    'fuels': MaterialProperties.FUELS,
+    'linings': MaterialProperties.THERMAL_PROPERTIES,
+}
+
+
+def write_table(directory: str, table) -> None:
+    """Writes a MaterialTable (or a material dictionary) to `directory`."""
+    if isinstance(table, dict):
+        table = MaterialTable.from_entries(table)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, 'keys.npy'), np.asarray(table.keys, dtype=str))
+    np.save(os.path.join(directory, 'names.npy'), np.asarray(table.names, dtype=str))
+    for field, column in table.columns.items():
+        np.save(os.path.join(directory, f'{field}.npy'), np.asarray(column, dtype=np.float64))
+    # The manifest goes last, so a half-written table is never picked up
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump({'format': FORMAT_VERSION, 'count': len(table), 'fields': list(table.columns)}, f)
+
+
+def read_table(directory: str, mmap: bool = True) -> MaterialTable:
+    """Opens a table written by write_table, memory-mapped unless `mmap` is False."""
+    with open(os.path.join(directory, 'meta.json')) as f:
+        meta = json.load(f)
+    if meta.get('format') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported material table format in {directory}: {meta.get('format')}")
+
+    mode = 'r' if mmap else None
+    count = meta['count']
+    keys = np.load(os.path.join(directory, 'keys.npy'), mmap_mode=mode)
+    names = np.load(os.path.join(directory, 'names.npy'), mmap_mode=mode)
+    columns = {field: np.load(os.path.join(directory, f'{field}.npy'), mmap_mode=mode)
+               for field in meta['fields']}
+    if len(keys) != count or len(names) != count or any(len(c) != count + 1 for c in columns.values()):
+        raise ValueError(f"Material table in {directory} does not match its manifest")
+    return MaterialTable(keys, names, columns)
+
+
+def write_database(path: str, fuels=None, linings=None) -> None:
+    """Writes the given tables (MaterialTables or dictionaries) as a database directory."""
+    for name, table in (('fuels', fuels), ('linings', linings)):
+        if table is not None:
+            write_table(os.path.join(path, name), table)
+
+
+def read_database(path: str, mmap: bool = True) -> dict:
+    """
+    Opens every table present in a database directory. Returns table name ->
+    MaterialTable; tables the database does not have are left out.
+    """
+    if not os.path.isdir(path):
+        raise ValueError(f"Material database not found: {path}")
+    return {
+        name: read_table(os.path.join(path, name), mmap)
+        for name in TABLES
+        if os.path.exists(os.path.join(path, name, 'meta.json'))
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build an on-disk material database from JSON.")
+    parser.add_argument('source', help="JSON file with 'fuels' and/or 'linings' dictionaries")
+    parser.add_argument('output', help="Database directory to write")
+    args = parser.parse_args(argv)
+
+    with open(args.source) as f:
+        source = json.load(f)
+    unknown = set(source) - set(TABLES)
+    if unknown:
+        parser.error(f"Unknown tables: {', '.join(sorted(unknown))}")
+    write_database(args.output, **source)
+    for name, table in read_database(args.output).items():
+        print(f"{name}: {len(table)} materials, fields {', '.join(table.columns)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
 # backend/app/calculations/material_properties.py
 
+import hashlib
 import math
+import os
+
+import numpy as np
 
 class MaterialProperties:
     """
@@ -74,30 +78,242 @@ class MaterialProperties:
         }
     }
 
+    # Optional on-disk database (see material_database) that replaces the dictionaries
+    # above; opened in each process on first use
+    DATABASE_PATH = os.environ.get('MATERIAL_DATABASE')
+    _database = None
+
+    @staticmethod
+    def use_database(path: str = None) -> None:
+        """
+        Serves materials from the database directory at `path`. Tables the database
+        does not have keep using the built-in dictionaries; None restores them all.
+        """
+        from .material_database import read_database
+        MaterialProperties._database = read_database(path) if path else {}
+        MaterialProperties.DATABASE_PATH = path
+
+    @staticmethod
+    def _table(name: str, entries: dict) -> 'MaterialTable':
+        if MaterialProperties._database is None:
+            MaterialProperties.use_database(MaterialProperties.DATABASE_PATH)
+        table = MaterialProperties._database.get(name)
+        return table if table is not None else MaterialTable.of(entries)
+
+    @staticmethod
+    def data_version() -> str:
+        """
+        Identifies the fuel and lining data currently served, by content, so results
+        derived from one database (e.g. cached responses) are never served for another.
+        """
+        return MaterialProperties.fuel_table().digest + MaterialProperties.thermal_table().digest
+
     # --- UPDATED Helper Methods to use the new FUELS dictionary ---
 
+    @staticmethod
+    def fuel_table() -> 'MaterialTable':
+        """Columnar fuel table (heat_of_combustion, mass_flux)."""
+        return MaterialProperties._table('fuels', MaterialProperties.FUELS)
+
+    @staticmethod
+    def thermal_table() -> 'MaterialTable':
+        """Columnar lining table (conductivity, density, specific_heat)."""
+        return MaterialProperties._table('linings', MaterialProperties.THERMAL_PROPERTIES)
+
     @staticmethod
     def get_heat_of_combustion(material_key: str, units: str = 'SI') -> float:
-        if material_key not in MaterialProperties.FUELS:
-            raise ValueError(f"Material '{material_key}' not found in database")
-        return MaterialProperties.FUELS[material_key]['heat_of_combustion']
+        return MaterialProperties.fuel_table().value(material_key, 'heat_of_combustion')
 
     @staticmethod
     def get_mass_burning_flux(material_key: str, units: str = 'SI') -> float:
-        if material_key not in MaterialProperties.FUELS:
-            raise ValueError(f"Material '{material_key}' not found in database")
-        
-        mass_flux = MaterialProperties.FUELS[material_key].get('mass_flux')
-        if mass_flux is None:
+        mass_flux = MaterialProperties.fuel_table().value(material_key, 'mass_flux')
+        if math.isnan(mass_flux):
             raise ValueError(f"Mass flux not available for material: {material_key}")
         return mass_flux
 
     @staticmethod
     def get_thermal_properties(material_key: str) -> dict:
-        if material_key not in MaterialProperties.THERMAL_PROPERTIES:
-            raise ValueError(f"Material '{material_key}' not found in database")
-        return MaterialProperties.THERMAL_PROPERTIES[material_key]
+        return MaterialProperties.thermal_table().row(material_key)
     
     @staticmethod
     def get_all_fuels() -> dict:
-        return MaterialProperties.FUELS
\ No newline at end of file
+        table = MaterialProperties.fuel_table()
+        return {str(key): table.row(key) for key in table.keys}
+
+
+class MaterialTable:
+    """
+    Read-only columnar copy of a material dictionary for batch lookups.
+
+    Every key gets an integer index; each numeric property is one float64 array
+    in index order, with NaN where an entry has no value (e.g. a fuel without a
+    mass_flux). The arrays carry one extra NaN slot at the end, so index -1
+    (an unknown key) gathers NaN, and a million rows are gathered with a single
+    fancy-indexing operation instead of a dict lookup per row.
+
+    The columns may be memory-mapped arrays (see material_database); the key
+    index and the sorted lookup arrays are only built on first use.
+
+    Tables are memoized per dictionary by `of`; call `MaterialTable.invalidate()`
+    after editing a dictionary in place.
+    """
+
+    _cache = {}
+
+    def __init__(self, keys, names, columns: dict):
+        """
+        Args:
+            keys, names: Material keys and display names, in index order
+            columns: Property name -> float array of len(keys) + 1 values, the last NaN
+        """
+        self.keys = keys
+        self.names = names
+        self.columns = columns
+        self._index = None
+        self._sorted = None
+        self._digest = None
+
+    @staticmethod
+    def from_entries(entries: dict) -> 'MaterialTable':
+        """Builds a table from a {key: {'name': ..., property: value}} dictionary."""
+        keys = tuple(entries)
+        fields = dict.fromkeys(field for entry in entries.values() for field in entry if field != 'name')
+        columns = {}
+        for field in fields:
+            column = np.array([_number(entries[key].get(field)) for key in keys] + [np.nan])
+            column.setflags(write=False)
+            columns[field] = column
+        return MaterialTable(keys, tuple(entries[key].get('name', key) for key in keys), columns)
+
+    @staticmethod
+    def of(entries: dict) -> 'MaterialTable':
+        """Returns the memoized table for a material dictionary."""
+        cached = MaterialTable._cache.get(id(entries))
+        if cached is None or cached[0] is not entries:
+            cached = (entries, MaterialTable.from_entries(entries))
+            MaterialTable._cache[id(entries)] = cached
+        return cached[1]
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drops every memoized table, e.g. after a material dictionary was edited."""
+        MaterialTable._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def index(self) -> dict:
+        """Material key -> table index."""
+        if self._index is None:
+            self._index = {str(key): i for i, key in enumerate(self.keys)}
+        return self._index
+
+    @property
+    def digest(self) -> str:
+        """Short content digest of the keys, names and columns, computed on first use."""
+        if self._digest is None:
+            h = hashlib.blake2b(digest_size=8)
+            for values in (self.keys, self.names):
+                h.update(np.asarray(values, dtype=str).tobytes())
+            for field in sorted(self.columns):
+                h.update(field.encode() + b'\0' + np.asarray(self.columns[field], dtype=np.float64).tobytes())
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def _sorted_lookup(self) -> tuple:
+        # Sorted keys and their table indices for vectorized lookup with searchsorted
+        if self._sorted is None:
+            keys = np.asarray(self.keys, dtype=str)
+            order = np.argsort(keys, kind='stable').astype(np.intp)
+            self._sorted = (keys[order], order)
+        return self._sorted
+
+    def _position(self, material_key: str) -> int:
+        position = self.index.get(material_key)
+        if position is None:
+            raise ValueError(f"Material '{material_key}' not found in database")
+        return position
+
+    def value(self, material_key: str, field: str) -> float:
+        """One property of one material (NaN if the material has no value)."""
+        return float(self.columns[field][self._position(material_key)])
+
+    def row(self, material_key: str) -> dict:
+        """All properties of one material as a dict, None for missing values."""
+        position = self._position(material_key)
+        row = {'name': str(self.names[position])}
+        for field, column in self.columns.items():
+            value = float(column[position])
+            row[field] = None if math.isnan(value) else value
+        return row
+
+    def lookup(self, keys, check=None) -> np.ndarray:
+        """
+        Maps an array of material keys to table indices, -1 for unknown keys.
+        Unknown keys are flagged on the MaskedValidator `check` if one is given.
+        """
+        keys = np.asarray(keys, dtype=str)
+        if keys.size and not any(keys.strides):
+            # A broadcast single key: look it up once
+            position = self.index.get(str(keys.flat[0]), -1)
+            indices = np.full(keys.shape, position, dtype=np.intp)
+        elif len(self):
+            sorted_keys, sorted_index = self._sorted_lookup()
+            found = np.searchsorted(sorted_keys, keys).clip(max=len(self) - 1)
+            indices = np.where(sorted_keys[found] == keys, sorted_index[found], -1)
+        else:
+            indices = np.full(keys.shape, -1, dtype=np.intp)
+
+        if check is not None:
+            unknown = indices < 0
+            if unknown.any():
+                # One message per distinct unknown key, assigned with the key's group label
+                missing, labels = np.unique(keys[unknown], return_inverse=True)
+                groups = np.zeros(keys.shape, dtype=np.intp)
+                groups[unknown] = labels.ravel()
+                check.require_each(~unknown, groups,
+                                   [f"Material '{key}' not found in database" for key in missing.tolist()])
+        return indices
+
+    def take(self, field: str, indices: np.ndarray, check=None, missing_message: str = None,
+             exempt=False) -> np.ndarray:
+        """
+        Gathers `field` for precomputed indices (NaN for -1). When `missing_message`
+        is given, rows of known materials without a value that are not `exempt` are
+        flagged on `check`; the message may use {key}.
+
+        A table without the `field` column has no value for any material: its rows
+        are flagged with `missing_message`, or with a message naming the column
+        when there is none. Without a `check` that raises ValueError.
+        """
+        column = self.columns.get(field)
+        if column is None:
+            message = f"Material database has no {field} values"
+            if check is None:
+                raise ValueError(message)
+            column = np.full(len(self) + 1, np.nan)
+            missing_message = missing_message or message
+        values = column[indices]
+        if missing_message is not None:
+            missing = (indices >= 0) & np.isnan(values) & ~np.asarray(exempt, dtype=bool)
+            if missing.any():
+                positions, labels = np.unique(indices[missing], return_inverse=True)
+                groups = np.zeros(np.shape(indices), dtype=np.intp)
+                groups[missing] = labels.ravel()
+                check.require_each(~missing, groups, [missing_message.format(key=str(self.keys[position]))
+                                                      for position in positions.tolist()])
+        return values
+
+    def gather(self, keys, field: str, check, missing_message: str = None, exempt=False) -> np.ndarray:
+        """
+        Looks up `field` for an array of material keys. Rows with unknown keys (or
+        a missing value, when `missing_message` is given and the row is not
+        `exempt`) are flagged on the MaskedValidator `check` with the getters'
+        error messages. Missing values come back as NaN.
+        """
+        return self.take(field, self.lookup(keys, check), check, missing_message, exempt)
+
+
+def _number(value) -> float:
+    return np.nan if value is None else float(value)
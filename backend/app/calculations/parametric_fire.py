@@ -0,0 +1,158 @@
+# backend/app/calculations/parametric_fire.py
+
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from .material_properties import MaterialProperties
+
+class ParametricFireCalculator:
+    """
+    Fully developed (post-flashover) compartment fire temperatures from the
+    Eurocode parametric temperature-time curves (EN 1991-1-2, Annex A).
+
+    A compartment is described by its opening factor O = Av √heq / At, the
+    thermal inertia b = √(k ρ c) of its linings and its fire load density.
+    Heating follows
+
+        Θg = 20 + 1325 (1 - 0.324 e^(-0.2 t*) - 0.204 e^(-1.7 t*) - 0.472 e^(-19 t*))
+
+    in the expanded time t* = Γ t (hours), Γ = (O / b)² / (0.04 / 1160)², up to
+    t_max, after which the gas cools linearly in t* down to 20 °C. Fires that
+    burn out before t_lim (set by the fire growth rate) are fuel controlled.
+
+    Every compartment is evaluated at every time at once, as one
+    (compartment × time) array. All inputs are SI (m², m, MJ/m², s).
+    """
+
+    # Fire growth rate -> t_lim (s)
+    GROWTH_LIMITS = {'slow': 25 * 60.0, 'medium': 20 * 60.0, 'fast': 15 * 60.0}
+
+    @staticmethod
+    def temperature_curve(Av: float, heq: float, At: float, Af: float, fire_load_density: float,
+                          wall_material: str = 'gypsum_board', growth: str = 'medium', times=None) -> dict:
+        """
+        Calculates the parametric temperature-time curve of one compartment.
+
+        Args:
+            Av: Total area of vertical openings (m²)
+            heq: Area-weighted average height of the openings (m)
+            At: Total area of the enclosure, openings included (m²)
+            Af: Floor area (m²)
+            fire_load_density: Design fire load density per floor area (MJ/m²),
+                e.g. from FireLoadCalculator
+            wall_material: Lining material key in MaterialProperties.THERMAL_PROPERTIES
+            growth: Fire growth rate, 'slow', 'medium' or 'fast'
+            times: Times to evaluate (s); every minute for four hours by default
+
+        Returns:
+            Dictionary containing:
+                - time: The times (s)
+                - temperature: List of gas temperatures (°C)
+                - peak_temperature: Maximum gas temperature (°C)
+                - peak_time: Time of the maximum (s)
+        """
+        results = ParametricFireCalculator.temperature_curve_batch(
+            Av, heq, At, Af, fire_load_density, wall_material, growth, times,
+        )
+        peak = results['peak_temperature'].scalar()
+        return {
+            'time': results['time'].tolist(),
+            'temperature': results['temperature'].values.tolist(),
+            'peak_temperature': peak,
+            'peak_time': results['peak_time'].scalar(),
+        }
+
+    @staticmethod
+    def temperature_curve_batch(Av, heq, At, Af, fire_load_density, wall_material='gypsum_board',
+                                growth='medium', times=None) -> dict:
+        """
+        Vectorized parametric curves. The compartment inputs (wall_material and
+        growth may be single keys or arrays of keys) broadcast to the compartment
+        shape C; `times` is a 1-D array of times in seconds.
+
+        Returns:
+            Dictionary containing:
+                - time: The times (s), shape (T,)
+                - temperature: BatchResult of gas temperatures (°C), shape C + (T,)
+                - peak_temperature, peak_time: BatchResults of shape C (°C, s)
+                - opening_factor, thermal_inertia: BatchResults of shape C
+                  (m^1/2, J/m²·s^1/2·K)
+            All BatchResults share the compartment validation.
+        """
+        Av, heq, At, Af, fire_load_density = as_arrays(Av, heq, At, Af, fire_load_density)
+        shape = Av.shape
+        times = np.arange(0.0, 4 * 3600.0 + 1, 60.0) if times is None else np.asarray(times, dtype=float)
+        if times.ndim != 1:
+            raise ValueError("Times must be a 1-D array")
+
+        check = MaskedValidator(shape)
+        check.require((Av > 0) & (heq > 0) & (At > 0) & (Af > 0) & (fire_load_density > 0),
+                      "All input values must be positive")
+        check.require((Av < At) & (Af < At), "Opening and floor areas must be less than the enclosure area")
+        check.require(Af <= 500, "Parametric curves are limited to floor areas up to 500 m²")
+
+        # Lining thermal inertia, with the specific heat converted from kJ to J
+        linings = MaterialProperties.thermal_table()
+        indices = linings.lookup(np.broadcast_to(np.asarray(wall_material, dtype=str), shape), check)
+        b = np.sqrt(linings.take('conductivity', indices) * linings.take('density', indices)
+                    * linings.take('specific_heat', indices) * 1000)
+        growth = np.broadcast_to(np.asarray(growth, dtype=str), shape)
+        t_lim = np.select([growth == name for name in ParametricFireCalculator.GROWTH_LIMITS],
+                          list(ParametricFireCalculator.GROWTH_LIMITS.values()), np.nan) / 3600
+        check.require(~np.isnan(t_lim), "Fire growth rate must be 'slow', 'medium' or 'fast'")
+
+        ok = check.ok
+        Av, heq, At, Af, fire_load_density = (safe(ok, v) for v in (Av, heq, At, Af, fire_load_density))
+        O = Av * np.sqrt(heq) / At
+        check.require((O >= 0.02) & (O <= 0.2), "Opening factor must be between 0.02 and 0.20 m^1/2")
+        check.require((b >= 100) & (b <= 2200), "Lining thermal inertia must be between 100 and 2200 J/m²s^1/2K")
+        # Fire load density per total enclosure area
+        q_t = fire_load_density * Af / At
+        check.require((q_t >= 50) & (q_t <= 1000),
+                      "Fire load density per enclosure area must be between 50 and 1000 MJ/m²")
+
+        ok = check.ok
+        O, b, q_t, t_lim = safe(ok, O, 0.04), safe(ok, b, 1160.0), safe(ok, q_t, 100.0), safe(ok, t_lim, 1 / 3)
+        gamma = (O / b)**2 / (0.04 / 1160)**2
+
+        # Ventilation controlled fires heat with Γ up to t_max; fuel controlled
+        # ones with Γ_lim up to t_lim
+        t_burnout = 0.2e-3 * q_t / O
+        fuel_controlled = t_burnout < t_lim
+        O_lim = 0.1e-3 * q_t / t_lim
+        k = np.where((O > 0.04) & (q_t < 75) & (b < 1160),
+                     1 + (O - 0.04) / 0.04 * (q_t - 75) / 75 * (1160 - b) / 1160, 1.0)
+        gamma_heat = np.where(fuel_controlled, k * (O_lim / b)**2 / (0.04 / 1160)**2, gamma)
+        t_max = np.maximum(t_burnout, t_lim)
+
+        def heating(t_star):
+            return 20 + 1325 * (1 - 0.324 * np.exp(-0.2 * t_star) - 0.204 * np.exp(-1.7 * t_star)
+                                - 0.472 * np.exp(-19 * t_star))
+
+        peak = heating(gamma_heat * t_max)
+        # Cooling runs in the ventilation controlled time scale, from t*_max x
+        t_star_max = t_burnout * gamma
+        x = np.where(fuel_controlled, t_lim * gamma / t_star_max, 1.0)
+        rate = np.where(t_star_max <= 0.5, 625.0, np.where(t_star_max < 2, 250 * (3 - t_star_max), 250.0))
+
+        hours = times / 3600
+        column = (Ellipsis, np.newaxis)
+        heating_phase = hours <= t_max[column]
+        with np.errstate(over='ignore'):
+            temperature = np.where(
+                heating_phase,
+                heating(gamma_heat[column] * hours),
+                np.maximum(peak[column] - rate[column] * (gamma[column] * hours - (t_star_max * x)[column]), 20.0),
+            )
+
+        # Each compartment's curve shares its validation
+        codes = np.broadcast_to(check.codes[column], temperature.shape).copy()
+        temperature[codes != 0] = np.nan
+        return {
+            'time': times,
+            'temperature': BatchResult(temperature, codes, tuple(check.messages)),
+            'peak_temperature': check.result(peak),
+            'peak_time': check.result(t_max * 3600),
+            'opening_factor': check.result(O),
+            'thermal_inertia': check.result(b),
+        }
@@ -1,9 +1,12 @@
 # backend/app/calculations/radiation.py
 from ..utils.unit_converter import UnitConverter
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
 from .material_properties import MaterialProperties
 from .heat_release import HeatReleaseCalculator
 import math
 
+import numpy as np
+
 
 class RadiationCalculator:
     """
@@ -16,15 +19,22 @@ class RadiationCalculator:
         """
         Validates inputs for the radiation calculation.
         """
-        if any(val < 0 for val in [Q, R, Xr]):
-            raise ValueError("Inputs cannot be negative.")
-        if not 0 <= Xr <= 1:
-            raise ValueError("Radiative fraction (Xr) must be between 0 and 1.")
-        if R == 0:
-            # Technically infinite, but we handle it as an error for practical purposes
-            raise ValueError("Distance (R) cannot be zero.")
+        Q, R, Xr = as_arrays(Q, R, Xr)
+        check = MaskedValidator(Q.shape)
+        RadiationCalculator.validate_inputs_batch(check, Q, R, Xr)
+        check.result(0.0).scalar()
         return True
 
+    @staticmethod
+    def validate_inputs_batch(check: MaskedValidator, Q: np.ndarray, R: np.ndarray, Xr: np.ndarray) -> None:
+        """
+        Flags rows of a batch that fail the radiation input checks.
+        """
+        check.require((Q >= 0) & (R >= 0) & (Xr >= 0), "Inputs cannot be negative.")
+        check.require((Xr >= 0) & (Xr <= 1), "Radiative fraction (Xr) must be between 0 and 1.")
+        # Technically infinite, but we handle it as an error for practical purposes
+        check.require(R != 0, "Distance (R) cannot be zero.")
+
     @staticmethod
     def calculate_heat_flux(Q: float, R: float, Xr: float) -> float:
         """
@@ -40,8 +50,28 @@ class RadiationCalculator:
             
         Formula: q" = (Q * Xr) / (4 * pi * R^2)
         """
-        RadiationCalculator.validate_inputs(Q, R, Xr)
-        
-        heat_flux = (Q * Xr) / (4 * math.pi * (R**2))
-        
-        return heat_flux
\ No newline at end of file
+        return RadiationCalculator.calculate_heat_flux_batch(Q, R, Xr).scalar()
+
+    @staticmethod
+    def calculate_heat_flux_batch(Q, R, Xr) -> BatchResult:
+        """
+        Vectorized point source heat flux (kW/m²) for arrays of Q, R and Xr.
+        """
+        Q, R, Xr = as_arrays(Q, R, Xr)
+        check = MaskedValidator(Q.shape)
+        RadiationCalculator.validate_inputs_batch(check, Q, R, Xr)
+
+        R = safe(check.ok, R)
+        heat_flux = RadiationCalculator.point_source_flux(Q, R, Xr)
+
+        return check.result(heat_flux)
+
+    @staticmethod
+    def point_source_flux(Q, R, Xr):
+        """
+        Point source heat flux q" = Q Xr / (4 π R²) in kW/m² for SI arrays.
+
+        This is an unvalidated array kernel for field evaluations over many
+        receivers; inputs are expected to be physical already.
+        """
+        return (Q * Xr) / (4 * math.pi * (R**2))
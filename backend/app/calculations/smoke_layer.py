@@ -1,12 +1,24 @@
-from ..utils.unit_converter import UnitConverter
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from ..utils.units import AREA, LENGTH, TEMPERATURE, UnitSchema
 
 import math
 
+import numpy as np
+
 class SmokeLayerCalculator:
     """
     Calculates smoke layer height and filling time in compartments
     based on NUREG-1805 methodologies.
     """
+
+    # Q is always in kW; the filling time is always in seconds
+    FILLING_TIME_UNITS = UnitSchema(
+        inputs={'room_height': LENGTH, 'floor_area': AREA, 'target_height': LENGTH}
+    )
+    LAYER_TEMPERATURE_UNITS = UnitSchema(
+        inputs={'room_height': LENGTH, 'layer_height': LENGTH, 'ambient_temp': TEMPERATURE},
+        outputs={'value': TEMPERATURE},
+    )
     
     @staticmethod
     def calculate_filling_time(Q: float, room_height: float, floor_area: float, 
@@ -25,21 +37,28 @@ class SmokeLayerCalculator:
         Returns:
             Time to reach target height (seconds)
         """
-        if Q <= 0:
-            raise ValueError("Heat release rate must be positive")
-        if any(val <= 0 for val in [room_height, floor_area, target_height]):
-            raise ValueError("All dimensions must be positive")
-        if target_height >= room_height:
-            raise ValueError("Target height must be less than room height")
-            
-        if units.lower() == 'imperial':
-            # Convert dimensions to SI
-            room_height = UnitConverter.length_converter(room_height, 'ft', 'm')
-            floor_area = UnitConverter.length_converter(floor_area, 'ft', 'm')**2
-            target_height = UnitConverter.length_converter(target_height, 'ft', 'm')
+        return SmokeLayerCalculator.FILLING_TIME_UNITS.evaluate(
+            SmokeLayerCalculator.calculate_filling_time_batch, units,
+            Q=Q, room_height=room_height, floor_area=floor_area, target_height=target_height,
+        ).scalar()
+
+    @staticmethod
+    def calculate_filling_time_batch(Q, room_height, floor_area, target_height) -> BatchResult:
+        """
+        Vectorized smoke filling time (s) for SI arrays of Q (kW), room height (m),
+        floor area (m²) and target layer height (m).
+        """
+        Q, room_height, floor_area, target_height = as_arrays(Q, room_height, floor_area, target_height)
+        check = MaskedValidator(Q.shape)
+        check.require(Q > 0, "Heat release rate must be positive")
+        check.require((room_height > 0) & (floor_area > 0) & (target_height > 0),
+                      "All dimensions must be positive")
+        check.require(target_height < room_height, "Target height must be less than room height")
+
+        ok = check.ok
+        Q, room_height, target_height = safe(ok, Q), safe(ok, room_height, 2.0), safe(ok, target_height)
             
         # Constants
-        g = 9.81  # gravitational acceleration (m/s²)
         rho_amb = 1.2  # ambient air density (kg/m³)
         cp = 1.0  # specific heat of air (kJ/kg·K)
         T_amb = 293  # ambient temperature (K)
@@ -53,7 +72,7 @@ class SmokeLayerCalculator:
             (room_height**(4/3) - (room_height - z)**(4/3)) / room_height**(1/3)
         )
         
-        return time
+        return check.result(time)
     
     @staticmethod
     def calculate_layer_temperature(Q: float, room_height: float, layer_height: float,
@@ -71,23 +90,34 @@ class SmokeLayerCalculator:
         Returns:
             Smoke layer temperature (°C if SI, °F if imperial)
         """
-        if units.lower() == 'imperial':
-            room_height = UnitConverter.length_converter(room_height, 'ft', 'm')
-            layer_height = UnitConverter.length_converter(layer_height, 'ft', 'm')
-            ambient_temp = UnitConverter.temperature_converter(ambient_temp, 'F', 'C')
-            
+        return SmokeLayerCalculator.LAYER_TEMPERATURE_UNITS.evaluate(
+            SmokeLayerCalculator.calculate_layer_temperature_batch, units,
+            Q=Q, room_height=room_height, layer_height=layer_height, ambient_temp=ambient_temp,
+        ).scalar()
+
+    @staticmethod
+    def calculate_layer_temperature_batch(Q, room_height, layer_height, ambient_temp=20) -> BatchResult:
+        """
+        Vectorized smoke layer temperature (°C) for SI arrays of Q (kW), room height (m),
+        layer height (m) and ambient temperature (°C).
+
+        Rows with a non-positive height or a layer above the ceiling are reported as
+        errors rather than producing a complex or infinite temperature.
+        """
+        Q, room_height, layer_height, ambient_temp = as_arrays(Q, room_height, layer_height, ambient_temp)
+        check = MaskedValidator(Q.shape)
+        check.require((room_height > 0) & (layer_height > 0), "All dimensions must be positive")
+        check.require(layer_height <= room_height, "Layer height cannot exceed room height")
+
+        ok = check.ok
+        room_height, layer_height = safe(ok, room_height), safe(ok, layer_height)
+
         # Constants
-        g = 9.81  # gravitational acceleration (m/s²)
         cp = 1.0  # specific heat of air (kJ/kg·K)
         
         # Calculate temperature rise
-        delta_T = (Q / (cp * math.pi)) * (
+        delta_T = (Q / (cp * math.pi)) * np.cbrt(
             (room_height - layer_height) / (room_height * layer_height**2)
-        )**(1/3)
-        
-        temp = ambient_temp + delta_T
+        )
         
-        if units.lower() == 'imperial':
-            temp = UnitConverter.temperature_converter(temp, 'C', 'F')
-            
-        return temp
\ No newline at end of file
+        return check.result(ambient_temp + delta_T)
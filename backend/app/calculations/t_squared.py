@@ -1,6 +1,8 @@
 # backend/app/calculations/t_squared.py
 
-import math
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
 
 class TSquaredCalculator:
     """
@@ -21,9 +23,17 @@ class TSquaredCalculator:
         Calculates heat release rate (Q) from alpha and time.
         Formula: Q = α * t²
         """
-        if alpha < 0 or time < 0:
-            raise ValueError("Alpha and time must be non-negative.")
-        return alpha * (time**2)
+        return TSquaredCalculator.calculate_hrr_batch(alpha, time).scalar()
+
+    @staticmethod
+    def calculate_hrr_batch(alpha, time) -> BatchResult:
+        """
+        Vectorized Q = α * t² for arrays of alpha (kW/s²) and time (s).
+        """
+        alpha, time = as_arrays(alpha, time)
+        check = MaskedValidator(alpha.shape)
+        check.require((alpha >= 0) & (time >= 0), "Alpha and time must be non-negative.")
+        return check.result(alpha * (time**2))
 
     @staticmethod
     def calculate_time(alpha: float, hrr: float) -> float:
@@ -31,6 +41,16 @@ class TSquaredCalculator:
         Calculates time (t) to reach a given heat release rate.
         Formula: t = sqrt(Q / α)
         """
-        if alpha <= 0 or hrr < 0:
-            raise ValueError("Alpha must be positive and HRR must be non-negative.")
-        return math.sqrt(hrr / alpha)
\ No newline at end of file
+        return TSquaredCalculator.calculate_time_batch(alpha, hrr).scalar()
+
+    @staticmethod
+    def calculate_time_batch(alpha, hrr) -> BatchResult:
+        """
+        Vectorized t = sqrt(Q / α) for arrays of alpha (kW/s²) and HRR (kW).
+        """
+        alpha, hrr = as_arrays(alpha, hrr)
+        check = MaskedValidator(alpha.shape)
+        check.require((alpha > 0) & (hrr >= 0), "Alpha must be positive and HRR must be non-negative.")
+
+        ok = check.ok
+        return check.result(np.sqrt(safe(ok, hrr) / safe(ok, alpha)))
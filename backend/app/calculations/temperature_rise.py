@@ -1,5 +1,7 @@
-from ..utils.unit_converter import UnitConverter
-import math
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from ..utils.units import AREA, LENGTH, TEMPERATURE, TEMPERATURE_RISE, UnitSchema
+
+import numpy as np
 
 class TemperatureRiseCalculator:
     """
@@ -7,6 +9,16 @@ class TemperatureRiseCalculator:
     Uses McCaffrey, Quintiere and Harkleroad (MQH) correlation for
     temperature rise in naturally ventilated compartments.
     """
+
+    # Q (kW) and hk (kW/m²/K) are always SI
+    MQH_TEMPERATURE_UNITS = UnitSchema(
+        inputs={'A0': AREA, 'H0': LENGTH, 'AT': AREA},
+        outputs={'value': TEMPERATURE_RISE},
+    )
+    # The time is always in seconds
+    TIME_TO_TEMPERATURE_UNITS = UnitSchema(
+        inputs={'A0': AREA, 'H0': LENGTH, 'AT': AREA, 'target_temp': TEMPERATURE, 'ambient_temp': TEMPERATURE}
+    )
     
     @staticmethod
     def calculate_mqh_temperature(Q: float, A0: float, H0: float, AT: float, 
@@ -27,23 +39,28 @@ class TemperatureRiseCalculator:
             
         Formula: ΔT = 6.85(Q²/(A0*√H0*AT*hk))^(1/3)
         """
-        if any(val <= 0 for val in [Q, A0, H0, AT, hk]):
-            raise ValueError("All input values must be positive")
-            
-        if units.lower() == 'imperial':
-            # Convert areas and heights to SI
-            A0 = UnitConverter.length_converter(A0, 'ft', 'm')**2
-            H0 = UnitConverter.length_converter(H0, 'ft', 'm')
-            AT = UnitConverter.length_converter(AT, 'ft', 'm')**2
-            
+        return TemperatureRiseCalculator.MQH_TEMPERATURE_UNITS.evaluate(
+            TemperatureRiseCalculator.calculate_mqh_temperature_batch, units,
+            Q=Q, A0=A0, H0=H0, AT=AT, hk=hk,
+        ).scalar()
+
+    @staticmethod
+    def calculate_mqh_temperature_batch(Q, A0, H0, AT, hk) -> BatchResult:
+        """
+        Vectorized MQH temperature rise (°C) for SI arrays of Q, A0, H0, AT and hk.
+        """
+        Q, A0, H0, AT, hk = as_arrays(Q, A0, H0, AT, hk)
+        check = MaskedValidator(Q.shape)
+        check.require((Q > 0) & (A0 > 0) & (H0 > 0) & (AT > 0) & (hk > 0),
+                      "All input values must be positive")
+
+        ok = check.ok
+        A0, H0, AT, hk = (safe(ok, v) for v in (A0, H0, AT, hk))
+
         # Calculate temperature rise
-        delta_T = 6.85 * (Q**2 / (A0 * math.sqrt(H0) * AT * hk))**(1/3)
-        
-        if units.lower() == 'imperial':
-            # Convert temperature rise to Fahrenheit
-            delta_T = delta_T * 1.8
-            
-        return delta_T
+        delta_T = 6.85 * np.cbrt(Q**2 / (A0 * np.sqrt(H0) * AT * hk))
+
+        return check.result(delta_T)
     
     @staticmethod
     def calculate_time_to_temperature(Q: float, A0: float, H0: float, AT: float, 
@@ -66,20 +83,34 @@ class TemperatureRiseCalculator:
         Returns:
             Time to reach target temperature (seconds)
         """
-        if units.lower() == 'imperial':
-            # Convert temperatures to Celsius
-            target_temp = UnitConverter.temperature_converter(target_temp, 'F', 'C')
-            ambient_temp = UnitConverter.temperature_converter(ambient_temp, 'F', 'C')
-            
+        return TemperatureRiseCalculator.TIME_TO_TEMPERATURE_UNITS.evaluate(
+            TemperatureRiseCalculator.calculate_time_to_temperature_batch, units,
+            Q=Q, A0=A0, H0=H0, AT=AT, hk=hk, target_temp=target_temp, ambient_temp=ambient_temp,
+        ).scalar()
+
+    @staticmethod
+    def calculate_time_to_temperature_batch(Q, A0, H0, AT, hk, target_temp, ambient_temp=20) -> BatchResult:
+        """
+        Vectorized time (s) to reach a target temperature (°C) for SI arrays.
+        """
+        Q, A0, H0, AT, hk, target_temp, ambient_temp = as_arrays(
+            Q, A0, H0, AT, hk, target_temp, ambient_temp
+        )
+        steady_state = TemperatureRiseCalculator.calculate_mqh_temperature_batch(Q, A0, H0, AT, hk)
+
+        check = MaskedValidator(Q.shape)
+        check.absorb(steady_state)
+
         delta_T = target_temp - ambient_temp
-        steady_state_delta_T = TemperatureRiseCalculator.calculate_mqh_temperature(
-            Q, A0, H0, AT, hk, 'SI'
+        steady_state_delta_T = steady_state.values
+        check.require(~(delta_T > steady_state_delta_T), "Target temperature exceeds steady-state temperature")
+
+        ok = check.ok
+        Q, A0, H0, AT, hk, steady_state_delta_T = (
+            safe(ok, v) for v in (Q, A0, H0, AT, hk, steady_state_delta_T)
         )
-        
-        if delta_T > steady_state_delta_T:
-            raise ValueError("Target temperature exceeds steady-state temperature")
-            
+
         # Estimate time using thermal penetration time relationship
-        time = (delta_T / steady_state_delta_T)**3 * (AT * hk)**2 / (Q * A0 * math.sqrt(H0))
-        
-        return time
\ No newline at end of file
+        time = (delta_T / steady_state_delta_T)**3 * (AT * hk)**2 / (Q * A0 * np.sqrt(H0))
+
+        return check.result(time)
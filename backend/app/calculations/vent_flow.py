@@ -1,11 +1,23 @@
-from ..utils.unit_converter import UnitConverter
 import math
 
+import numpy as np
+
+from ..utils.batch import MaskedValidator, as_arrays, safe
+from ..utils.units import LENGTH, MASS_FLOW, TEMPERATURE, UnitSchema
+
 class VentFlowCalculator:
     """
     Calculates mass flow rates through vents based on NUREG-1805 methodology.
     Handles both natural and forced ventilation scenarios.
     """
+
+    NATURAL_VENT_FLOW_UNITS = UnitSchema(
+        inputs={
+            'vent_height': LENGTH, 'vent_width': LENGTH, 'neutral_plane': LENGTH,
+            'temp_hot': TEMPERATURE, 'temp_ambient': TEMPERATURE,
+        },
+        outputs={'mass_flow_in': MASS_FLOW, 'mass_flow_out': MASS_FLOW},
+    )
     
     @staticmethod
     def natural_vent_flow(vent_height: float, vent_width: float, 
@@ -27,16 +39,41 @@ class VentFlowCalculator:
                 - mass_flow_in: Mass flow rate into compartment (kg/s if SI, lb/s if imperial)
                 - mass_flow_out: Mass flow rate out of compartment (kg/s if SI, lb/s if imperial)
         """
-        if units.lower() == 'imperial':
-            # Convert dimensions to meters
-            vent_height = UnitConverter.length_converter(vent_height, 'ft', 'm')
-            vent_width = UnitConverter.length_converter(vent_width, 'ft', 'm')
-            neutral_plane = UnitConverter.length_converter(neutral_plane, 'ft', 'm')
-            
-            # Convert temperatures to Celsius
-            temp_hot = UnitConverter.temperature_converter(temp_hot, 'F', 'C')
-            temp_ambient = UnitConverter.temperature_converter(temp_ambient, 'F', 'C')
-        
+        flows = VentFlowCalculator.NATURAL_VENT_FLOW_UNITS.evaluate(
+            VentFlowCalculator.natural_vent_flow_batch, units,
+            vent_height=vent_height, vent_width=vent_width, neutral_plane=neutral_plane,
+            temp_hot=temp_hot, temp_ambient=temp_ambient,
+        )
+        return {
+            'mass_flow_in': flows['mass_flow_in'].scalar(),
+            'mass_flow_out': flows['mass_flow_out'].scalar()
+        }
+
+    @staticmethod
+    def natural_vent_flow_batch(vent_height, vent_width, neutral_plane, temp_hot, temp_ambient) -> dict:
+        """
+        Vectorized natural vent flow for SI arrays (m, °C).
+
+        Returns:
+            Dictionary of BatchResults (kg/s) sharing the same validation:
+                - mass_flow_in
+                - mass_flow_out
+        """
+        vent_height, vent_width, neutral_plane, temp_hot, temp_ambient = as_arrays(
+            vent_height, vent_width, neutral_plane, temp_hot, temp_ambient
+        )
+        check = MaskedValidator(vent_height.shape)
+        check.require((vent_height > 0) & (vent_width > 0), "Vent dimensions must be positive")
+        check.require((neutral_plane >= 0) & (neutral_plane <= vent_height),
+                      "Neutral plane must lie within the vent opening")
+        check.require(temp_hot >= temp_ambient, "Hot gas temperature cannot be below ambient temperature")
+
+        ok = check.ok
+        temp_hot = safe(ok, temp_hot, 100.0)
+        temp_ambient = safe(ok, temp_ambient, 20.0)
+        neutral_plane = safe(ok, neutral_plane, 0.0)
+        vent_height = safe(ok, vent_height)
+
         # Convert temperatures to Kelvin for density calculations
         T_hot = temp_hot + 273.15
         T_amb = temp_ambient + 273.15
@@ -47,20 +84,106 @@ class VentFlowCalculator:
         rho_hot = 353/T_hot  # hot gas density (kg/m³)
         
         # Calculate mass flow rates
-        mass_flow_in = (2/3) * vent_width * neutral_plane * math.sqrt(
+        mass_flow_in = (2/3) * vent_width * neutral_plane * np.sqrt(
             2 * g * rho_amb * (rho_amb - rho_hot) * neutral_plane / rho_hot
         )
         
-        mass_flow_out = (2/3) * vent_width * (vent_height - neutral_plane) * math.sqrt(
+        mass_flow_out = (2/3) * vent_width * (vent_height - neutral_plane) * np.sqrt(
             2 * g * (rho_amb - rho_hot) * (vent_height - neutral_plane)
         )
-        
-        if units.lower() == 'imperial':
-            # Convert mass flow rates to lb/s
-            mass_flow_in *= 2.205
-            mass_flow_out *= 2.205
             
         return {
-            'mass_flow_in': mass_flow_in,
-            'mass_flow_out': mass_flow_out
-        }
\ No newline at end of file
+            'mass_flow_in': check.result(mass_flow_in),
+            'mass_flow_out': check.result(mass_flow_out)
+        }
+
+    @staticmethod
+    def layer_outflow(vent_width, depth, rho_hot, rho_amb, discharge_coefficient: float = 0.7):
+        """
+        Mass flow (kg/s) of hot gas leaving through the part of a vent that lies in
+        the upper layer, taking the neutral plane at the layer interface:
+
+            ṁ = (2/3) Cd W √(2 g ρ_hot (ρ_amb - ρ_hot)) d^(3/2)
+
+        Args:
+            vent_width: Width of the vent (m)
+            depth: Height of the vent opening inside the upper layer, from the
+                interface (or the sill, if higher) up to the soffit (m)
+            rho_hot, rho_amb: Hot gas and ambient densities (kg/m³)
+
+        This is an unvalidated array kernel for the time-stepping zone model, which
+        calls it on every step; inputs are expected to be physical already.
+        """
+        g = 9.81  # gravitational acceleration, m/s²
+        buoyancy = np.maximum(rho_hot * (rho_amb - rho_hot), 0.0)
+        return (2/3) * discharge_coefficient * vent_width * np.sqrt(2 * g * buoyancy) * depth**1.5
+
+    @staticmethod
+    def two_way_flow(pressure_difference, rho_from, rho_to, vent_width, vent_bottom, vent_top,
+                     discharge_coefficient: float = 0.7, min_pressure: float = 1e-6) -> dict:
+        """
+        Orifice flow through a vertical vent between two well-mixed rooms.
+
+        The pressure difference across the vent varies linearly with height,
+
+            Δp(z) = Δp₀ - g (ρ_from - ρ_to) z,
+
+        where Δp₀ = p_from - p_to at z = 0, and each strip of the opening
+        carries Cd W √(2 ρ |Δp(z)|) dz from the high pressure side, at that
+        side's density. Integrating over the opening gives both directions in
+        closed form.
+
+        Args:
+            pressure_difference: Δp₀, the room pressures at z = 0 (Pa)
+            rho_from, rho_to: Densities of the two rooms (kg/m³)
+            vent_width: Width of the vent (m)
+            vent_bottom, vent_top: Sill and soffit heights above z = 0 (m)
+            min_pressure: Floor on √Δp in the derivatives (Pa), which are
+                infinite for a vent with no pressure difference anywhere
+
+        Returns:
+            Dictionary of arrays:
+                - forward, backward: Mass flows from → to and to → from (kg/s)
+                - derivative: ∂(forward - backward)/∂Δp₀ (kg/s·Pa), never negative
+                - neutral_plane: Height where Δp(z) = 0, NaN outside the opening (m)
+
+        This is an unvalidated array kernel for the vent network solver, which
+        calls it on every iteration; inputs are expected to be physical already.
+        """
+        g = 9.81  # gravitational acceleration, m/s²
+        stratification = g * (rho_from - rho_to)
+        height = vent_top - vent_bottom
+        bottom = pressure_difference - stratification * vent_bottom
+        top = pressure_difference - stratification * vent_top
+        floor = math.sqrt(min_pressure)
+
+        def one_way(low, high):
+            # ∫ √max(Δp, 0) dz over the opening and its derivative in Δp₀, for Δp
+            # varying linearly from `low` at the sill to `high` at the soffit
+            x, y = np.sqrt(np.maximum(low, 0.0)), np.sqrt(np.maximum(high, 0.0))
+            span = high - low
+            both = (low >= 0) & (high >= 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Open over the whole height: (2/3) H (x² + xy + y²) / (x + y), which
+                # does not cancel; open over part of it: (2/3) H (y³ - x³) / (high - low)
+                integral = np.where(both, np.where(x + y > 0, (2/3) * height * (x**2 + x * y + y**2) / (x + y), 0.0),
+                                    np.where(span != 0, (2/3) * height * (y**3 - x**3) / span, 0.0))
+                slope = np.where(both, height / np.maximum(x + y, floor),
+                                 np.where(span != 0, height * (y - x) / span, 0.0))
+            return integral, np.clip(slope, 0.0, height / floor)
+
+        forward, d_forward = one_way(bottom, top)
+        backward, d_backward = one_way(-bottom, -top)
+        scale_forward = discharge_coefficient * vent_width * np.sqrt(2 * rho_from)
+        scale_backward = discharge_coefficient * vent_width * np.sqrt(2 * rho_to)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            neutral_plane = np.divide(pressure_difference, stratification)
+        neutral_plane = np.where((neutral_plane > vent_bottom) & (neutral_plane < vent_top), neutral_plane, np.nan)
+
+        return {
+            'forward': scale_forward * forward,
+            'backward': scale_backward * backward,
+            'derivative': scale_forward * d_forward + scale_backward * d_backward,
+            'neutral_plane': neutral_plane,
+        }
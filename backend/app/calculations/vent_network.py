@@ -0,0 +1,189 @@
+# backend/app/calculations/vent_network.py
+"""
+Pressures and vent flows of a network of rooms connected by vents.
+
+Rooms are the nodes of the network and vents its edges; AMBIENT stands for
+the outside, whose pressure is the reference. Each room is well mixed at its
+own temperature, so its pressure falls hydrostatically with height from its
+value p at z = 0, and every vent carries the two-way orifice flow of
+VentFlowCalculator.two_way_flow. The unknowns are the room pressures, and
+Newton's method drives the mass balance of every room to zero:
+
+    r_i(p) = Σ flow into room i - Σ flow out of room i + source_i = 0
+
+Each vent flow grows with the pressure difference across it, so the
+Jacobian -∂r/∂p is a graph Laplacian weighted by the vents' flow
+derivatives: symmetric, positive definite when every room connects to the
+outside, and with one nonzero per room and two per vent. The Newton steps
+are solved with conjugate gradients preconditioned by its diagonal, applying
+the Laplacian straight from the vent list, so memory and work per iteration
+grow with the number of vents and not with rooms². A backtracking line
+search keeps the mass balance error falling.
+"""
+
+import numpy as np
+
+from ..utils.batch import MaskedValidator, as_arrays
+from .vent_flow import VentFlowCalculator
+
+# Room index of the outside in vent_from / vent_to
+AMBIENT = -1
+
+
+def _connected_to_ambient(rooms: int, vent_from: np.ndarray, vent_to: np.ndarray) -> np.ndarray:
+    """Which rooms have a path of vents to the outside, by label propagation."""
+    # Node `rooms` is the outside
+    a, b = np.where(vent_from == AMBIENT, rooms, vent_from), np.where(vent_to == AMBIENT, rooms, vent_to)
+    label = np.arange(rooms + 1)
+    while True:
+        lowest = np.minimum(label[a], label[b])
+        updated = label.copy()
+        np.minimum.at(updated, a, lowest)
+        np.minimum.at(updated, b, lowest)
+        # Jump labels to their own labels to shorten long chains of rooms
+        updated = updated[updated]
+        if np.array_equal(updated, label):
+            break
+        label = updated
+    return label[:rooms] == label[rooms]
+
+
+class VentNetworkCalculator:
+    """
+    Solves multi-room natural ventilation networks (see the module docstring).
+    This calculator assumes ALL inputs are in SI units (m, °C, kg/s, Pa).
+    """
+
+    @staticmethod
+    def solve(room_temps, vent_from, vent_to, vent_width, vent_bottom, vent_top, sources=0.0,
+              ambient_temp: float = 20.0, discharge_coefficient: float = 0.7, tol: float = 1e-9,
+              maxiter: int = 100) -> dict:
+        """
+        Solves the room pressures and vent flows of a network.
+
+        Args:
+            room_temps: Temperature of each room (°C)
+            vent_from, vent_to: Rooms joined by each vent (index into room_temps, or AMBIENT)
+            vent_width: Width of each vent (m)
+            vent_bottom, vent_top: Sill and soffit heights of each vent above z = 0 (m)
+            sources: Mass added to each room (kg/s), e.g. by a fire or mechanical supply
+            ambient_temp: Outside temperature (°C)
+            discharge_coefficient: Orifice discharge coefficient of the vents
+            tol: Largest accepted mass balance error of a room (kg/s)
+            maxiter: Newton iteration limit
+
+        Returns:
+            Dictionary containing:
+                - pressure: Room pressures at z = 0 relative to the outside (Pa)
+                - mass_flow: Net flow of each vent from vent_from to vent_to (kg/s)
+                - flow_forward, flow_backward: The flows in each direction (kg/s)
+                - neutral_plane: Neutral plane height of each vent, NaN if there is
+                  none in the opening (m)
+                - residual: Largest remaining mass balance error (kg/s)
+                - iterations: Newton iterations taken
+            Raises ValueError for an invalid network or if Newton's method does
+            not converge.
+        """
+        room_temps, sources = (np.ravel(v) for v in as_arrays(room_temps, sources))
+        vent_from, vent_to, vent_width, vent_bottom, vent_top = (
+            np.ravel(v) for v in np.broadcast_arrays(vent_from, vent_to, vent_width, vent_bottom, vent_top))
+        vent_width, vent_bottom, vent_top = (v.astype(float) for v in (vent_width, vent_bottom, vent_top))
+        rooms = room_temps.size
+
+        check = MaskedValidator(vent_from.shape)
+        check.require(np.issubdtype(vent_from.dtype, np.integer) & np.issubdtype(vent_to.dtype, np.integer)
+                      & (vent_from >= AMBIENT) & (vent_from < rooms) & (vent_to >= AMBIENT) & (vent_to < rooms),
+                      "Vent must join rooms of the network")
+        check.require(vent_from != vent_to, "Vent must join two different rooms")
+        check.require((vent_width > 0) & (vent_top > vent_bottom), "Vent dimensions must be positive")
+        failed = np.flatnonzero(check.codes)
+        if failed.size:
+            raise ValueError(f"Vent {int(failed[0])}: {check.messages[check.codes[failed[0]] - 1]}")
+        if not (np.all(np.isfinite(room_temps)) and np.isfinite(ambient_temp)):
+            raise ValueError("Temperatures must be finite")
+        if np.any(room_temps <= -273.15) or ambient_temp <= -273.15:
+            raise ValueError("Temperatures must be above absolute zero")
+        if not np.all(np.isfinite(sources)):
+            raise ValueError("Sources must be finite")
+        isolated = np.flatnonzero(~_connected_to_ambient(rooms, vent_from, vent_to))
+        if isolated.size:
+            raise ValueError(f"Room {int(isolated[0])} has no vent path to the outside")
+
+        # The outside is stored after the rooms, with its pressure fixed at 0
+        density = 353 / (np.append(room_temps, ambient_temp) + 273.15)
+        a, b = np.where(vent_from == AMBIENT, rooms, vent_from), np.where(vent_to == AMBIENT, rooms, vent_to)
+        rho_from, rho_to = density[a], density[b]
+        sources = np.broadcast_to(sources, (rooms,))
+        pressure = np.zeros(rooms + 1)
+
+        def balance(pressure: np.ndarray) -> tuple:
+            flows = VentFlowCalculator.two_way_flow(pressure[a] - pressure[b], rho_from, rho_to, vent_width,
+                                                    vent_bottom, vent_top, discharge_coefficient)
+            net = flows['forward'] - flows['backward']
+            residual = (np.bincount(b, net, rooms + 1) - np.bincount(a, net, rooms + 1))[:rooms] + sources
+            return residual, flows
+
+        residual, flows = balance(pressure)
+        error = np.abs(residual).max(initial=0.0)
+        iterations = 0
+        # Written so that a NaN error keeps iterating into the maxiter error
+        while not error <= tol:
+            if iterations == maxiter:
+                raise ValueError(f"Vent network did not converge in {maxiter} iterations "
+                                 f"(mass balance error {error:.3g} kg/s)")
+            iterations += 1
+            step = _laplacian_solve(rooms, a, b, flows['derivative'], residual)
+
+            # Backtrack until the mass balance improves
+            scale = 1.0
+            for _ in range(30):
+                trial = pressure.copy()
+                trial[:rooms] += scale * step
+                trial_residual, trial_flows = balance(trial)
+                trial_error = np.abs(trial_residual).max()
+                if trial_error < error:
+                    break
+                scale /= 2
+            pressure, residual, flows, error = trial, trial_residual, trial_flows, trial_error
+
+        return {
+            'pressure': pressure[:rooms],
+            'mass_flow': flows['forward'] - flows['backward'],
+            'flow_forward': flows['forward'],
+            'flow_backward': flows['backward'],
+            'neutral_plane': flows['neutral_plane'],
+            'residual': float(error),
+            'iterations': iterations,
+        }
+
+
+def _laplacian_solve(rooms: int, a: np.ndarray, b: np.ndarray, weight: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solves L x = rhs for the vent-weighted Laplacian L of the rooms (the outside,
+    node `rooms`, held at zero) by Jacobi-preconditioned conjugate gradients.
+    """
+    diagonal = (np.bincount(a, weight, rooms + 1) + np.bincount(b, weight, rooms + 1))[:rooms]
+    diagonal = np.maximum(diagonal, np.finfo(float).tiny)
+
+    def apply(x: np.ndarray) -> np.ndarray:
+        x = np.append(x, 0.0)
+        flow = weight * (x[a] - x[b])
+        return (np.bincount(a, flow, rooms + 1) - np.bincount(b, flow, rooms + 1))[:rooms]
+
+    x = np.zeros(rooms)
+    r = rhs.copy()
+    z = r / diagonal
+    p = z.copy()
+    rz = r @ z
+    target = 1e-12 * np.sqrt(rhs @ rhs)
+    for _ in range(10 * rooms + 10):
+        if np.sqrt(r @ r) <= target:
+            break
+        Lp = apply(p)
+        step = rz / (p @ Lp)
+        x += step * p
+        r -= step * Lp
+        z = r / diagonal
+        rz, previous = r @ z, rz
+        p = z + (rz / previous) * p
+    return x
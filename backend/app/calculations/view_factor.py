@@ -0,0 +1,171 @@
+# backend/app/calculations/view_factor.py
+"""
+View factors from solid flames to a differential target, exact and tabulated.
+
+Two radiator shapes are covered, both with the target at the level of the
+flame base and facing the flame:
+
+- cylinder: a vertical cylinder of diameter D and height Hf, target at
+  distance L from its axis. With h = 2 Hf / D and S = 2 L / D the vertical and
+  horizontal target view factors are Mudan's closed forms, and the maximum
+  view factor is √(Fv² + Fh²) (SFPE Handbook, Beyler).
+- plane: a vertical rectangle of width W and height Hf, target at distance S
+  on the normal through the middle of its base. The rectangle is two corner
+  rectangles W/2 × Hf, so F = 2 F_corner(Hf / S, W / 2S).
+
+The cylinder forms need a dozen arctangents and square roots per point, so
+CYLINDER_TABLE samples log F on a grid that is uniform in log h and log(S - 1)
+and interpolates bilinearly: two single precision logarithms, an exponential
+and one read of the cell's four coefficients, about twice as fast as the
+exact forms. With TABLE_POINTS = 257 the interpolated view factors are
+within VIEW_FACTOR_RTOL (0.1 %, relative) of the exact ones everywhere on the
+table (h from 0.01 to 1000, S - 1 from 1e-4 to 1e4); parameters outside it
+fall back to the exact forms. The plane form is already about as cheap as a
+table lookup and is always evaluated exactly. Tables are built on first use
+and saved as .npy files under VIEW_FACTOR_CACHE, so later processes only
+read them back.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+TABLE_FORMAT = 1
+TABLE_POINTS = 257
+VIEW_FACTOR_RTOL = 1e-3
+VIEW_FACTOR_CACHE = os.environ.get(
+    'VIEW_FACTOR_CACHE', os.path.join(tempfile.gettempdir(), 'fire-calculator-view-factors'))
+
+
+def cylinder_view_factors(h, S) -> tuple:
+    """
+    Exact (vertical, horizontal) view factors of a cylinder for h = 2 Hf / D
+    and S = 2 L / D > 1.
+    """
+    A = (h**2 + S**2 + 1) / (2 * S)
+    B = (1 + S**2) / (2 * S)
+    ratio = np.sqrt((S - 1) / (S + 1))
+    angle_a = np.arctan(np.sqrt((A + 1) / (A - 1)) * ratio)
+    vertical = (np.arctan(h / np.sqrt(S**2 - 1)) - h * np.arctan(ratio)
+                + A * h / np.sqrt(A**2 - 1) * angle_a) / (np.pi * S)
+    horizontal = ((B - 1 / S) / np.sqrt(B**2 - 1) * np.arctan(np.sqrt((B + 1) / (B - 1)) * ratio)
+                  - (A - 1 / S) / np.sqrt(A**2 - 1) * angle_a) / np.pi
+    return vertical, horizontal
+
+
+def cylinder_view_factor(h, S):
+    """Exact maximum view factor of a cylinder, √(Fv² + Fh²)."""
+    return np.hypot(*cylinder_view_factors(h, S))
+
+
+def plane_view_factor(X, Y):
+    """
+    Exact view factor of a rectangle to a parallel target on the normal
+    through the middle of its base, for X = Hf / S and Y = W / 2S.
+    """
+    root_x, root_y = np.sqrt(1 + X**2), np.sqrt(1 + Y**2)
+    corner = (X / root_x * np.arctan(Y / root_x) + Y / root_y * np.arctan(X / root_y)) / (2 * np.pi)
+    return 2 * corner
+
+
+class ViewFactorTable:
+    """
+    Bilinear interpolation of log F over the log of two positive parameters.
+
+    `exact(first, second)` gives the view factor; `offset` is subtracted from
+    the second parameter before taking its log, so the cylinder table can
+    resolve S → 1 through log(S - 1).
+    """
+
+    def __init__(self, name: str, exact, first: tuple, second: tuple, offset: float = 0.0,
+                 points: int = TABLE_POINTS):
+        self.name, self.exact, self.offset, self.points = name, exact, offset, points
+        self.first = np.linspace(np.log(first[0]), np.log(first[1]), points)
+        self.second = np.linspace(np.log(second[0]), np.log(second[1]), points)
+        self._values = self._coefficients = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(VIEW_FACTOR_CACHE, f'{self.name}-v{TABLE_FORMAT}-{self.points}.npy')
+
+    @property
+    def values(self) -> np.ndarray:
+        """The table of log F, loaded from the cache or built on first use."""
+        if self._values is None:
+            self._values = self._load()
+        return self._values
+
+    def _build(self) -> np.ndarray:
+        first = np.exp(self.first)[:, np.newaxis]
+        second = np.exp(self.second)[np.newaxis, :] + self.offset
+        return np.log(self.exact(first, second))
+
+    def _load(self) -> np.ndarray:
+        try:
+            values = np.load(self.path)
+            if values.shape == (self.points, self.points):
+                return values
+        except (OSError, ValueError):
+            pass
+        values = self._build()
+        # A read-only or racing cache directory only costs a rebuild next time
+        try:
+            os.makedirs(VIEW_FACTOR_CACHE, exist_ok=True)
+            partial = f'{self.path}.{os.getpid()}.tmp'
+            with open(partial, 'wb') as f:
+                np.save(f, values)
+            os.replace(partial, self.path)
+        except OSError:
+            pass
+        return values
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """float32 (a, b - a, c - a, a - b - c + d) of every cell, from its corners a..d."""
+        if self._coefficients is None:
+            V = self.values
+            corner = V[:-1, :-1]
+            self._coefficients = np.stack([
+                corner, V[1:, :-1] - corner, V[:-1, 1:] - corner, corner - V[1:, :-1] - V[:-1, 1:] + V[1:, 1:],
+            ], axis=-1).reshape(-1, 4).astype(np.float32)
+        return self._coefficients
+
+    def __call__(self, first, second) -> np.ndarray:
+        """View factors at (first, second); exact outside the table."""
+        first, second = np.broadcast_arrays(np.asarray(first, dtype=float), np.asarray(second, dtype=float))
+        shape = first.shape
+        first, second = first.ravel(), second.ravel()
+        # Single precision is ample for the grid position and makes the logs cheaper
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = np.log(first.astype(np.float32))
+            u -= np.float32(self.first[0])
+            u *= np.float32(1 / (self.first[1] - self.first[0]))
+            v = np.log((second - self.offset).astype(np.float32))
+            v -= np.float32(self.second[0])
+            v *= np.float32(1 / (self.second[1] - self.second[0]))
+            cells = self.points - 1
+            inside = (u >= 0) & (u <= cells) & (v >= 0) & (v <= cells)
+
+            i, j = u.astype(np.intp), v.astype(np.intp)
+            np.clip(i, 0, cells - 1, out=i)
+            np.clip(j, 0, cells - 1, out=j)
+            u -= i
+            v -= j
+            i *= cells
+            i += j
+            cell = self.coefficients.take(i, axis=0)
+            log_f = cell[..., 2] + cell[..., 3] * u
+            log_f *= v
+            log_f += cell[..., 1] * u
+            log_f += cell[..., 0]
+            result = np.exp(log_f, dtype=float)
+
+            if not inside.all():
+                outside = ~inside
+                result[outside] = self.exact(first[outside], second[outside])
+        return result.reshape(shape)
+
+
+# h = 2 Hf / D and S - 1 = 2 L / D - 1
+CYLINDER_TABLE = ViewFactorTable('cylinder', cylinder_view_factor, (1e-2, 1e3), (1e-4, 1e4), offset=1.0)
@@ -0,0 +1,212 @@
+# backend/app/calculations/zone_model.py
+
+import numpy as np
+
+from ..utils.batch import BatchResult, MaskedValidator, as_arrays, safe
+from .vent_flow import VentFlowCalculator
+
+class ZoneModelCalculator:
+    """
+    Two-zone smoke filling model: a hot upper layer fed by the fire plume and
+    drained through vents, above a lower layer at ambient conditions. Unlike
+    SmokeLayerCalculator's closed-form filling time, the HRR can vary with time.
+    All calculations are performed in SI units.
+
+    The upper layer state is its mass m (kg) and enthalpy E = m cp T (kJ). The
+    room stays at ambient pressure, so ρT = 353 and the layer volume is simply
+    E / (353 cp). Each room integrates
+
+        dm/dt = ṁ_plume - ṁ_vent
+        dE/dt = cp (ṁ_plume T_amb - ṁ_vent T) + (1 - λ) Q
+
+    with Zukoski plume entrainment (the 0.21 coefficient SmokeLayerCalculator
+    uses) and VentFlowCalculator.layer_outflow through the vent. The fire only
+    burns the air its plume entrains below the layer, so Q is limited to
+    H_AIR ṁ_plume: as the layer descends towards the fire base the HRR falls
+    with the entrainment, and the layer approaches the fire base instead of
+    heating a filled room without bound.
+
+    Rooms are integrated together as one batched state vector with an adaptive
+    Bogacki-Shampine 3(2) scheme, so the Python cost per step is independent
+    of the number of rooms.
+    """
+
+    # Constants
+    CP = 1.0          # specific heat of air (kJ/kg·K)
+    RHO_T = 353.0     # ρT of air at ambient pressure (kg·K/m³)
+    GAMMA = 0.21      # plume entrainment coefficient
+    H_AIR = 3030.0    # heat released per kg of air consumed (kJ/kg), Huggett's 13.1 MJ/kg O2
+    G = 9.81          # gravitational acceleration, m/s²
+    # Initial layer depth, so the layer temperature is defined from the start
+    INITIAL_DEPTH = 1e-3
+    # Most integration steps, accepted or rejected, before giving up
+    MAX_STEPS = 100000
+
+    @staticmethod
+    def integrate_layer_batch(time, hrr, room_height, floor_area, vent_width=0.0, vent_height=0.0,
+                              vent_sill=0.0, fire_elevation=0.0, ambient_temp=20.0,
+                              heat_loss_fraction=0.3, rtol: float = 1e-3, max_step: float = None) -> dict:
+        """
+        Integrates smoke layer descent for a batch of rooms.
+
+        Args:
+            time: Shared 1-D time grid (s); results are reported at these times
+            hrr: Heat release rate (kW), either (time × room), e.g. the `hrr` values from
+                DesignFireCalculator.design_fire_curve_batch, or one curve for every room
+            room_height, floor_area: Room height (m) and floor area (m²)
+            vent_width, vent_height, vent_sill: Vent opening (m); width 0 for a closed room
+            fire_elevation: Height of the fire base above the floor (m)
+            ambient_temp: Ambient temperature (°C)
+            heat_loss_fraction: Fraction λ of the HRR lost to the boundaries
+            rtol: Relative error per step (> 0), measured against a room full of smoke
+            max_step: Largest step (s); defaults to the whole time span
+
+        Returns:
+            Dictionary containing:
+                - time: the time grid
+                - layer_height: BatchResult of the interface height (m), (time × room)
+                - layer_temperature: BatchResult of the upper layer temperature (°C), (time × room)
+            Codes are per room; rooms that failed validation are NaN columns.
+        """
+        time = np.asarray(time, dtype=float)
+        if time.ndim != 1 or time.size < 2 or np.any(np.diff(time) <= 0):
+            raise ValueError("Time must be an increasing 1-D array with at least two entries.")
+        hrr = np.asarray(hrr, dtype=float)
+        if hrr.ndim == 1:
+            hrr = hrr[:, None]
+        if hrr.shape[0] != time.size:
+            raise ValueError("HRR must have one row per time.")
+        if not rtol > 0:
+            raise ValueError("Relative tolerance must be positive.")
+
+        params = as_arrays(room_height, floor_area, vent_width, vent_height, vent_sill, fire_elevation,
+                           ambient_temp, heat_loss_fraction, np.zeros(hrr.shape[1]))
+        room_height, floor_area, vent_width, vent_height, vent_sill, fire_elevation, ambient_temp, \
+            heat_loss_fraction = (np.atleast_1d(v).copy() for v in params[:-1])
+        n = room_height.size
+        hrr = np.ascontiguousarray(np.broadcast_to(hrr, (time.size, n)))
+
+        check = MaskedValidator(n)
+        check.require((room_height > 0) & (floor_area > 0), "All dimensions must be positive")
+        check.require((vent_width >= 0) & (vent_height >= 0) & (vent_sill >= 0),
+                      "Vent dimensions cannot be negative")
+        check.require(vent_sill + vent_height <= room_height, "Vent cannot extend above the ceiling")
+        check.require((fire_elevation >= 0) & (fire_elevation < room_height),
+                      "Fire must be located below the ceiling")
+        check.require(np.isfinite(ambient_temp) & (ambient_temp > -273.15),
+                      "Ambient temperature must be above absolute zero")
+        check.require((heat_loss_fraction >= 0) & (heat_loss_fraction < 1),
+                      "Heat loss fraction must be between 0 and 1")
+        check.require(~np.isnan(hrr).any(axis=0) & (hrr >= 0).all(axis=0), "HRR must be non-negative")
+
+        ok = check.ok
+        room_height, floor_area = safe(ok, room_height, 3.0), safe(ok, floor_area)
+        vent_width = safe(ok, vent_width, 0.0)
+        vent_height, vent_sill = safe(ok, vent_height, 0.0), safe(ok, vent_sill, 0.0)
+        fire_elevation, heat_loss_fraction = safe(ok, fire_elevation, 0.0), safe(ok, heat_loss_fraction, 0.0)
+        ambient_temp = safe(ok, ambient_temp, 20.0)
+        hrr = np.where(ok, hrr, 0.0)
+
+        cp, rho_T = ZoneModelCalculator.CP, ZoneModelCalculator.RHO_T
+        T_amb = ambient_temp + 273.15
+        rho_amb = rho_T / T_amb
+        # Zukoski: ṁ = γ ρ (g / (cp ρ T))^(1/3) Q^(1/3) z^(5/3)
+        entrainment = ZoneModelCalculator.GAMMA * rho_amb * np.cbrt(ZoneModelCalculator.G / (cp * rho_amb * T_amb))
+        soffit = vent_sill + vent_height
+        E_full = rho_T * cp * floor_area * room_height
+        # Oxygen limit Q ≤ H_AIR ṁ_plume with ṁ_plume ∝ Q^(1/3) h^(5/3): Q ≤ (H_AIR c)^(3/2) h^(5/2)
+        air_limit = (ZoneModelCalculator.H_AIR * entrainment)**1.5
+
+        def rates(t, y):
+            m, E = y
+            T = E / (cp * m)
+            z = room_height - E / (rho_T * cp * floor_area)
+            h = np.clip(z - fire_elevation, 0.0, None)
+            Q = np.minimum(_interpolate(time, hrr, t), air_limit * h**2.5)
+
+            plume = entrainment * np.cbrt(Q) * h**(5/3)
+            depth = np.clip(soffit - np.maximum(z, vent_sill), 0.0, None)
+            vent = VentFlowCalculator.layer_outflow(vent_width, depth, rho_T / T, rho_amb)
+
+            dm = plume - vent
+            dE = cp * (plume * T_amb - vent * T) + (1 - heat_loss_fraction) * Q
+            return np.stack((dm, dE))
+
+        E0 = rho_T * cp * floor_area * ZoneModelCalculator.INITIAL_DEPTH
+        y0 = np.stack((E0 / (cp * T_amb), E0))
+        # Errors are measured against a room full of ambient-temperature smoke
+        scale = rtol * np.stack((E_full / (cp * T_amb), E_full))
+        states = _integrate(rates, time, y0, scale, max_step or time[-1] - time[0],
+                            ZoneModelCalculator.MAX_STEPS)
+
+        m, E = states[:, 0], states[:, 1]
+        check.require(np.isfinite(states).all(axis=(0, 1)) & (states > 0).all(axis=(0, 1)),
+                      "Zone model did not stay physical (non-positive layer mass or energy)")
+        ok = check.ok
+        layer_height = np.clip(room_height - E / (rho_T * cp * floor_area), 0.0, room_height)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            layer_temperature = E / (cp * m) - 273.15
+        layer_height[:, ~ok] = np.nan
+        layer_temperature[:, ~ok] = np.nan
+
+        messages = tuple(check.messages)
+        return {
+            'time': time,
+            'layer_height': BatchResult(layer_height, check.codes, messages),
+            'layer_temperature': BatchResult(layer_temperature, check.codes, messages),
+        }
+
+
+def _interpolate(time: np.ndarray, values: np.ndarray, t: float) -> np.ndarray:
+    """Linearly interpolates the row of a (time × room) array at scalar time t."""
+    i = min(max(int(np.searchsorted(time, t, side='right')) - 1, 0), time.size - 2)
+    w = (t - time[i]) / (time[i + 1] - time[i])
+    return values[i] * (1 - w) + values[i + 1] * w
+
+
+def _integrate(rates, time: np.ndarray, y0: np.ndarray, scale: np.ndarray, max_step: float,
+               max_steps: int) -> np.ndarray:
+    """
+    Adaptive Bogacki-Shampine 3(2) integration of a batched state with one shared
+    step size, controlled by the worst error across the batch. States are reported
+    at every entry of `time` by cubic Hermite interpolation within accepted steps.
+    Raises ValueError if the error is not finite, the step collapses below the
+    resolution of t, or `max_steps` steps do not reach the end.
+    """
+    out = np.empty((time.size,) + y0.shape)
+    out[0] = y0
+    t, y, end = time[0], y0, time[-1]
+    f = rates(t, y)
+    dt = min(max_step, time[1] - time[0])
+    next_out = 1
+    for _ in range(max_steps):
+        if next_out == time.size:
+            return out
+        dt = min(dt, max_step, end - t)
+        if not dt > 1e-12 * max(abs(t), end - time[0]):
+            raise ValueError(f"Zone model step size collapsed at t = {t:g} s")
+        k2 = rates(t + dt / 2, y + dt / 2 * f)
+        k3 = rates(t + 3 * dt / 4, y + 3 * dt / 4 * k2)
+        y_new = y + dt * (2/9 * f + 1/3 * k2 + 4/9 * k3)
+        f_new = rates(t + dt, y_new)
+        error = np.max(np.abs(dt * (-5/72 * f + 1/12 * k2 + 1/9 * k3 - 1/8 * f_new)) / scale)
+        if not np.isfinite(error):
+            raise ValueError(f"Zone model integration failed at t = {t:g} s")
+
+        if error <= 1.0:
+            t_new = t + dt if end - (t + dt) > 1e-9 * dt else end
+            # Hermite interpolation for the report times inside this step
+            stop = int(np.searchsorted(time, t_new, side='right'))
+            if stop > next_out:
+                s = ((time[next_out:stop] - t) / dt)[:, None, None]
+                h00, h10 = (1 + 2 * s) * (1 - s)**2, s * (1 - s)**2
+                h01, h11 = s**2 * (3 - 2 * s), s**2 * (s - 1)
+                out[next_out:stop] = h00 * y + h10 * dt * f + h01 * y_new + h11 * dt * f_new
+                next_out = stop
+            t, y, f = t_new, y_new, f_new
+
+        # Standard step size update for a 3rd order pair
+        dt *= min(5.0, max(0.2, 0.9 * (error if error > 0 else 1e-10)**(-1/3)))
+    if next_out == time.size:
+        return out
+    raise ValueError(f"Zone model did not reach t = {end:g} s in {max_steps} steps")
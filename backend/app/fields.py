@@ -0,0 +1,148 @@
+# backend/app/fields.py
+"""
+Radiation and ceiling jet fields over grids of receivers.
+
+A field is evaluated at every point of a rectilinear receiver grid given by its
+axes (x, y and optionally z, in m), for any number of fire sources. The grid is
+processed a block of x rows at a time: each block broadcasts sources against
+its receivers, accumulates in float64 and is stored as float32. So a 2000×2000
+grid needs one 16 MB output array plus a few block-sized temporaries. The
+`*_tiles` generators yield the blocks instead, for callers that stream or
+write the field somewhere else and never hold it whole. All inputs are SI.
+
+Radiant fluxes from several fires add up (point source superposition). Ceiling
+jets do not, so the ceiling jet field reports the hottest (fastest) jet at
+each point.
+"""
+
+import numpy as np
+
+from .calculations.ceiling_jet import CeilingJetCalculator
+from .calculations.radiation import RadiationCalculator
+from .utils.batch import MaskedValidator, as_arrays
+
+# Receiver rows (along x) evaluated together
+FIELD_TILE_ROWS = 128
+
+
+def _sources(check: MaskedValidator) -> None:
+    # Sources are few and all must be valid; report the first bad one
+    failed = np.flatnonzero(check.codes)
+    if failed.size:
+        raise ValueError(f"Source {int(failed[0])}: {check.messages[check.codes[failed[0]] - 1]}")
+
+
+def _axes(x, y, z):
+    x, y = np.atleast_1d(np.asarray(x, dtype=float)), np.atleast_1d(np.asarray(y, dtype=float))
+    z = np.asarray(z, dtype=float)
+    if x.ndim != 1 or y.ndim != 1 or z.ndim > 1:
+        raise ValueError("Receiver axes must be 1-D")
+    return x, y, z
+
+
+def _field(tiles, shape: tuple, out: np.ndarray = None) -> np.ndarray:
+    if out is None:
+        out = np.empty(shape, dtype=np.float32)
+    elif out.shape != shape:
+        raise ValueError(f"Output must have shape {shape}")
+    for rows, tile in tiles:
+        out[rows] = tile
+    return out
+
+
+def radiation_field_tiles(source_x, source_y, source_z, Q, Xr, x, y, z=0.0, tile_rows: int = FIELD_TILE_ROWS):
+    """
+    Yields (row slice, float32 block) pieces of the radiation field; see radiation_field.
+    """
+    source_x, source_y, source_z, Q, Xr = (np.ravel(v) for v in as_arrays(source_x, source_y, source_z, Q, Xr))
+    check = MaskedValidator(Q.shape)
+    RadiationCalculator.validate_inputs_batch(check, Q, np.ones_like(Q), Xr)
+    _sources(check)
+
+    x, y, z = _axes(x, y, z)
+    # Receivers broadcast as (x, y[, z]); z adds a trailing axis when it is an array
+    trailing = (np.newaxis,) * z.ndim
+    y_grid = y[(slice(None),) + trailing]
+
+    for start in range(0, x.size, tile_rows):
+        rows = slice(start, min(start + tile_rows, x.size))
+        x_grid = x[rows][(slice(None), np.newaxis) + trailing]
+        flux = 0.0
+        with np.errstate(divide='ignore'):
+            for i in range(Q.size):
+                R2 = (x_grid - source_x[i])**2 + (y_grid - source_y[i])**2 + (z - source_z[i])**2
+                flux = flux + RadiationCalculator.point_source_flux(Q[i], np.sqrt(R2), Xr[i])
+        yield rows, np.broadcast_to(flux, (rows.stop - rows.start, y.size) + z.shape).astype(np.float32)
+
+
+def radiation_field(source_x, source_y, source_z, Q, Xr, x, y, z=0.0, tile_rows: int = FIELD_TILE_ROWS,
+                    out: np.ndarray = None) -> np.ndarray:
+    """
+    Point source radiant heat flux (kW/m²) summed over all sources, on a receiver grid.
+
+    Args:
+        source_x, source_y, source_z: Source (flame center) positions (m)
+        Q, Xr: Heat release rate (kW) and radiative fraction of each source
+        x, y: Receiver grid axes (m)
+        z: Receiver height (m), or an axis of heights for a 3-D field
+        tile_rows: Receiver rows evaluated per block
+        out: Optional float32 array (e.g. a np.memmap) to write the field into
+
+    Returns:
+        float32 array of shape (len(x), len(y)) or (len(x), len(y), len(z)).
+        Receivers at a source position get an infinite flux.
+    """
+    x, y, z = _axes(x, y, z)
+    tiles = radiation_field_tiles(source_x, source_y, source_z, Q, Xr, x, y, z, tile_rows)
+    return _field(tiles, (x.size, y.size) + z.shape, out)
+
+
+def ceiling_jet_field_tiles(source_x, source_y, source_z, Q, ceiling_height, x, y, quantity: str = 'temperature',
+                            tile_rows: int = FIELD_TILE_ROWS):
+    """
+    Yields (row slice, float32 block) pieces of the ceiling jet field; see ceiling_jet_field.
+    """
+    if quantity not in ('temperature', 'velocity'):
+        raise ValueError("Quantity must be 'temperature' or 'velocity'")
+    kernel = (CeilingJetCalculator.alpert_temperature_rise if quantity == 'temperature'
+              else CeilingJetCalculator.alpert_velocity)
+
+    source_x, source_y, source_z, Q = (np.ravel(v) for v in as_arrays(source_x, source_y, source_z, Q))
+    H = float(ceiling_height) - source_z
+    check = MaskedValidator(Q.shape)
+    CeilingJetCalculator.validate_inputs_batch(check, Q, H, np.ones_like(Q))
+    _sources(check)
+
+    x, y, _ = _axes(x, y, 0.0)
+    for start in range(0, x.size, tile_rows):
+        rows = slice(start, min(start + tile_rows, x.size))
+        x_grid = x[rows, np.newaxis]
+        field = np.zeros((rows.stop - rows.start, y.size))
+        # r = 0 only reaches the far-field branch, which np.where discards
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in range(Q.size):
+                r = np.hypot(x_grid - source_x[i], y - source_y[i])
+                np.maximum(field, kernel(Q[i], H[i], r), out=field)
+        yield rows, field.astype(np.float32)
+
+
+def ceiling_jet_field(source_x, source_y, source_z, Q, ceiling_height, x, y, quantity: str = 'temperature',
+                      tile_rows: int = FIELD_TILE_ROWS, out: np.ndarray = None) -> np.ndarray:
+    """
+    Alpert ceiling jet temperature rise (°C) or velocity (m/s) on a grid over the ceiling.
+
+    Args:
+        source_x, source_y, source_z: Fire base positions (m)
+        Q: Heat release rate of each fire (kW)
+        ceiling_height: Ceiling height above the floor (m)
+        x, y: Receiver grid axes on the ceiling (m)
+        quantity: 'temperature' or 'velocity'
+        tile_rows: Receiver rows evaluated per block
+        out: Optional float32 array to write the field into
+
+    Returns:
+        float32 array of shape (len(x), len(y)) with the largest value over all fires.
+    """
+    x, y, _ = _axes(x, y, 0.0)
+    tiles = ceiling_jet_field_tiles(source_x, source_y, source_z, Q, ceiling_height, x, y, quantity, tile_rows)
+    return _field(tiles, (x.size, y.size), out)
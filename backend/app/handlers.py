@@ -0,0 +1,323 @@
+# backend/app/handlers.py
+"""
+Vectorized request handlers shared by the single-item routes and /api/batch.
+
+Each handler takes a list of request payloads (the same JSON objects the
+single-item routes accept) and returns one response dict per payload, either
+the normal result or {"error": message}. Inputs are gathered into NumPy
+columns, converted to SI in one pass through each route's UnitSchema, and
+evaluated with the calculators' `_batch` methods, so N payloads cost one
+vectorized call instead of N.
+"""
+
+import numpy as np
+
+from .calculations.area_volume import AreaVolumeCalculator
+from .calculations.flashover import FlashoverCalculator
+from .calculations.flame_height import FlameHeightCalculator
+from .calculations.radiation import RadiationCalculator
+from .calculations.t_squared import TSquaredCalculator
+from .calculations.heat_release import HeatReleaseCalculator
+from .utils.batch import MaskedValidator
+from .utils.units import ALPHA, AREA, HEAT_FLUX, HEAT_RELEASE, LENGTH, UnitSchema, imperial_mask
+
+
+# --- Column helpers ---
+
+def _column(items: list, key: str, check: MaskedValidator, required: bool = False) -> np.ndarray:
+    """
+    Parses one numeric field across all payloads. Optional fields treat a
+    missing or empty value as 0, like the single-item routes always have.
+    Rows that fail to parse are flagged on `check` with the parser's message.
+    """
+    values = np.zeros(len(items))
+    for i, data in enumerate(items):
+        try:
+            values[i] = float(data[key]) if required else float(data.get(key) or 0)
+        except (KeyError, TypeError, ValueError) as e:
+            values[i] = np.nan
+            check.reject(i, str(e))
+    return values
+
+
+def _field(items: list, key: str, default=None) -> np.ndarray:
+    """Collects a non-numeric field (mode, material key, ...) as an object array."""
+    return np.array([data.get(key, default) for data in items], dtype=object)
+
+
+def _imperial(items: list) -> np.ndarray:
+    """Boolean mask of payloads that asked for imperial units."""
+    return imperial_mask([data.get('units', 'SI') for data in items])
+
+
+def _respond(check: MaskedValidator, columns: dict) -> list:
+    """
+    Builds one response dict per row from result columns, substituting
+    {"error": message} for rows that failed anywhere along the way.
+    """
+    lookup = (None,) + tuple(check.messages)
+    names = list(columns)
+    rows = zip(*(np.asarray(columns[name], dtype=float).tolist() for name in names))
+    return [
+        {"error": lookup[code]} if code else dict(zip(names, row))
+        for code, row in zip(check.codes.tolist(), rows)
+    ]
+
+
+# --- Unit schemas, keyed by payload field and result key ---
+
+FLASHOVER_UNITS = UnitSchema(
+    inputs={
+        'roomLength': LENGTH, 'roomWidth': LENGTH, 'roomHeight': LENGTH,
+        'openingWidth': LENGTH, 'openingHeight': LENGTH,
+    },
+    outputs={'mqh': HEAT_RELEASE, 'thomas': HEAT_RELEASE, 'babrauskas': HEAT_RELEASE},
+)
+FLAME_HEIGHT_UNITS = UnitSchema(
+    inputs={'heatRelease': HEAT_RELEASE, 'diameter': LENGTH, 'flameHeight': LENGTH},
+    # The output is whichever quantity calculateMode solves for
+    outputs={'flameHeight': LENGTH, 'heatRelease': HEAT_RELEASE, 'diameter': LENGTH},
+)
+POINT_SOURCE_RADIATION_UNITS = UnitSchema(
+    inputs={'heatRelease': HEAT_RELEASE, 'distance': LENGTH},
+    outputs={'value': HEAT_FLUX},
+)
+# Time is always in seconds
+T_SQUARED_GROWTH_UNITS = UnitSchema(
+    inputs={'heatRelease': HEAT_RELEASE, 'customAlpha': ALPHA},
+    outputs={'heatRelease': HEAT_RELEASE},
+)
+HEAT_RELEASE_UNITS = UnitSchema(
+    inputs={'burningArea': AREA},
+    outputs={'value': HEAT_RELEASE},
+)
+
+
+# --- Handlers, one per calculation route ---
+
+def rectangular_area_volume(items: list) -> list:
+    check = MaskedValidator(len(items))
+    length = _column(items, 'length', check, required=True)
+    width = _column(items, 'width', check, required=True)
+    height = _column(items, 'height', check, required=True)
+
+    # No conversion needed - calculations work the same in both unit systems
+    results = AreaVolumeCalculator.rectangular_compartment_batch(length, width, height)
+    check.absorb(results['volume'])
+
+    return _respond(check, {key: result.values for key, result in results.items()})
+
+
+def flashover(items: list) -> list:
+    check = MaskedValidator(len(items))
+    columns = {key: _column(items, key, check, required=True) for key in FLASHOVER_UNITS.inputs}
+    for i, data in enumerate(items):
+        if 'surfaceMaterial' not in data:
+            check.reject(i, str(KeyError('surfaceMaterial')))
+    surface_material = _field(items, 'surfaceMaterial')
+    imperial = _imperial(items)
+
+    # Convert all incoming dimensions to SI (meters) before any calculations
+    si = FLASHOVER_UNITS.to_si(imperial, columns)
+    room_length, room_width, room_height = si['roomLength'], si['roomWidth'], si['roomHeight']
+    opening_width, opening_height = si['openingWidth'], si['openingHeight']
+
+    # Calculate areas using ONLY SI units
+    At = 2 * (room_length * room_width + room_length * room_height + room_width * room_height)
+    A0 = opening_width * opening_height
+    H0 = opening_height
+
+    q_mqh = FlashoverCalculator.mccaffrey_correlation_batch(At, A0, H0, surface_material)
+    q_babrauskas = FlashoverCalculator.babrauskas_correlation_batch(A0, H0)
+    q_thomas = FlashoverCalculator.thomas_correlation_batch(At, A0, H0)
+    for result in (q_mqh, q_babrauskas, q_thomas):
+        check.absorb(result)
+
+    # Convert the FINAL results back to imperial if needed
+    results_si = {"mqh": q_mqh.values, "thomas": q_thomas.values, "babrauskas": q_babrauskas.values}
+    return _respond(check, FLASHOVER_UNITS.from_si(imperial, results_si))
+
+
+def flame_height(items: list) -> list:
+    check = MaskedValidator(len(items))
+    mode = _field(items, 'calculateMode')
+    columns = {key: _column(items, key, check) for key in FLAME_HEIGHT_UNITS.inputs}
+    imperial = _imperial(items)
+
+    # 1. Convert all inputs to SI units first
+    si = FLAME_HEIGHT_UNITS.to_si(imperial, columns)
+    hrr, diameter, flame_height = si['heatRelease'], si['diameter'], si['flameHeight']
+
+    # 2. Perform the calculation for each mode in SI units
+    modes = {
+        'flameHeight': lambda: FlameHeightCalculator.calculate_flame_height_batch(hrr, diameter),
+        'heatRelease': lambda: FlameHeightCalculator.calculate_heat_release_batch(flame_height, diameter),
+        'diameter': lambda: FlameHeightCalculator.calculate_diameter_batch(hrr, flame_height),
+    }
+    # 3. Convert the output of each mode to the requested units as it is filled in
+    final_value = np.zeros(len(items))
+    for name, calculate in modes.items():
+        rows = mode == name
+        if rows.any():
+            result = calculate()
+            check.absorb(result, where=rows)
+            final_value[rows] = FLAME_HEIGHT_UNITS.outputs[name].from_si(result.values[rows], imperial[rows])
+    for i, value in enumerate(mode.tolist()):
+        if not (isinstance(value, str) and value in modes):
+            check.reject(i, f"Invalid calculation mode: {value}")
+
+    return _respond(check, {"value": final_value})
+
+
+def point_source_radiation(items: list) -> list:
+    check = MaskedValidator(len(items))
+    columns = {key: _column(items, key, check) for key in ('heatRelease', 'distance', 'radiativeFraction')}
+    imperial = _imperial(items)
+
+    # 1. Convert inputs to SI
+    si = POINT_SOURCE_RADIATION_UNITS.to_si(imperial, columns)
+
+    # 2. Perform calculation in SI
+    result = RadiationCalculator.calculate_heat_flux_batch(si['heatRelease'], si['distance'], si['radiativeFraction'])
+    check.absorb(result)
+
+    # 3. Convert output if necessary
+    return _respond(check, POINT_SOURCE_RADIATION_UNITS.from_si(imperial, {"value": result.values}))
+
+
+def t_squared_growth(items: list) -> list:
+    check = MaskedValidator(len(items))
+    mode = _field(items, 'calculateMode')
+    growth_rate = _field(items, 'growthRate', 'medium')
+    columns = {key: _column(items, key, check) for key in ('time', 'heatRelease', 'customAlpha')}
+    imperial = _imperial(items)
+
+    # Convert inputs to SI
+    si = T_SQUARED_GROWTH_UNITS.to_si(imperial, columns)
+    time, hrr, custom_alpha = si['time'], si['heatRelease'], si['customAlpha']
+
+    # Determine alpha in SI units
+    custom = growth_rate == 'custom'
+    alpha = np.empty(len(items))
+    for i, rate in enumerate(growth_rate.tolist()):
+        if custom[i]:
+            alpha[i] = custom_alpha[i]
+        elif isinstance(rate, str) and rate in TSquaredCalculator.GROWTH_COEFFICIENTS:
+            alpha[i] = TSquaredCalculator.GROWTH_COEFFICIENTS[rate]
+        else:
+            alpha[i] = np.nan
+            check.reject(i, f"Invalid growth rate: {rate}")
+
+    # Perform calculation; unknown modes report 0 like the single-item route always has
+    result_si = np.zeros(len(items))
+    modes = {
+        'heatRelease': lambda: TSquaredCalculator.calculate_hrr_batch(alpha, time),
+        'time': lambda: TSquaredCalculator.calculate_time_batch(alpha, hrr),
+    }
+    for name, calculate in modes.items():
+        rows = mode == name
+        if rows.any():
+            result = calculate()
+            check.absorb(result, where=rows)
+            result_si[rows] = result.values[rows]
+
+    # Convert final result back to imperial if needed (time is always in seconds)
+    final_value = T_SQUARED_GROWTH_UNITS.outputs['heatRelease'].from_si(result_si, imperial & (mode == 'heatRelease'))
+    return _respond(check, {"value": final_value})
+
+
+def heat_release(items: list) -> list:
+    check = MaskedValidator(len(items))
+    material_key = _field(items, 'material')
+    area = _column(items, 'burningArea', check)
+    # Mass flux is always provided in g/m²-s from the frontend; NaN means "use the database"
+    manual_mass_flux = np.full(len(items), np.nan)
+    for i, data in enumerate(items):
+        value = data.get('manualMassFlux')
+        try:
+            if value:
+                manual_mass_flux[i] = float(value)
+        except (TypeError, ValueError) as e:
+            check.reject(i, str(e))
+    imperial = _imperial(items)
+
+    # Convert area input to SI
+    area = HEAT_RELEASE_UNITS.to_si(imperial, {'burningArea': area})['burningArea']
+
+    # Perform calculation in SI
+    result = HeatReleaseCalculator.calculate_hrr_batch(material_key, area, manual_mass_flux)
+    check.absorb(result)
+
+    # Convert output if necessary
+    return _respond(check, HEAT_RELEASE_UNITS.from_si(imperial, {"value": result.values}))
+
+
+HANDLERS = {
+    'rectangular_area_volume': rectangular_area_volume,
+    'flashover': flashover,
+    'flame_height': flame_height,
+    'point_source_radiation': point_source_radiation,
+    't_squared_growth': t_squared_growth,
+    'heat_release': heat_release,
+}
+
+# Payload fields each handler parses as plain numbers with _column, so that 4, 4.0
+# and "4" are the same input. Material keys and manualMassFlux (where "0" and 0
+# mean different things) are not numeric fields.
+NUMERIC_INPUTS = {
+    'rectangular_area_volume': ('length', 'width', 'height'),
+    'flashover': tuple(FLASHOVER_UNITS.inputs),
+    'flame_height': tuple(FLAME_HEIGHT_UNITS.inputs),
+    'point_source_radiation': ('heatRelease', 'distance', 'radiativeFraction'),
+    't_squared_growth': ('time', 'heatRelease', 'customAlpha'),
+    'heat_release': ('burningArea',),
+}
+
+# Result keys each handler produces for a successful row
+OUTPUTS = {
+    'rectangular_area_volume': ('total_surface_area', 'floor_area', 'wall_area', 'volume'),
+    'flashover': ('mqh', 'thomas', 'babrauskas'),
+    'flame_height': ('value',),
+    'point_source_radiation': ('value',),
+    't_squared_growth': ('value',),
+    'heat_release': ('value',),
+}
+
+
+def evaluate(calculator: str, items: list) -> list:
+    """
+    Runs one handler over a list of payloads, rejecting payloads that are not
+    JSON objects without letting them reach the handler.
+    """
+    results = [None] * len(items)
+    valid = [i for i, data in enumerate(items) if isinstance(data, dict)]
+    for i in range(len(items)):
+        if not isinstance(items[i], dict):
+            results[i] = {"error": "Each item must be a JSON object"}
+    if valid:
+        for i, result in zip(valid, HANDLERS[calculator]([items[i] for i in valid])):
+            results[i] = result
+    return results
+
+
+def evaluate_batch(items: list) -> list:
+    """
+    Evaluates a heterogeneous list of payloads, each tagged with a "calculator"
+    key naming one of HANDLERS. Items are grouped per calculator so each group
+    runs as one vectorized call, and results come back in the original order.
+    """
+    results = [None] * len(items)
+    groups = {}
+    for i, data in enumerate(items):
+        calculator = data.get('calculator') if isinstance(data, dict) else None
+        if isinstance(calculator, str) and calculator in HANDLERS:
+            groups.setdefault(calculator, []).append(i)
+        elif not isinstance(data, dict):
+            results[i] = {"error": "Each item must be a JSON object"}
+        else:
+            results[i] = {"error": f"Unknown calculator: {calculator}"}
+
+    for calculator, indices in groups.items():
+        for i, result in zip(indices, HANDLERS[calculator]([items[i] for i in indices])):
+            results[i] = result
+    return results
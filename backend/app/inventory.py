@@ -0,0 +1,266 @@
+# backend/app/inventory.py
+"""
+Fire load of building surveys, aggregated from per-item inventories.
+
+A survey lists every item with its material key, mass and the room, floor
+and building it sits in, often millions of rows. FireLoadInventory consumes
+those rows a chunk at a time: the chunk's heats of combustion are gathered
+from MaterialProperties.fuel_table() in one lookup, its rows are grouped by
+room with np.unique, and masses and energies are summed per room with
+np.bincount into running totals. Only one chunk of rows and one total per
+room are ever held, so memory grows with the number of rooms and not with
+the number of items. Floor and building totals are rolled up from the room
+totals when they are asked for.
+"""
+
+from itertools import islice
+
+import numpy as np
+
+from .calculations.fire_load import FireLoadCalculator
+from .calculations.material_properties import MaterialProperties
+from .streaming import RowError
+from .utils.batch import BatchResult, MaskedValidator
+
+# Grouping levels, outermost first; a group at each level is keyed by its prefix
+LEVELS = ('building', 'floor', 'room')
+# Rows gathered per vectorized chunk by add_rows
+INVENTORY_CHUNK_ROWS = 65536
+
+
+class FireLoadInventory:
+    """
+    Running fire load totals per room of an item inventory.
+
+    Items are added with `add` (column arrays) or `add_rows` (an iterator of
+    row dicts, e.g. from streaming.iter_csv_rows). Rows with an unknown
+    material or a mass that is not a positive number are left out of the
+    totals and counted in `errors`. Energies are in MJ, masses in kg and
+    areas in m².
+    """
+
+    def __init__(self, table=None):
+        """
+        Args:
+            table: MaterialTable with heat_of_combustion (MJ/kg); the current
+                fuel table of MaterialProperties by default
+        """
+        self.table = table
+        self.rows = 0
+        # Message -> [rows rejected with it, number of the first such row]
+        self.errors = {}
+        # (building, floor, room) -> index into the running totals
+        self._groups = {}
+        self._items = np.zeros(0, dtype=np.int64)
+        self._mass = np.zeros(0)
+        self._energy = np.zeros(0)
+        self._area = np.zeros(0)
+
+    def __len__(self) -> int:
+        """Number of rooms seen so far."""
+        return len(self._groups)
+
+    def add(self, materials, masses, rooms, floors='', buildings='') -> BatchResult:
+        """
+        Adds one chunk of items given as columns. Floors and buildings may be
+        single labels shared by the whole chunk.
+
+        Returns:
+            BatchResult of each item's energy (MJ), with the rejected items flagged
+        """
+        masses = np.ravel(np.asarray(masses, dtype=float))
+        return self._add(materials, masses, rooms, floors, buildings,
+                         np.arange(self.rows, self.rows + masses.size))
+
+    def add_rows(self, rows, chunk_rows: int = INVENTORY_CHUNK_ROWS) -> None:
+        """
+        Consumes an iterator of row dicts, `chunk_rows` at a time. Item rows have
+        'material', 'mass' and 'room' keys and optionally 'floor' and 'building';
+        rows with an 'area' and no material set that room's floor area instead.
+        Unparseable rows (streaming.RowError) are counted as errors with their
+        message, rows that are not objects as "Each row must be a JSON object",
+        and rows whose room, floor or building is a list or object as
+        "Room, floor and building must be single labels".
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                return
+            start = self.rows
+            items, item_numbers, areas, area_numbers = [], [], [], []
+            for number, row in enumerate(chunk, start):
+                if isinstance(row, RowError):
+                    self._reject(row.message, 1, number)
+                elif not isinstance(row, dict):
+                    self._reject("Each row must be a JSON object", 1, number)
+                elif any(isinstance(row.get(level), (list, dict)) for level in LEVELS):
+                    self._reject("Room, floor and building must be single labels", 1, number)
+                elif row.get('material') in (None, '') and row.get('area') not in (None, ''):
+                    areas.append(row)
+                    area_numbers.append(number)
+                else:
+                    items.append(row)
+                    item_numbers.append(number)
+
+            if areas:
+                area = _numbers(areas, 'area')
+                valid = area > 0
+                if not valid.all():
+                    self._reject("Room area must be positive", int(np.count_nonzero(~valid)),
+                                 area_numbers[int(np.argmin(valid))])
+                areas = [row for row, ok in zip(areas, valid.tolist()) if ok]
+                rooms, floors, buildings = _columns(areas, 'room', 'floor', 'building')
+                self.set_areas(rooms, area[valid], floors, buildings)
+            self._add(*_columns(items, 'material'), _numbers(items, 'mass'),
+                      *_columns(items, 'room', 'floor', 'building'), np.array(item_numbers, dtype=np.int64))
+            self.rows = start + len(chunk)
+
+    def set_areas(self, rooms, areas, floors='', buildings='') -> None:
+        """
+        Sets the floor area of rooms (m²). Floors and buildings get the sum of
+        their rooms' areas; a room may be given an area before or without items.
+        """
+        areas, rooms = (np.ravel(v) for v in np.broadcast_arrays(np.asarray(areas, dtype=float), rooms))
+        if np.any(~(areas > 0)):
+            raise ValueError("Room areas must be positive")
+        groups = self._group(*_labels(areas.size, buildings, floors, rooms))
+        self._area[groups] = areas
+
+    def totals(self, level: str = 'room') -> dict:
+        """
+        Totals per group at one level.
+
+        Args:
+            level: 'room', 'floor' or 'building'
+
+        Returns:
+            Dictionary containing:
+                - building, floor, room: Labels of each group, down to `level`
+                - items: Number of items
+                - mass: Total mass (kg)
+                - energy: Total energy content (MJ)
+                - floor_area: Floor area (m²), NaN unless every room has one
+                - fire_load_density: BatchResult of energy per floor area (MJ/m²)
+        """
+        if level not in LEVELS:
+            raise ValueError(f"Level must be one of {', '.join(LEVELS)}")
+        depth = LEVELS.index(level) + 1
+        count = len(self._groups)
+        keys = list(self._groups)
+        if depth == len(LEVELS):
+            labels, groups = keys, np.arange(count)
+        else:
+            prefixes = {}
+            groups = np.array([prefixes.setdefault(key[:depth], len(prefixes)) for key in keys], dtype=np.intp)
+            labels = list(prefixes)
+        size = len(labels)
+
+        def total(weights):
+            # bincount of no groups gives an integer array even with float weights
+            return np.bincount(groups, weights, size).astype(float, copy=False)
+
+        area = self._area[:count]
+        missing = total(np.isnan(area)) > 0
+        floor_area = total(np.nan_to_num(area))
+        floor_area[missing] = np.nan
+        energy = total(self._energy[:count])
+        totals = {name: [label[i] for label in labels] for i, name in enumerate(LEVELS[:depth])}
+        totals.update({
+            'items': np.bincount(groups, self._items[:count], size).astype(np.int64),
+            'mass': total(self._mass[:count]),
+            'energy': energy,
+            'floor_area': floor_area,
+            'fire_load_density': FireLoadCalculator.calculate_fire_load_density_batch(energy, floor_area),
+        })
+        return totals
+
+    def _add(self, materials, masses, rooms, floors, buildings, numbers: np.ndarray) -> BatchResult:
+        check = MaskedValidator(masses.shape)
+        check.require(np.isfinite(masses) & (masses > 0), "Mass must be a positive number")
+        table = self.table if self.table is not None else MaterialProperties.fuel_table()
+        materials = np.broadcast_to(np.asarray(materials, dtype=str), masses.shape)
+        heat = table.take('heat_of_combustion', table.lookup(materials, check), check,
+                          "Material '{key}' has no heat of combustion")
+        energy = masses * heat
+
+        ok = check.ok
+        labels = _labels(masses.size, buildings, floors, rooms)
+        if not ok.all():
+            labels = (label[ok] for label in labels)
+        groups = self._group(*labels)
+        size = len(self._groups)
+        self._items[:size] += np.bincount(groups, minlength=size)
+        self._mass[:size] += np.bincount(groups, masses[ok], size)
+        self._energy[:size] += np.bincount(groups, energy[ok], size)
+
+        codes = check.codes
+        for code, message in enumerate(check.messages, 1):
+            flagged = np.flatnonzero(codes == code)
+            if flagged.size:
+                self._reject(message, flagged.size, int(numbers[flagged[0]]))
+        self.rows += masses.size
+        return check.result(energy)
+
+    def _group(self, buildings: np.ndarray, floors: np.ndarray, rooms: np.ndarray) -> np.ndarray:
+        """Running-total index of every row, adding groups not seen before."""
+        if not rooms.size:
+            return np.zeros(0, dtype=np.intp)
+        # Group on integer codes of the three label columns instead of on tuples of strings
+        code = np.zeros(rooms.size, dtype=np.int64)
+        for column in (buildings, floors, rooms):
+            # A label shared by the whole chunk needs no sort
+            if any(column.strides):
+                unique, inverse = np.unique(column, return_inverse=True)
+                code = code * unique.size + inverse.ravel()
+        _, first, inverse = np.unique(code, return_index=True, return_inverse=True)
+        ids = np.array([
+            self._groups.setdefault((str(buildings[i]), str(floors[i]), str(rooms[i])), len(self._groups))
+            for i in first.tolist()
+        ], dtype=np.intp)
+        self._reserve(len(self._groups))
+        return ids[inverse.ravel()]
+
+    def _reserve(self, size: int) -> None:
+        # Grow the running totals geometrically, so adding rooms is amortized O(1)
+        capacity = self._mass.size
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        for name, fill in (('_items', 0), ('_mass', 0.0), ('_energy', 0.0), ('_area', np.nan)):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:old.size] = old
+            setattr(self, name, new)
+
+    def _reject(self, message: str, count: int, row: int) -> None:
+        entry = self.errors.setdefault(message, [0, row])
+        entry[0] += count
+        entry[1] = min(entry[1], row)
+
+
+def _labels(size: int, buildings, floors, rooms) -> tuple:
+    """Building, floor and room labels as string arrays of `size` rows; missing labels are ''."""
+    def column(values):
+        values = np.asarray(values)
+        if values.dtype.kind != 'U':
+            values = values.astype(object)
+            values = np.where(np.equal(values, None), '', values).astype(str)
+        return np.broadcast_to(values, (size,))
+    return column(buildings), column(floors), column(rooms)
+
+
+def _columns(rows: list, *keys) -> list:
+    """One list per key of the values of row dicts, None where a key is missing."""
+    return [[row.get(key) for row in rows] for key in keys]
+
+
+def _numbers(rows: list, key: str) -> np.ndarray:
+    """One numeric field of row dicts, NaN where it is missing or not a number."""
+    values = np.empty(len(rows))
+    for i, row in enumerate(rows):
+        try:
+            values[i] = float(row.get(key))
+        except (TypeError, ValueError):
+            values[i] = np.nan
+    return values
@@ -0,0 +1,179 @@
+# backend/app/inverse.py
+"""
+Batched inverse solving for the registered correlations.
+
+Any calculator registered with the runner can be solved for any one of its
+numeric inputs, given a target for one of its outputs and the other inputs:
+"what HRR gives a 500 °C hot layer", "what opening area keeps the flashover HRR
+above 2 MW". Thousands of targets are solved together: each step calls the
+calculator's `_batch` method once on every row still being solved.
+
+Each row is first bracketed by scanning a grid over `bracket`, taking the
+first interval where the output crosses the target, and then refined with
+Chandrupatla's method, a vectorizable relative of Brent's method that mixes
+inverse quadratic interpolation with bisection and needs no derivatives.
+"""
+
+import numpy as np
+
+from .runner import CALCULATORS, bind_inputs
+from .utils.batch import BatchResult, MaskedValidator
+
+# Default search range of the unknown and the number of scan points in it
+DEFAULT_BRACKET = (1e-6, 1e9)
+SCAN_POINTS = 64
+# Rows × scan points evaluated per calculator call while bracketing
+SCAN_BLOCK = 1 << 20
+
+
+def solve_inverse(calculator: str, unknown: str, target, inputs: dict, output: str = 'value',
+                  bracket: tuple = DEFAULT_BRACKET, rtol: float = 1e-10, maxiter: int = 100) -> BatchResult:
+    """
+    Solves `calculator` for the input `unknown` so that `output` equals `target`.
+
+    Args:
+        calculator: A name registered with runner.register_calculator
+        unknown: The input to solve for
+        target: Target output value(s), in the calculator's (SI) units
+        inputs: Every other input; inputs with a default in the `_batch`
+            method may be left out. Targets and inputs broadcast together.
+        output: Output name for calculators with several outputs
+        bracket: (low, high) range searched for the unknown. The scan is
+            logarithmic for a positive low end and linear otherwise.
+        rtol: Relative tolerance on the unknown
+        maxiter: Iteration limit of the refinement
+
+    Returns:
+        BatchResult of the unknown, shaped like the broadcast targets. When several
+        values reach the target, the smallest one found by the scan is returned.
+        Rows whose other inputs are invalid carry the calculator's error message.
+    """
+    calculate, known, outputs = bind_inputs(calculator, inputs, exclude=(unknown,))
+    if unknown not in CALCULATORS[calculator][1]:
+        raise ValueError(f"{calculator} has no input '{unknown}'")
+    if output not in outputs:
+        raise ValueError(f"{calculator} has no output '{output}'")
+    low, high = bracket
+    if not low < high:
+        raise ValueError("Bracket must be an increasing (low, high) pair")
+
+    columns = np.broadcast_arrays(np.asarray(target, dtype=float), *(np.asarray(inputs[name]) for name in known))
+    shape = columns[0].shape
+    target = columns[0].ravel()
+    known = {name: column.ravel() for name, column in zip(known, columns[1:])}
+    n = target.size
+
+    def residual(x: np.ndarray, rows: np.ndarray) -> tuple:
+        result = calculate(**{name: column[rows] for name, column in known.items()}, **{unknown: x})
+        if not isinstance(result, BatchResult):
+            result = result[output]
+        return result.values - target[rows], result
+
+    check = MaskedValidator(n)
+    check.require(np.isfinite(target), "Target must be a finite number")
+
+    a, fa, b, fb = _scan(residual, check, np.flatnonzero(check.ok), low, high)
+    check.require(~np.isnan(a), f"No {unknown} between {low:g} and {high:g} reaches the target")
+
+    solution = np.where(fa == 0, a, np.where(fb == 0, b, np.nan))
+    rows = np.flatnonzero(check.ok & np.isnan(solution))
+    unresolved = _refine(residual, check, solution, rows, a[rows], fa[rows], b[rows], fb[rows], rtol, maxiter)
+    flags = np.zeros(n, dtype=bool)
+    flags[unresolved] = True
+    check.require(~flags, f"Solving for {unknown} did not converge")
+
+    result = check.result(solution)
+    return BatchResult(result.values.reshape(shape), result.codes.reshape(shape), result.messages)
+
+
+def _absorb_rows(check: MaskedValidator, rows: np.ndarray, codes: np.ndarray, messages: tuple) -> None:
+    """Flags `rows` of `check` with the calculator messages their `codes` point at."""
+    for code, message in enumerate(messages, start=1):
+        flagged = np.zeros(check.codes.size, dtype=bool)
+        flagged[rows[codes == code]] = True
+        check.require(~flagged, message)
+
+
+def _scan(residual, check: MaskedValidator, rows: np.ndarray, low: float, high: float) -> tuple:
+    """
+    Brackets every row by evaluating the residual on a grid over [low, high].
+    Returns (a, f(a), b, f(b)) per row, NaN where the residual never changes sign.
+    """
+    n = check.codes.size
+    grid = np.geomspace(low, high, SCAN_POINTS) if low > 0 else np.linspace(low, high, SCAN_POINTS)
+    a, fa, b, fb = (np.full(n, np.nan) for _ in range(4))
+    block = max(1, SCAN_BLOCK // SCAN_POINTS)
+
+    for start in range(0, rows.size, block):
+        chunk = rows[start:start + block]
+        f, result = residual(np.tile(grid, chunk.size), np.repeat(chunk, SCAN_POINTS))
+        f = f.reshape(chunk.size, SCAN_POINTS)
+
+        # First grid interval whose ends are valid and on opposite sides of the target
+        with np.errstate(invalid='ignore'):
+            crossing = np.sign(f[:, :-1]) * np.sign(f[:, 1:]) <= 0
+        found = crossing.any(axis=1)
+        k = crossing.argmax(axis=1)[found]
+        hit = chunk[found]
+        a[hit], b[hit] = grid[k], grid[k + 1]
+        fa[hit], fb[hit] = f[found, k], f[found, k + 1]
+
+        # Rows the calculator rejects everywhere get its error message
+        codes = result.codes.reshape(chunk.size, SCAN_POINTS)
+        rejected = (codes != 0).all(axis=1)
+        _absorb_rows(check, chunk[rejected], codes[rejected, 0], result.messages)
+    return a, fa, b, fb
+
+
+def _refine(residual, check: MaskedValidator, solution: np.ndarray, rows: np.ndarray,
+            x1: np.ndarray, f1: np.ndarray, x2: np.ndarray, f2: np.ndarray,
+            rtol: float, maxiter: int) -> np.ndarray:
+    """
+    Chandrupatla's method on the bracketed rows, writing converged roots into
+    `solution`. Returns the rows that had not converged after `maxiter` steps,
+    and those whose residual turned NaN without a calculator error.
+    """
+    failed = []
+    t = np.full(rows.size, 0.5)
+    x3, f3 = x2, f2
+    tiny = np.finfo(float).tiny
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+            if not rows.size:
+                break
+            xt = x1 + t * (x2 - x1)
+            ft, result = residual(xt, rows)
+
+            # The calculator rejected a point inside the bracket; a NaN it did not
+            # flag (e.g. an overflow) cannot be refined either and is not a root
+            rejected = np.isnan(ft)
+            if rejected.any():
+                _absorb_rows(check, rows[rejected], result.codes[rejected], result.messages)
+                failed.append(rows[rejected & (result.codes == 0)])
+
+            same = np.sign(ft) == np.sign(f1)
+            x3, f3 = np.where(same, x1, x2), np.where(same, f1, f2)
+            x2, f2 = np.where(same, x2, x1), np.where(same, f2, f1)
+            x1, f1 = xt, ft
+
+            closer = np.abs(f1) < np.abs(f2)
+            xm, fm = np.where(closer, x1, x2), np.where(closer, f1, f2)
+            tl = (2 * rtol * np.abs(xm) + tiny) / np.abs(x2 - x1)
+            done = ((tl > 0.5) | (fm == 0)) & ~rejected
+            solution[rows[done]] = xm[done]
+
+            keep = ~done & ~rejected
+            rows, t, tl = rows[keep], t[keep], tl[keep]
+            x1, f1, x2, f2, x3, f3 = (v[keep] for v in (x1, f1, x2, f2, x3, f3))
+
+            # Inverse quadratic interpolation when it stays inside the bracket, else bisection
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            interpolate = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+            t = np.where(
+                interpolate,
+                f1 / (f2 - f1) * f3 / (f2 - f3) + (x3 - x1) / (x2 - x1) * f1 / (f3 - f1) * f2 / (f3 - f2),
+                0.5,
+            )
+            t = np.clip(t, tl, 1 - tl)
+    return np.concatenate([rows] + failed)
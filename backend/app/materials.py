@@ -0,0 +1,93 @@
+# backend/app/materials.py
+"""
+Pre-serialized fuel listing behind /api/materials.
+
+Every fuel's JSON fragment is rendered once when the catalog is built, and so
+are the full listing body and its ETag. A filtered or paged listing is the
+matching fragments joined together; the filters run on the table's columns.
+Recent queries are kept with their bodies and ETags. The catalog is rebuilt
+automatically when MaterialProperties switches to another fuel table.
+"""
+
+import json
+from functools import lru_cache
+
+import numpy as np
+
+from .cache import etag_for
+from .calculations.material_properties import MaterialProperties
+
+
+class MaterialCatalog:
+    """Searchable, pre-serialized view of a fuel MaterialTable, ordered by key."""
+
+    _current = None
+
+    def __init__(self, table):
+        self.table = table
+        keys = np.asarray(table.keys, dtype=str)
+        order = np.argsort(keys, kind='stable')
+        self._keys = np.char.lower(keys[order])
+        self._names = np.char.lower(np.asarray(table.names, dtype=str)[order])
+        # A table without a column (e.g. a database with no mass fluxes) has no values for it
+        missing = np.full(len(table) + 1, np.nan)
+        self._heat_of_combustion = np.asarray(table.columns.get('heat_of_combustion', missing)[:-1])[order]
+        self._mass_flux = np.asarray(table.columns.get('mass_flux', missing)[:-1])[order]
+        self._fragments = [
+            (json.dumps(str(key)) + ':' + json.dumps(table.row(key), sort_keys=True, separators=(',', ':'))).encode()
+            for key in keys[order].tolist()
+        ]
+        self.body = self._serialize(range(len(self._fragments)))
+        self.etag = etag_for(self.body)
+        self.page = lru_cache(maxsize=256)(self._page)
+
+    @staticmethod
+    def current() -> 'MaterialCatalog':
+        """The catalog of the fuel table MaterialProperties currently serves."""
+        table = MaterialProperties.fuel_table()
+        catalog = MaterialCatalog._current
+        if catalog is None or catalog.table is not table:
+            catalog = MaterialCatalog._current = MaterialCatalog(table)
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def _serialize(self, positions) -> bytes:
+        return b'{' + b','.join(self._fragments[i] for i in positions) + b'}'
+
+    def select(self, prefix: str = None, has_mass_flux: bool = None, min_hoc: float = None,
+               max_hoc: float = None) -> np.ndarray:
+        """
+        Positions of the fuels whose key or name starts with `prefix` (any case),
+        that do or do not have a mass flux, with a heat of combustion (MJ/kg)
+        within [min_hoc, max_hoc].
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if prefix:
+            prefix = prefix.lower()
+            selected &= np.char.startswith(self._keys, prefix) | np.char.startswith(self._names, prefix)
+        if has_mass_flux is not None:
+            selected &= np.isnan(self._mass_flux) != has_mass_flux
+        if min_hoc is not None:
+            selected &= self._heat_of_combustion >= min_hoc
+        if max_hoc is not None:
+            selected &= self._heat_of_combustion <= max_hoc
+        return np.flatnonzero(selected)
+
+    def _page(self, prefix=None, has_mass_flux=None, min_hoc=None, max_hoc=None,
+              offset: int = 0, limit: int = None) -> tuple:
+        """
+        Returns (body, etag) of a listing. Without a `limit` the body is the
+        {key: fuel} mapping; with one it is a page,
+        {"total": ..., "offset": ..., "limit": ..., "materials": {key: fuel}}.
+        """
+        if (prefix, has_mass_flux, min_hoc, max_hoc, limit) == (None, None, None, None, None) and not offset:
+            return self.body, self.etag
+        positions = self.select(prefix, has_mass_flux, min_hoc, max_hoc)
+        total = positions.size
+        positions = positions[offset:] if limit is None else positions[offset:offset + limit]
+        body = self._serialize(positions.tolist())
+        if limit is not None:
+            body = b'{"limit":%d,"materials":%s,"offset":%d,"total":%d}' % (limit, body, offset, total)
+        return body, etag_for(body)
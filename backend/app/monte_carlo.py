@@ -0,0 +1,208 @@
+# backend/app/monte_carlo.py
+"""
+Monte Carlo uncertainty analysis over the flashover and temperature correlations.
+
+Room and opening dimensions, the wall lining (a THERMAL_PROPERTIES key) and the
+fuel (a FUELS key) are drawn from distributions, N samples at a time in chunks.
+Each chunk is evaluated with the calculators' `_batch` methods and folded into
+streaming accumulators (moments, quantile sketches, exceedance counts), then
+discarded, so memory depends on the chunk size rather than on N.
+
+Runs are reproducible: every chunk draws from its own stream spawned from the
+seed, so the same seed and chunk size always give the same samples.
+"""
+
+import numpy as np
+
+from .calculations.flashover import FlashoverCalculator
+from .calculations.heat_release import HeatReleaseCalculator
+from .calculations.material_properties import MaterialProperties
+from .calculations.temperature_rise import TemperatureRiseCalculator
+from .utils.batch import MaskedValidator
+from .utils.sketch import QuantileSketch, RunningMoments
+
+# Sampled inputs, all SI. Either 'hrr' (kW) or 'fuel' with 'burning_area' (m²) sets the fire.
+INPUTS = (
+    'room_length', 'room_width', 'room_height', 'opening_width', 'opening_height',
+    'wall_material', 'fuel', 'burning_area', 'hrr',
+)
+DEFAULTS = {'wall_material': 'gypsum_board'}
+
+# Reported outputs: flashover HRRs (kW), fire HRR (kW), MQH temperature rise (°C),
+# and the fire HRR as a fraction of the MQH flashover HRR (flashover when >= 1)
+OUTPUTS = ('mqh', 'thomas', 'babrauskas', 'hrr', 'temperature_rise', 'flashover_ratio')
+
+
+# --- Sampling ---
+
+def _sample(spec, rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    Draws n values for one input. `spec` is a constant, or a tuple naming a
+    distribution: ('uniform', low, high), ('normal', mean, std),
+    ('lognormal', mean, sigma) of the underlying normal,
+    ('triangular', left, mode, right) or ('choice', options[, probabilities]).
+    """
+    if not isinstance(spec, (tuple, list)):
+        return np.full(n, spec, dtype=object if isinstance(spec, str) else float)
+    kind, *args = spec
+    if kind == 'uniform':
+        return rng.uniform(*args, size=n)
+    if kind == 'normal':
+        return rng.normal(*args, size=n)
+    if kind == 'lognormal':
+        return rng.lognormal(*args, size=n)
+    if kind == 'triangular':
+        return rng.triangular(*args, size=n)
+    if kind == 'choice':
+        options, probabilities = args[0], (args[1] if len(args) > 1 else None)
+        return np.asarray(options)[rng.choice(len(options), size=n, p=probabilities)]
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+def _validate_distributions(distributions: dict) -> dict:
+    unknown = set(distributions) - set(INPUTS)
+    if unknown:
+        raise ValueError(f"Unknown inputs: {', '.join(sorted(unknown))}")
+    missing = [name for name in INPUTS[:5] if name not in distributions]
+    if missing:
+        raise ValueError(f"Missing distributions for: {', '.join(missing)}")
+    if 'hrr' not in distributions and not {'fuel', 'burning_area'} <= set(distributions):
+        raise ValueError("Either 'hrr' or both 'fuel' and 'burning_area' must be given")
+    return dict(DEFAULTS, **distributions)
+
+
+# --- Evaluation ---
+
+def evaluate_samples(columns: dict) -> tuple:
+    """
+    Evaluates one chunk of samples. Returns (MaskedValidator, outputs) where every
+    output is an array over the chunk and a sample is valid only if every
+    correlation accepted it.
+    """
+    n = len(columns['room_length'])
+    check = MaskedValidator(n)
+    length, width, height = columns['room_length'], columns['room_width'], columns['room_height']
+    wall = columns['wall_material'].astype(str)
+
+    At = 2 * (length * width + length * height + width * height)
+    A0 = columns['opening_width'] * columns['opening_height']
+    H0 = columns['opening_height']
+
+    mqh = FlashoverCalculator.mccaffrey_correlation_batch(At, A0, H0, wall)
+    thomas = FlashoverCalculator.thomas_correlation_batch(At, A0, H0)
+    babrauskas = FlashoverCalculator.babrauskas_correlation_batch(A0, H0)
+    for result in (mqh, thomas, babrauskas):
+        check.absorb(result)
+
+    if 'hrr' in columns:
+        Q = np.asarray(columns['hrr'], dtype=float)
+    else:
+        fire = HeatReleaseCalculator.calculate_hrr_batch(columns['fuel'].astype(str), columns['burning_area'])
+        check.absorb(fire)
+        Q = fire.values
+
+    # Same wall heat transfer coefficient the MQH flashover correlation uses
+    hk = MaterialProperties.thermal_table().gather(wall, 'conductivity', check)
+    temperature = TemperatureRiseCalculator.calculate_mqh_temperature_batch(Q, A0, H0, At, hk)
+    check.absorb(temperature)
+
+    return check, {
+        'mqh': mqh.values,
+        'thomas': thomas.values,
+        'babrauskas': babrauskas.values,
+        'hrr': Q,
+        'temperature_rise': temperature.values,
+        'flashover_ratio': Q / mqh.values,
+    }
+
+
+class _OutputSummary:
+    """Streaming accumulators for one output."""
+
+    def __init__(self, thresholds, relative_accuracy: float):
+        self.moments = RunningMoments()
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.thresholds = np.asarray(thresholds, dtype=float)
+        self.exceedances = np.zeros(self.thresholds.size, dtype=np.int64)
+
+    def add(self, values: np.ndarray) -> None:
+        self.moments.add(values)
+        self.sketch.add(values)
+        if self.thresholds.size:
+            self.exceedances += (values[:, None] > self.thresholds).sum(axis=0)
+
+    def report(self, percentiles) -> dict:
+        count = self.moments.count
+        return {
+            'mean': self.moments.mean if count else None,
+            'std': self.moments.std if count > 1 else None,
+            'min': self.moments.min if count else None,
+            'max': self.moments.max if count else None,
+            'percentiles': dict(zip(
+                percentiles, self.sketch.quantiles(np.asarray(percentiles, dtype=float) / 100).tolist()
+            )) if count else {p: None for p in percentiles},
+            'exceedance': {
+                threshold: (exceeded / count if count else None)
+                for threshold, exceeded in zip(self.thresholds.tolist(), self.exceedances.tolist())
+            },
+        }
+
+
+def run_monte_carlo(distributions: dict, samples: int, seed=None, chunk_size: int = 100000,
+                    percentiles=(5, 50, 95), exceedance: dict = None,
+                    relative_accuracy: float = 0.005) -> dict:
+    """
+    Draws `samples` scenarios from `distributions` (input name -> constant or
+    distribution tuple, see _sample) and summarizes every output.
+
+    Args:
+        seed: Seed for reproducible runs (None for fresh entropy)
+        chunk_size: Samples drawn and evaluated per vectorized chunk
+        percentiles: Percentiles (0-100) to report for every output
+        exceedance: Output name -> thresholds; reports P(output > threshold).
+            Defaults to the flashover probability, P(flashover_ratio > 1).
+        relative_accuracy: Relative error bound of the reported percentiles
+
+    Returns:
+        Dictionary containing:
+            - samples: number of samples drawn
+            - valid: number of samples every correlation accepted
+            - errors: error message -> number of rejected samples
+            - outputs: output name -> mean, std, min, max, percentiles, exceedance
+    """
+    if samples < 1 or chunk_size < 1:
+        raise ValueError("Samples and chunk size must be positive")
+    distributions = _validate_distributions(distributions)
+    if exceedance is None:
+        exceedance = {'flashover_ratio': [1.0]}
+    unknown = set(exceedance) - set(OUTPUTS)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {', '.join(sorted(unknown))}")
+
+    summaries = {name: _OutputSummary(exceedance.get(name, ()), relative_accuracy) for name in OUTPUTS}
+    errors = {}
+    # Child streams are spawned one chunk at a time; SeedSequence numbers its
+    # children, so they match a single up-front spawn
+    root = np.random.SeedSequence(seed)
+
+    for start in range(0, samples, chunk_size):
+        n = min(chunk_size, samples - start)
+        rng = np.random.default_rng(root.spawn(1)[0])
+        columns = {name: _sample(spec, rng, n) for name, spec in distributions.items()}
+        check, outputs = evaluate_samples(columns)
+
+        ok = check.ok
+        for name, values in outputs.items():
+            summaries[name].add(values[ok])
+        for code, count in enumerate(np.bincount(check.codes, minlength=len(check.messages) + 1)[1:].tolist(), 1):
+            if count:
+                message = check.messages[code - 1]
+                errors[message] = errors.get(message, 0) + count
+
+    valid = summaries['mqh'].moments.count
+    return {
+        'samples': samples,
+        'valid': valid,
+        'errors': errors,
+        'outputs': {name: summary.report(percentiles) for name, summary in summaries.items()},
+    }
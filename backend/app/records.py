@@ -0,0 +1,216 @@
+# backend/app/records.py
+"""
+Typed input and result records for the registered calculators.
+
+Every calculator in runner.CALCULATORS gets a pair of record classes, built
+once on first use from its input and output names:
+
+- an input record with one slot per input, parsed and type-checked once
+  when it is built, with the `_batch` method's defaults for omitted inputs;
+- a result record with one slot per output plus `error`.
+
+Slotted records carry no per-instance __dict__, so a request costs one small
+object instead of a dict of boxed values. For batch work each record class
+has a matching NumPy structured dtype: a list of records packs into one
+structured array, the calculator reads its columns as field views of that
+array (no per-column copies), and the results come back as a structured array
+of the outputs and error codes. Rows of either array unpack into records, so
+the scalar and batch paths share one representation.
+
+Records are a library API for the runner calculators (ScenarioRunner accepts
+their structured arrays). The HTTP routes in api.py do not use them: their
+payloads follow the frontend's schema (camelCase names, a unit system, mode
+fields) rather than the runner's SI inputs, and handlers.py already parses a
+whole list of payloads into NumPy columns in one pass.
+
+    records = calculator_records('natural_vent_flow')
+    inputs = records.Inputs(vent_height=2.0, vent_width=1.0, neutral_plane=1.0,
+                            temp_hot=300.0, temp_ambient=20.0)
+    records.evaluate(inputs).mass_flow_in
+    table, messages = records.evaluate_array(records.to_array([inputs] * 1000))
+"""
+
+import inspect
+
+import numpy as np
+
+from .runner import CALCULATORS
+from .utils.batch import BatchResult
+
+# Inputs that are material keys rather than numbers, and their fixed width in structured arrays
+TEXT_INPUTS = frozenset({'wall_material', 'material_key'})
+TEXT_WIDTH = 64
+
+_records = {}
+
+
+class Record:
+    """
+    Base of the generated record classes: fixed slots named by FIELDS, compared
+    and printed by value.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+
+    @classmethod
+    def _make(cls, values) -> 'Record':
+        """Builds a record from already typed values in FIELDS order, skipping parsing."""
+        record = object.__new__(cls)
+        for name, value in zip(cls.FIELDS, values):
+            object.__setattr__(record, name, value)
+        return record
+
+    def astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other.astuple() == self.astuple()
+
+    def __hash__(self) -> int:
+        return hash(self.astuple())
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.FIELDS)
+        return f'{type(self).__name__}({fields})'
+
+
+class InputRecord(Record):
+    """
+    Inputs of one calculator. Values are parsed once, on construction: numbers
+    to float and material keys to str. Inputs the `_batch` method has a default
+    for may be left out.
+    """
+
+    __slots__ = ()
+    DEFAULTS = {}
+
+    def __init__(self, **inputs):
+        unknown = [name for name in inputs if name not in self.FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown inputs: {', '.join(unknown)}")
+        missing = [name for name in self.FIELDS if name not in inputs and name not in self.DEFAULTS]
+        if missing:
+            raise ValueError(f"Missing inputs: {', '.join(missing)}")
+        for name in self.FIELDS:
+            object.__setattr__(self, name, _parse(name, inputs[name] if name in inputs else self.DEFAULTS[name]))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'InputRecord':
+        """Builds a record from a payload dict, ignoring keys that are not inputs."""
+        return cls(**{name: data[name] for name in cls.FIELDS if name in data})
+
+
+class ResultRecord(Record):
+    """Outputs of one calculation, NaN with `error` set when it failed."""
+
+    __slots__ = ()
+
+    def as_dict(self) -> dict:
+        """{"error": message} for a failed calculation, the outputs otherwise."""
+        if self.error is not None:
+            return {'error': self.error}
+        return {name: getattr(self, name) for name in self.FIELDS[:-1]}
+
+
+class CalculatorRecords:
+    """
+    The record classes and structured dtypes of one registered calculator.
+
+    Attributes:
+        Inputs, Result: The input and result record classes
+        input_dtype: Structured dtype of an input row (float64 per number, U64 per key)
+        result_dtype: Structured dtype of a result row, float64 per output and an
+            int32 'code' indexing into the messages returned alongside
+    """
+
+    __slots__ = ('name', 'Inputs', 'Result', 'input_dtype', 'result_dtype', '_calculate', '_outputs')
+
+    def __init__(self, name: str):
+        if name not in CALCULATORS:
+            raise ValueError(f"Unknown calculator: {name}")
+        calculate, inputs, outputs = CALCULATORS[name]
+        parameters = inspect.signature(calculate).parameters
+        defaults = {key: parameters[key].default for key in inputs
+                    if parameters[key].default is not inspect.Parameter.empty}
+        title = ''.join(part.title() for part in name.split('_'))
+
+        self.name = name
+        self._calculate = calculate
+        self._outputs = outputs
+        self.Inputs = type(f'{title}Inputs', (InputRecord,), {
+            '__slots__': inputs, 'FIELDS': inputs, 'DEFAULTS': defaults,
+            '__annotations__': {key: str if key in TEXT_INPUTS else float for key in inputs},
+        })
+        self.Result = type(f'{title}Result', (ResultRecord,), {
+            '__slots__': outputs + ('error',), 'FIELDS': outputs + ('error',),
+            '__annotations__': {**{key: float for key in outputs}, 'error': str},
+        })
+        self.input_dtype = np.dtype([(key, f'U{TEXT_WIDTH}' if key in TEXT_INPUTS else np.float64)
+                                     for key in inputs])
+        self.result_dtype = np.dtype([(key, np.float64) for key in outputs] + [('code', np.int32)])
+
+    def to_array(self, records) -> np.ndarray:
+        """Packs a sequence of input records into one structured array."""
+        return np.array([record.astuple() for record in records], dtype=self.input_dtype)
+
+    def from_array(self, table: np.ndarray, messages: tuple = None) -> list:
+        """
+        Unpacks a structured input array, or a result array and its messages,
+        into records without parsing them again.
+        """
+        rows = table.tolist()
+        if messages is None:
+            return [self.Inputs._make(row) for row in rows]
+        lookup = (None,) + tuple(messages)
+        return [self.Result._make(row[:-1] + (lookup[row[-1]],)) for row in rows]
+
+    def evaluate_array(self, table: np.ndarray) -> tuple:
+        """
+        Evaluates every row of a structured input array with one `_batch` call,
+        passing each input as a field view of `table`.
+
+        Returns:
+            (structured result array of table's shape, error messages its codes index into)
+        """
+        result = self._calculate(**{name: table[name] for name in self.input_dtype.names})
+        results = {'value': result} if isinstance(result, BatchResult) else result
+        out = np.empty(table.shape, dtype=self.result_dtype)
+        for name in self._outputs:
+            out[name] = results[name].values
+        # Every output of one calculation shares the same validation
+        first = results[self._outputs[0]]
+        out['code'] = first.codes
+        return out, first.messages
+
+    def evaluate(self, inputs: InputRecord) -> ResultRecord:
+        """Evaluates one input record through the same `_batch` method."""
+        if not isinstance(inputs, self.Inputs):
+            raise TypeError(f"Expected {self.Inputs.__name__}, got {type(inputs).__name__}")
+        table = np.array(inputs.astuple(), dtype=self.input_dtype)
+        out, messages = self.evaluate_array(table)
+        return self.from_array(out[np.newaxis], messages)[0]
+
+
+def calculator_records(name: str) -> CalculatorRecords:
+    """The memoized records of a registered calculator."""
+    records = _records.get(name)
+    if records is None or records._calculate is not CALCULATORS.get(name, (None,))[0]:
+        records = _records[name] = CalculatorRecords(name)
+    return records
+
+
+def _parse(name: str, value):
+    if name in TEXT_INPUTS:
+        if not isinstance(value, str):
+            raise ValueError(f"Input '{name}' must be a material key")
+        if len(value) > TEXT_WIDTH:
+            raise ValueError(f"Input '{name}' is longer than {TEXT_WIDTH} characters")
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Input '{name}' must be a number") from None
@@ -0,0 +1,279 @@
+# backend/app/runner.py
+"""
+Multiprocess scenario runner for large parameter sweeps.
+
+A scenario table is a dict of equal-length NumPy columns, one per input of a
+registered calculator. The runner copies the columns once into
+multiprocessing.shared_memory blocks, allocates the output columns there too,
+and hands each worker process only (start, stop) row ranges. Workers attach
+to the blocks, run the calculator's `_batch` method on NumPy views of their
+rows and write results in place, so no scenario data is pickled in either
+direction; only each chunk's short list of error messages comes back.
+"""
+
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .calculations.area_volume import AreaVolumeCalculator
+from .calculations.ceiling_jet import CeilingJetCalculator
+from .calculations.fire_load import FireLoadCalculator
+from .calculations.flame_height import FlameHeightCalculator
+from .calculations.flashover import FlashoverCalculator
+from .calculations.heat_release import HeatReleaseCalculator
+from .calculations.radiation import RadiationCalculator
+from .calculations.smoke_layer import SmokeLayerCalculator
+from .calculations.solid_flame import SolidFlameCalculator
+from .calculations.t_squared import TSquaredCalculator
+from .calculations.temperature_rise import TemperatureRiseCalculator
+from .calculations.vent_flow import VentFlowCalculator
+from .utils.batch import BatchResult
+
+# Number of worker processes and rows per task, overridable per runner
+RUNNER_WORKERS = int(os.environ.get('RUNNER_WORKERS', os.cpu_count() or 1))
+RUNNER_CHUNK_ROWS = int(os.environ.get('RUNNER_CHUNK_ROWS', 65536))
+
+# name -> (batch function, input keyword names, output names)
+CALCULATORS = {}
+
+
+def register_calculator(name: str, calculate, inputs: tuple, outputs: tuple = ('value',)) -> None:
+    """
+    Makes a `_batch` function available to the runner. It is called with one
+    keyword argument per input and must return a BatchResult (for a single
+    'value' output) or a dict of BatchResults keyed by the output names.
+
+    Register at import time of a module the workers also import, so the
+    calculator exists in worker processes under any start method.
+    """
+    CALCULATORS[name] = (calculate, tuple(inputs), tuple(outputs))
+
+
+def bind_inputs(calculator: str, inputs: dict, exclude: tuple = ()) -> tuple:
+    """
+    Checks `inputs` against a registered calculator. Inputs with a default in the
+    `_batch` method may be left out; names in `exclude` are supplied by the caller.
+
+    Returns:
+        (batch function, names of the inputs to pass from `inputs`, output names)
+    """
+    if calculator not in CALCULATORS:
+        raise ValueError(f"Unknown calculator: {calculator}")
+    calculate, names, outputs = CALCULATORS[calculator]
+    parameters = inspect.signature(calculate).parameters
+    given = [name for name in names if name not in exclude and (
+        name in inputs or parameters[name].default is inspect.Parameter.empty)]
+    missing = [name for name in given if name not in inputs]
+    if missing:
+        raise ValueError(f"Missing inputs: {', '.join(missing)}")
+    return calculate, given, outputs
+
+
+_GEOMETRY = ('total_surface_area', 'floor_area', 'wall_area', 'volume')
+
+register_calculator('rectangular_compartment', AreaVolumeCalculator.rectangular_compartment_batch,
+                    ('length', 'width', 'height'), _GEOMETRY)
+register_calculator('cylindrical_compartment', AreaVolumeCalculator.cylindrical_compartment_batch,
+                    ('diameter', 'height'), _GEOMETRY)
+register_calculator('mccaffrey_flashover', FlashoverCalculator.mccaffrey_correlation_batch,
+                    ('At', 'A0', 'H0', 'wall_material'))
+register_calculator('babrauskas_flashover', FlashoverCalculator.babrauskas_correlation_batch, ('A0', 'H0'))
+register_calculator('thomas_flashover', FlashoverCalculator.thomas_correlation_batch, ('At', 'A0', 'H0'))
+register_calculator('flame_height', FlameHeightCalculator.calculate_flame_height_batch, ('Q', 'D'))
+register_calculator('flame_height_heat_release', FlameHeightCalculator.calculate_heat_release_batch,
+                    ('L', 'D'))
+register_calculator('flame_height_diameter', FlameHeightCalculator.calculate_diameter_batch, ('Q', 'L'))
+register_calculator('point_source_radiation', RadiationCalculator.calculate_heat_flux_batch, ('Q', 'R', 'Xr'))
+register_calculator('solid_flame_emissive_power', SolidFlameCalculator.emissive_power_batch, ('D',))
+register_calculator('solid_flame_cylinder', SolidFlameCalculator.cylinder_heat_flux_batch, ('E', 'D', 'Hf', 'L'))
+register_calculator('solid_flame_plane', SolidFlameCalculator.plane_heat_flux_batch, ('E', 'W', 'Hf', 'S'))
+register_calculator('t_squared_hrr', TSquaredCalculator.calculate_hrr_batch, ('alpha', 'time'))
+register_calculator('t_squared_time', TSquaredCalculator.calculate_time_batch, ('alpha', 'hrr'))
+register_calculator('heat_release', HeatReleaseCalculator.calculate_hrr_batch,
+                    ('material_key', 'burning_area', 'manual_mass_flux'))
+register_calculator('ceiling_jet_temperature', CeilingJetCalculator.calculate_temperature_rise_batch,
+                    ('Q', 'H', 'r'))
+register_calculator('ceiling_jet_velocity', CeilingJetCalculator.calculate_velocity_batch, ('Q', 'H', 'r'))
+register_calculator('smoke_filling_time', SmokeLayerCalculator.calculate_filling_time_batch,
+                    ('Q', 'room_height', 'floor_area', 'target_height'))
+register_calculator('smoke_layer_temperature', SmokeLayerCalculator.calculate_layer_temperature_batch,
+                    ('Q', 'room_height', 'layer_height', 'ambient_temp'))
+register_calculator('mqh_temperature', TemperatureRiseCalculator.calculate_mqh_temperature_batch,
+                    ('Q', 'A0', 'H0', 'AT', 'hk'))
+register_calculator('time_to_temperature', TemperatureRiseCalculator.calculate_time_to_temperature_batch,
+                    ('Q', 'A0', 'H0', 'AT', 'hk', 'target_temp', 'ambient_temp'))
+register_calculator('natural_vent_flow', VentFlowCalculator.natural_vent_flow_batch,
+                    ('vent_height', 'vent_width', 'neutral_plane', 'temp_hot', 'temp_ambient'),
+                    ('mass_flow_in', 'mass_flow_out'))
+register_calculator('fire_load_density', FireLoadCalculator.calculate_fire_load_density_batch,
+                    ('total_energy', 'floor_area'))
+
+
+# --- Shared memory plumbing ---
+
+def _share(array: np.ndarray) -> tuple:
+    """Copies an array into a new shared memory block; returns (block, spec)."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _allocate(shape: tuple, dtype) -> tuple:
+    """Allocates an uninitialized shared array; returns (block, spec)."""
+    dtype = np.dtype(dtype)
+    block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return block, (block.name, shape, dtype.str)
+
+
+def _attach(spec: tuple) -> tuple:
+    name, shape, dtype = spec
+    # Pool workers share the parent's resource tracker, which only unlinks
+    # leftover blocks if the parent dies before cleaning up
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+# Worker process state, set once per process by _init_worker
+_worker = {}
+
+
+def _init_worker(calculator: str, input_specs: dict, output_specs: dict, codes_spec: tuple) -> None:
+    blocks = []
+    views = {}
+    for name, spec in list(input_specs.items()) + list(output_specs.items()) + [('__codes__', codes_spec)]:
+        block, views[name] = _attach(spec)
+        blocks.append(block)
+    _worker.update(calculator=calculator, blocks=blocks, views=views,
+                   inputs=tuple(input_specs), outputs=tuple(output_specs))
+
+
+def _evaluate_rows(calculator: str, inputs: dict, start: int, stop: int, outputs: dict, codes: np.ndarray) -> tuple:
+    """
+    Evaluates rows [start, stop) from the input views into the output views.
+    Returns the chunk's error messages, which its codes index into.
+    """
+    calculate, _, names = CALCULATORS[calculator]
+    result = calculate(**{name: column[start:stop] for name, column in inputs.items()})
+    results = {'value': result} if isinstance(result, BatchResult) else result
+    for name in names:
+        outputs[name][start:stop] = results[name].values
+    # Every output of one calculation shares the same validation
+    first = results[names[0]]
+    codes[start:stop] = first.codes
+    return first.messages
+
+
+def _run_task(bounds: tuple) -> tuple:
+    start, stop = bounds
+    views = _worker['views']
+    messages = _evaluate_rows(
+        _worker['calculator'],
+        {name: views[name] for name in _worker['inputs']},
+        start, stop,
+        {name: views[name] for name in _worker['outputs']},
+        views['__codes__'],
+    )
+    return start, stop, messages
+
+
+class ScenarioRunner:
+    """
+    Evaluates a registered calculator over a scenario table with a pool of
+    worker processes.
+
+    Args:
+        workers: Number of worker processes (RUNNER_WORKERS by default);
+            1 evaluates in the calling process
+        chunk_size: Rows per task (RUNNER_CHUNK_ROWS by default). Larger chunks
+            amortize task overhead; smaller ones balance load across workers.
+    """
+
+    def __init__(self, workers: int = None, chunk_size: int = None):
+        self.workers = workers or RUNNER_WORKERS
+        self.chunk_size = chunk_size or RUNNER_CHUNK_ROWS
+        if self.workers < 1 or self.chunk_size < 1:
+            raise ValueError("Workers and chunk size must be positive")
+
+    def run(self, calculator: str, scenarios: dict) -> dict:
+        """
+        Evaluates every row of `scenarios` (input name -> 1-D column, constants are
+        broadcast, or a structured array such as records.CalculatorRecords.to_array
+        builds) and returns one BatchResult per output of the calculator.
+        """
+        if calculator not in CALCULATORS:
+            raise ValueError(f"Unknown calculator: {calculator}")
+        _, input_names, output_names = CALCULATORS[calculator]
+        available = (scenarios.dtype.names or ()) if isinstance(scenarios, np.ndarray) else scenarios
+        missing = [name for name in input_names if name not in available]
+        if missing:
+            raise ValueError(f"Missing inputs: {', '.join(missing)}")
+
+        # Shared memory needs fixed-size dtypes: object columns (e.g. material keys) become strings
+        columns = [np.atleast_1d(np.asarray(scenarios[name])) for name in input_names]
+        columns = [column.astype(str) if column.dtype == object else column for column in columns]
+        columns = dict(zip(input_names, map(np.ascontiguousarray, np.broadcast_arrays(*columns))))
+        n = next(iter(columns.values())).size
+        bounds = [(start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+
+        if self.workers == 1 or len(bounds) <= 1:
+            outputs = {name: np.empty(n) for name in output_names}
+            codes = np.zeros(n, dtype=np.int32)
+            chunks = [(start, stop, _evaluate_rows(calculator, columns, start, stop, outputs, codes))
+                      for start, stop in bounds]
+            return _collect(outputs, codes, chunks)
+
+        blocks = []
+        try:
+            input_specs = {}
+            for name, column in columns.items():
+                block, input_specs[name] = _share(column)
+                blocks.append(block)
+            output_specs, output_views = {}, {}
+            for name in output_names:
+                block, output_specs[name] = _allocate((n,), np.float64)
+                output_views[name] = np.ndarray((n,), dtype=np.float64, buffer=block.buf)
+                blocks.append(block)
+            block, codes_spec = _allocate((n,), np.int32)
+            codes_view = np.ndarray((n,), dtype=np.int32, buffer=block.buf)
+            blocks.append(block)
+
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(bounds)),
+                initializer=_init_worker,
+                initargs=(calculator, input_specs, output_specs, codes_spec),
+            ) as pool:
+                chunks = list(pool.map(_run_task, bounds))
+
+            # Copy out of shared memory before the blocks are released
+            outputs = {name: view.copy() for name, view in output_views.items()}
+            codes = codes_view.copy()
+            del output_views, codes_view
+            return _collect(outputs, codes, chunks)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+
+def _collect(outputs: dict, codes: np.ndarray, chunks: list) -> dict:
+    """
+    Renumbers each chunk's error codes into one shared message table and
+    packs the outputs as BatchResults.
+    """
+    messages = []
+    index = {}
+    for start, stop, chunk_messages in chunks:
+        if not chunk_messages:
+            continue
+        remap = np.zeros(len(chunk_messages) + 1, dtype=np.int32)
+        for code, message in enumerate(chunk_messages, start=1):
+            if message not in index:
+                messages.append(message)
+                index[message] = len(messages)
+            remap[code] = index[message]
+        codes[start:stop] = remap[codes[start:stop]]
+    messages = tuple(messages)
+    return {name: BatchResult(values, codes, messages) for name, values in outputs.items()}
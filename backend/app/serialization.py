@@ -0,0 +1,221 @@
+# backend/app/serialization.py
+"""
+Response serializers, chosen per request by content negotiation.
+
+Array-heavy responses (batch results, Jacobians, inventories) spend most of
+their time turning floats into text. The serializers here take response
+objects that hold NumPy arrays directly, so endpoints no longer convert their
+columns with tolist() first:
+
+- JSON (application/json): encoded by orjson, which writes NumPy arrays
+  natively and NaN as null, when it is installed; otherwise by the standard
+  library, converting arrays to lists and NaN to null on the way. An optional precision rounds
+  every float to that many significant digits, which also shortens the text.
+- Float arrays (application/x-float-arrays): a JSON header followed by the
+  raw little-endian bytes of every numeric array, for clients that read the
+  columns straight into typed arrays. NaN stays NaN. With a precision of 7
+  digits or fewer float arrays are sent as float32.
+
+    FCA1 | uint32 header length | header JSON | padding to 8 bytes | array data
+
+The header is the response object with each array replaced by
+{"$array": i}, plus "arrays": [{"dtype", "shape", "offset", "nbytes"}, ...]
+with offsets relative to the start of the array data, each 8-byte aligned.
+
+Further formats can be added with register_serializer.
+"""
+
+import json
+import math
+import os
+import struct
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the standard library encoder is the fallback
+    orjson = None
+
+JSON = 'application/json'
+FLOAT_ARRAYS = 'application/x-float-arrays'
+ARRAYS_MAGIC = b'FCA1'
+
+# Significant digits of floats in responses, unless a request asks for others; unset keeps them all
+RESPONSE_PRECISION = int(os.environ['RESPONSE_PRECISION']) if os.environ.get('RESPONSE_PRECISION') else None
+# Largest accepted precision; doubles carry 17 significant digits
+MAX_PRECISION = 17
+
+
+def round_significant(values, digits: int) -> np.ndarray:
+    """Rounds floats to `digits` significant digits, leaving zeros, NaN and infinities alone."""
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitude = np.floor(np.log10(np.abs(values)))
+    exponent = digits - 1 - np.clip(np.nan_to_num(magnitude, posinf=0.0, neginf=0.0), -300, 300)
+    # Dividing by an exact power of ten rounds to the nearest double of the decimal
+    scale = 10.0 ** np.abs(exponent)
+    with np.errstate(over='ignore', invalid='ignore'):
+        rounded = np.where(exponent >= 0, np.round(values * scale) / scale, np.round(values / scale) * scale)
+    return np.where(np.isfinite(rounded) & (values != 0), rounded, values)
+
+
+class JsonSerializer:
+    """JSON responses, with NumPy arrays and scalars encoded directly."""
+
+    media_type = JSON
+
+    def __init__(self, precision: int = None):
+        self.precision = precision
+
+    def dumps(self, obj) -> bytes:
+        if self.precision is not None:
+            obj = _map_floats(obj, self.precision)
+        if orjson is not None:
+            return orjson.dumps(obj, default=_plain, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(_finite(obj), default=_plain_lists, separators=(',', ':'), allow_nan=False).encode()
+
+
+class FloatArraySerializer:
+    """Binary responses: a JSON header and the raw bytes of every numeric array."""
+
+    media_type = FLOAT_ARRAYS
+
+    def __init__(self, precision: int = None):
+        self.precision = precision
+
+    def dumps(self, obj) -> bytes:
+        arrays, specs = [], []
+
+        def extract(value):
+            if isinstance(value, dict):
+                return {key: extract(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [extract(item) for item in value]
+            if isinstance(value, np.ndarray) and value.dtype.kind in 'biuf':
+                arrays.append(self._pack(value))
+                return {'$array': len(arrays) - 1}
+            return _plain(value) if isinstance(value, (np.ndarray, np.generic)) else value
+
+        header = extract(obj)
+        offset = 0
+        for array in arrays:
+            specs.append({'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset,
+                          'nbytes': array.nbytes})
+            offset += _aligned(array.nbytes)
+        text = JsonSerializer().dumps({'data': header, 'arrays': specs})
+        parts = [ARRAYS_MAGIC, struct.pack('<I', len(text)), text, bytes(_aligned(len(text) + 8) - len(text) - 8)]
+        for array in arrays:
+            parts += [array.tobytes(), bytes(_aligned(array.nbytes) - array.nbytes)]
+        return b''.join(parts)
+
+    def _pack(self, array: np.ndarray) -> np.ndarray:
+        if array.dtype.kind == 'f':
+            single = self.precision is not None and self.precision <= 7
+            array = array.astype('<f4' if single else '<f8', copy=False)
+        elif array.dtype.kind == 'b':
+            array = array.astype('u1')
+        else:
+            array = array.astype(array.dtype.newbyteorder('<'), copy=False)
+        return np.ascontiguousarray(array)
+
+    @staticmethod
+    def loads(body: bytes):
+        """Decodes a float-arrays body back into the response object with NumPy arrays."""
+        if body[:4] != ARRAYS_MAGIC:
+            raise ValueError("Not a float-arrays body")
+        length, = struct.unpack_from('<I', body, 4)
+        header = json.loads(body[8:8 + length])
+        start = _aligned(8 + length)
+        arrays = [np.frombuffer(body, dtype=spec['dtype'], count=math.prod(spec['shape']),
+                                offset=start + spec['offset']).reshape(spec['shape'])
+                  for spec in header['arrays']]
+
+        def restore(value):
+            if isinstance(value, dict):
+                if set(value) == {'$array'}:
+                    return arrays[value['$array']]
+                return {key: restore(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [restore(item) for item in value]
+            return value
+
+        return restore(header['data'])
+
+
+# media type -> serializer class taking the precision
+SERIALIZERS = {JSON: JsonSerializer, FLOAT_ARRAYS: FloatArraySerializer}
+
+
+def register_serializer(media_type: str, serializer) -> None:
+    """Adds a response format; `serializer(precision)` must have a dumps(obj) -> bytes method."""
+    SERIALIZERS[media_type] = serializer
+
+
+def negotiate(accept_mimetypes, precision=None):
+    """
+    Picks the serializer for a request from its Accept header (JSON unless the
+    client prefers another registered format) and its requested precision.
+    Raises ValueError for a precision that is not 1 to MAX_PRECISION digits.
+    """
+    media_type = accept_mimetypes.best_match(list(SERIALIZERS), default=JSON) if accept_mimetypes else JSON
+    if precision is None or precision == '':
+        precision = RESPONSE_PRECISION
+    else:
+        try:
+            precision = int(precision)
+        except ValueError:
+            raise ValueError(f"Invalid precision: {precision}") from None
+        if not 1 <= precision <= MAX_PRECISION:
+            raise ValueError(f"Precision must be between 1 and {MAX_PRECISION} digits")
+    return SERIALIZERS[media_type](precision)
+
+
+def _aligned(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def _plain(value):
+    # orjson hands over what it cannot encode itself: non-native array layouts and dtypes
+    if isinstance(value, np.ndarray):
+        return _plain_lists(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _plain_lists(value):
+    if isinstance(value, np.ndarray):
+        # NaN (failed rows) is not valid JSON; null it like orjson, infinities too
+        if value.dtype.kind == 'f':
+            return np.where(np.isfinite(value), value, None).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _finite(value):
+    """Replaces NaN and infinite floats outside arrays with None, as orjson writes them."""
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _map_floats(value, digits: int):
+    """Rounds every float (and float array) in a response object."""
+    if isinstance(value, dict):
+        return {key: _map_floats(item, digits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if value and all(type(item) is float for item in value):
+            return round_significant(value, digits).tolist()
+        return [_map_floats(item, digits) for item in value]
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'f':
+        return round_significant(value, digits)
+    if isinstance(value, (float, np.floating)):
+        return float(round_significant(value, digits))
+    return value
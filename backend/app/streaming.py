@@ -0,0 +1,148 @@
+# backend/app/streaming.py
+"""
+Chunked evaluation of NDJSON / CSV scenario streams.
+
+Rows are read lazily from an iterator of text lines, evaluated `chunk_rows`
+at a time with the vectorized handlers, and written back out as soon as each
+chunk is done. Only one chunk of input and output is ever held in memory, so
+memory use does not depend on the size of the file being streamed.
+"""
+
+import csv
+import io
+import json
+from itertools import islice
+
+from .handlers import OUTPUTS, evaluate
+from .serialization import JsonSerializer
+
+NDJSON = 'application/x-ndjson'
+CSV = 'text/csv'
+
+
+class RowError:
+    """Stands in for a row that could not be parsed, so it comes back as an error row in place."""
+
+    __slots__ = ('message',)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def iter_ndjson_rows(lines):
+    """
+    Yields one payload per non-blank line, or a RowError for a line that is
+    not valid JSON. RowErrors among the lines (see decode_lines) pass through.
+    """
+    for line in lines:
+        if isinstance(line, RowError):
+            yield line
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield RowError(f"Invalid JSON: {e}")
+
+
+def iter_csv_rows(lines):
+    """
+    Yields one payload dict per CSV record, keyed by the header row like
+    csv.DictReader. Blank records are skipped after parsing, so quoted fields
+    may span several lines. RowErrors among the lines (see decode_lines) are
+    yielded in their place.
+    """
+    errors = []
+
+    def text(lines):
+        # The reader sees an undecodable line as a blank one; its error follows the record it ends
+        for line in lines:
+            if isinstance(line, RowError):
+                errors.append(line)
+                yield ''
+            else:
+                yield line
+
+    header = None
+    for record in csv.reader(text(lines)):
+        yield from errors
+        errors.clear()
+        if not any(cell.strip() for cell in record):
+            continue
+        if header is None:
+            header = record
+            continue
+        row = dict(zip(header, record))
+        if len(record) < len(header):
+            row.update(dict.fromkeys(header[len(record):]))
+        elif len(record) > len(header):
+            row[None] = record[len(header):]
+        yield row
+
+
+def evaluate_stream(calculator: str, rows, chunk_rows: int):
+    """
+    Evaluates an iterator of payloads in fixed-size chunks, yielding a list of
+    results per chunk in input order.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            return
+        results = evaluate(calculator, [row for row in chunk if not isinstance(row, RowError)])
+        results = iter(results)
+        yield [{"error": row.message} if isinstance(row, RowError) else next(results) for row in chunk]
+
+
+def format_ndjson(chunks, serializer=None):
+    """
+    Serializes result chunks as newline-delimited JSON, one chunk per write,
+    with a JsonSerializer (full precision by default).
+    """
+    dumps = (serializer or JsonSerializer()).dumps
+    for results in chunks:
+        yield b''.join(dumps(result) + b'\n' for result in results)
+
+
+def format_csv(chunks, columns: tuple):
+    """Serializes result chunks as CSV with the calculator's output columns plus `error`."""
+    header = columns + ('error',)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for results in chunks:
+        writer.writerows([result.get(column, '') for column in header] for result in results)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_results(calculator: str, lines, content_type: str, chunk_rows: int, serializer=None):
+    """
+    Parses `lines` as NDJSON or CSV (by `content_type`) and returns a generator
+    of output text in the same format; `serializer` encodes NDJSON rows.
+    """
+    if content_type == CSV:
+        chunks = evaluate_stream(calculator, iter_csv_rows(lines), chunk_rows)
+        return format_csv(chunks, OUTPUTS[calculator])
+    chunks = evaluate_stream(calculator, iter_ndjson_rows(lines), chunk_rows)
+    return format_ndjson(chunks, serializer)
+
+
+def decode_lines(stream, encoding: str = 'utf-8'):
+    """
+    Reads a binary request stream line by line without buffering the whole body.
+    A line that does not decode comes through as a RowError, so it is reported
+    like any other unparseable row instead of failing the response midway.
+    """
+    for line in stream:
+        try:
+            yield line.decode(encoding)
+        except UnicodeDecodeError:
+            yield RowError(f"Row is not valid {encoding.upper()}")
+
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+from api import app
+from app.asgi import AsgiServer, RouteLimit
+
+async def _request(server, method, path, body=b'', headers=(), parts=1, gate=None):
+    """Runs one request through the ASGI app, sending the body in `parts` pieces after `gate`."""
+    size = -(-len(body) // parts) if body else 0
+    pieces = [body[i:i + size] for i in range(0, len(body), size)] if body else [b'']
+    messages = []
+
+    async def receive():
+        if gate is not None:
+            await gate.wait()
+        if pieces:
+            piece = pieces.pop(0)
+            return {'type': 'http.request', 'body': piece, 'more_body': bool(pieces)}
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query.encode(),
+        'headers': [(k.lower().encode(), v.encode()) for k, v in headers],
+        'http_version': '1.1', 'scheme': 'http', 'server': ('test', 80), 'client': ('127.0.0.1', 1),
+    }
+    await server(scope, receive, send)
+    start = messages[0]
+    body = b''.join(message.get('body', b'') for message in messages[1:])
+    return start['status'], dict(start['headers']), body, len(messages) - 1
+
+def test_asgi_server():
+    """
+    Test the ASGI server against the Flask routes, with streamed bodies and route limits.
+    """
+    print("\nTesting ASGI Server:")
+    print("-" * 40)
+    asyncio.run(_check_asgi_server())
+
+async def _check_asgi_server():
+    server = AsgiServer(app, limits={
+        '/api/stream/': RouteLimit(1, 0, 'batch'), '/api/batch': RouteLimit(2, 8, 'batch'),
+    })
+    client = app.test_client()
+    try:
+        # A single route answers exactly like the Flask app
+        payload = {'length': 4, 'width': 3, 'height': 2.4}
+        status, headers, body, _ = await _request(server, 'POST', '/api/rectangular_area_volume',
+                                                  json.dumps(payload).encode(),
+                                                  [('Content-Type', 'application/json')], parts=3)
+        print(f"Single route: {status} {body}")
+        assert status == 200 and headers[b'content-type'] == b'application/json'
+        assert json.loads(body) == client.post('/api/rectangular_area_volume', json=payload).get_json()
+
+        status, _, body, _ = await _request(server, 'GET', '/api/materials?limit=2&q=he')
+        assert status == 200 and json.loads(body) == client.get('/api/materials?limit=2&q=he').get_json()
+
+        # A streamed request body in many parts comes back as a streamed response
+        lines = ''.join(json.dumps({'calculateMode': 'heatRelease', 'growthRate': 'slow', 'time': t}) + '\n'
+                        for t in range(1, 201)).encode()
+        status, _, body, chunks = await _request(server, 'POST', '/api/stream/t_squared_growth', lines,
+                                                 [('Content-Type', 'application/x-ndjson')], parts=7)
+        results = [json.loads(line) for line in body.splitlines()]
+        print(f"Stream: {len(results)} rows in {chunks} body messages")
+        assert status == 200 and len(results) == 200 and 'value' in results[-1]
+
+        # A second stream is turned away while the first still waits for its body
+        gate = asyncio.Event()
+        first = asyncio.create_task(_request(server, 'POST', '/api/stream/t_squared_growth', lines,
+                                             [('Content-Type', 'application/x-ndjson')], gate=gate))
+        await asyncio.sleep(0.05)
+        status, headers, body, _ = await _request(server, 'POST', '/api/stream/t_squared_growth', lines,
+                                                  [('Content-Type', 'application/x-ndjson')])
+        print(f"Busy route: {status} {body}")
+        assert status == 503 and b'retry-after' in headers
+        # ... while other routes still answer
+        status, _, _, _ = await _request(server, 'GET', '/api/cache_stats')
+        assert status == 200
+        gate.set()
+        assert (await first)[0] == 200
+        assert server.limit_for('/api/stream/flashover').active == 0
+
+        # Concurrent batches queue for their slots instead of failing
+        batch = json.dumps([{'calculator': 'flashover', 'roomLength': 4, 'roomWidth': 3, 'roomHeight': 2.4,
+                             'openingWidth': 0.9, 'openingHeight': 2.0, 'surfaceMaterial': 'gypsum_board'}] * 50)
+        responses = await asyncio.gather(*(
+            _request(server, 'POST', '/api/batch', batch.encode(), [('Content-Type', 'application/json')])
+            for _ in range(6)
+        ))
+        assert [response[0] for response in responses] == [200] * 6
+        assert len(json.loads(responses[0][2])['results']) == 50
+    finally:
+        server.shutdown()
+
+    try:
+        RouteLimit(2, 1, 'gpu') and AsgiServer(app, limits={'/api/batch': RouteLimit(2, 1, 'gpu')})
+        assert False
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+if __name__ == "__main__":
+    test_asgi_server()
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+
+from app.calculations.flashover import FlashoverCalculator
+from app.calculations.ceiling_jet import CeilingJetCalculator
+from app.calculations.heat_release import HeatReleaseCalculator
+from app.calculations.vent_flow import VentFlowCalculator
+
+def test_batch_matches_scalar():
+    """
+    Test that the vectorized correlations agree with the scalar API row by row.
+    """
+    print("\nTesting Batch Engine:")
+    print("-" * 40)
+
+    At = np.array([100.0, 150.0, 200.0])
+    A0 = np.array([1.5, 2.0, 3.0])
+    H0 = np.array([2.0, 2.1, 2.4])
+
+    mqh = FlashoverCalculator.mccaffrey_correlation_batch(At, A0, H0, 'gypsum_board')
+    thomas = FlashoverCalculator.thomas_correlation_batch(At, A0, H0)
+
+    for i in range(len(At)):
+        assert math.isclose(mqh.values[i], FlashoverCalculator.mccaffrey_correlation(At[i], A0[i], H0[i]))
+        assert math.isclose(thomas.values[i], FlashoverCalculator.thomas_correlation(At[i], A0[i], H0[i]))
+
+    print(f"MQH Method: {mqh.values.round(0)} kW")
+
+    # Both ceiling jet regimes in one call
+    delta_T = CeilingJetCalculator.calculate_temperature_rise_batch(1000, 3.0, np.array([0.3, 2.0]))
+    assert math.isclose(delta_T.values[0], CeilingJetCalculator.calculate_temperature_rise(1000, 3.0, 0.3))
+    assert math.isclose(delta_T.values[1], CeilingJetCalculator.calculate_temperature_rise(1000, 3.0, 2.0))
+
+def test_batch_masks_bad_rows():
+    """
+    Test that one bad row comes back as an error entry without aborting the batch.
+    """
+    result = FlashoverCalculator.mccaffrey_correlation_batch(
+        [100.0, 100.0, 100.0], [2.0, -1.0, 2.0], [2.0, 2.0, 2.0], ['gypsum_board', 'concrete', 'not_a_wall']
+    )
+    errors = result.errors()
+
+    print(f"\nMixed batch errors: {errors}")
+    assert not math.isnan(result.values[0])
+    assert errors[0] is None
+    assert errors[1] == "All dimensions must be positive"
+    assert errors[2] == "Material 'not_a_wall' not found in database"
+    assert np.isnan(result.values[1:]).all()
+
+    # Manual mass flux only rescues rows whose material lacks a database value
+    hrr = HeatReleaseCalculator.calculate_hrr_batch(['gasoline', 'kerosene', 'kerosene'], 2.0, [np.nan, np.nan, 30.0])
+    assert hrr.errors() == [None, "Mass flux not available for material: kerosene", None]
+
+    flows = VentFlowCalculator.natural_vent_flow_batch(2.0, 1.0, [1.0, 3.0], 500, 20)
+    assert flows['mass_flow_out'].errors()[1] == "Neutral plane must lie within the vent opening"
+
+    try:
+        FlashoverCalculator.babrauskas_correlation(-1, 2)
+        assert False, "Should have caught invalid vent area"
+    except ValueError as e:
+        print(f"Successfully caught error: {e}")
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_batch_masks_bad_rows()
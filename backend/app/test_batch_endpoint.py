@@ -0,0 +1,45 @@
+from api import app
+
+def test_batch_endpoint():
+    """
+    Test that /api/batch returns the same results as the single-item routes, in order.
+    """
+    print("\nTesting Batch Endpoint:")
+    print("-" * 40)
+
+    client = app.test_client()
+    room = {
+        'roomLength': 10, 'roomWidth': 8, 'roomHeight': 7,
+        'openingWidth': 3, 'openingHeight': 6,
+        'surfaceMaterial': 'gypsum_board', 'units': 'imperial',
+    }
+    fire = {'calculateMode': 'flameHeight', 'heatRelease': 1000, 'diameter': 1.0, 'units': 'SI'}
+
+    items = [
+        dict(room, calculator='flashover'),
+        dict(fire, calculator='flame_height'),
+        dict(fire, calculator='flame_height', diameter=-1),
+        {'calculator': 'no_such_calculator'},
+        dict(room, calculator='flashover', roomLength='ten'),
+        dict(fire, calculator='flame_height', units=['imperial']),
+    ]
+    response = client.post('/api/batch', json={'items': items})
+    results = response.get_json()['results']
+
+    print(f"Batch results: {results}")
+    assert response.status_code == 200
+    assert len(results) == len(items)
+    assert results[0] == client.post('/api/flashover', json=room).get_json()
+    assert results[1] == client.post('/api/flame_height', json=fire).get_json()
+    assert results[2] == {'error': "Heat Release Rate and Diameter must be positive."}
+    assert results[3] == {'error': "Unknown calculator: no_such_calculator"}
+    assert results[4] == {'error': "could not convert string to float: 'ten'"}
+    # A units value that is not a string is read as SI, in the batch and on its own
+    assert results[5] == results[1]
+    assert client.post('/api/flame_height', json=dict(fire, units={'a': 1})).get_json() == results[1]
+
+    # A malformed body is rejected as a whole
+    assert client.post('/api/batch', json={'items': 'not a list'}).status_code == 400
+
+if __name__ == "__main__":
+    test_batch_endpoint()
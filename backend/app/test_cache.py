@@ -0,0 +1,113 @@
+import time
+
+import api
+from api import app
+from app.cache import CachedResponse, ResponseCache
+from app.handlers import NUMERIC_INPUTS
+
+def test_cached_routes():
+    """
+    Test that equivalent requests share a cache entry and that ETags revalidate.
+    """
+    print("\nTesting Response Cache:")
+    print("-" * 40)
+
+    client = app.test_client()
+    api.response_cache.clear()
+    payload = {'calculateMode': 'heatRelease', 'growthRate': 'fast', 'time': 60, 'units': 'SI'}
+
+    first = client.post('/api/t_squared_growth', json=payload)
+    # Same request with a different units spelling and a numeric string
+    second = client.post('/api/t_squared_growth', json=dict(payload, time='60.0', units='si'))
+    print(f"First: {first.headers['X-Cache']} {first.get_json()}, second: {second.headers['X-Cache']}")
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert first.get_data() == second.get_data()
+    assert first.headers['ETag'] == second.headers['ETag']
+
+    revalidated = client.post('/api/t_squared_growth', json=payload,
+                              headers={'If-None-Match': first.headers['ETag']})
+    print(f"Revalidation status: {revalidated.status_code}")
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+
+    # Errors are cached with their status code
+    for _ in range(2):
+        failed = client.post('/api/t_squared_growth', json=dict(payload, time=-1))
+        assert failed.status_code == 400
+    assert failed.headers['X-Cache'] == 'HIT'
+
+    stats = client.get('/api/cache_stats').get_json()
+    print(f"Stats: {stats}")
+    assert stats['entries'] == 2
+    assert stats['hits'] >= 3 and stats['misses'] >= 2
+
+def test_eviction_and_expiry():
+    """
+    Test LRU eviction, TTL expiry and the shared backend fallback.
+    """
+    print("\nTesting Cache Eviction and Expiry:")
+    print("-" * 40)
+
+    cache = ResponseCache(max_entries=2, ttl=60)
+    for name in ('a', 'b'):
+        cache.set(name, CachedResponse(200, name.encode()))
+    cache.get('a')
+    cache.set('c', CachedResponse(200, b'c'))
+    assert cache.get('b') is None
+    assert cache.get('a').body == b'a'
+    assert cache.stats()['evictions'] == 1
+
+    cache = ResponseCache(ttl=0.01)
+    cache.set('a', CachedResponse(200, b'a'))
+    time.sleep(0.02)
+    assert cache.get('a') is None
+
+    class Backend(dict):
+        def set(self, key, value, ex=None):
+            self[key] = value
+
+    backend = Backend()
+    ResponseCache(backend=backend).set('k', CachedResponse(400, b'{"error": "x"}'))
+    shared = ResponseCache(backend=backend).get('k')
+    print(f"From backend: {shared.status} {shared.body}")
+    assert shared.status == 400 and shared.body == b'{"error": "x"}'
+
+    # A failing backend is counted and bypassed; the local LRU still serves
+    class Down:
+        def get(self, key):
+            raise ConnectionError("Connection refused")
+
+        def set(self, key, value, ex=None):
+            raise TimeoutError("Timed out")
+
+    cache = ResponseCache(backend=Down())
+    assert cache.get('k') is None
+    cache.set('k', CachedResponse(200, b'k'))
+    assert cache.get('k').body == b'k'
+    assert cache.stats()['backend_errors'] == 2 and cache.stats()['misses'] == 1
+
+    a = ResponseCache(precision=6, numeric_fields=NUMERIC_INPUTS)
+    assert a.key('flashover', {'roomLength': 4.0000001}) == a.key('flashover', {'roomLength': '4'})
+    assert a.key('flashover', {'roomLength': 4}) != a.key('flame_height', {'roomLength': 4})
+    # Material keys and type-sensitive fields are kept as sent
+    assert a.key('flashover', {'surfaceMaterial': '1e3'}) != a.key('flashover', {'surfaceMaterial': '1000'})
+    assert a.key('heat_release', {'manualMassFlux': '0'}) != a.key('heat_release', {'manualMassFlux': 0})
+
+def test_type_sensitive_fields():
+    """
+    Test that manualMassFlux "0" (a zero flux) and 0 (use the database) are cached apart.
+    """
+    client = app.test_client()
+    api.response_cache.clear()
+    payload = {'material': 'heptane', 'burningArea': 2.0}
+    database = client.post('/api/heat_release', json=dict(payload, manualMassFlux=0)).get_json()
+    zero = client.post('/api/heat_release', json=dict(payload, manualMassFlux='0'))
+    print(f"Database flux: {database}, zero flux: {zero.get_json()}")
+    assert zero.headers['X-Cache'] == 'MISS'
+    assert database['value'] > 0 and zero.get_json()['value'] == 0
+
+if __name__ == "__main__":
+    test_cached_routes()
+    test_eviction_and_expiry()
+    test_type_sensitive_fields()
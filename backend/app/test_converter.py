@@ -7,6 +7,8 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
+import numpy as np
+
 from utils.unit_converter import UnitConverter
 
 def test_basic_conversions():
@@ -34,6 +36,31 @@ def test_basic_conversions():
     print(f"3 meters should be:")
     print(f"  9.84 feet: Got {feet:.2f} feet")
 
+def test_array_conversions():
+    """
+    Tests that the compiled converters accept lists and arrays, and that
+    converter_for returns a reusable callable.
+    """
+    print("\nTesting Array Conversions:")
+    print("-" * 30)
+
+    feet = UnitConverter.length_converter([1, 10], 'm', 'ft')
+    print(f"[1, 10] meters: Got {feet} feet")
+    assert isinstance(feet, np.ndarray)
+    assert np.allclose(feet, [3.28084, 32.8084])
+
+    to_fahrenheit = UnitConverter.converter_for('C', 'F')
+    assert np.allclose(to_fahrenheit(np.array([0.0, 100.0])), [32.0, 212.0])
+    assert UnitConverter.converter_for('kW', 'BTU/s')(1000) == 1000 * 0.947817
+    assert UnitConverter.volume_converter(1, 'm3', 'ft3') == 35.3147
+
+    try:
+        UnitConverter.converter_for('m', 'kW')
+        assert False, "Should have rejected mismatched units"
+    except ValueError as e:
+        print(f"Successfully caught error: {e}")
+
 if __name__ == "__main__":
     print("Running Unit Converter Tests...\n")
-    test_basic_conversions()
\ No newline at end of file
+    test_basic_conversions()
+    test_array_conversions()
\ No newline at end of file
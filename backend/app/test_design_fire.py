@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+
+from app.calculations.design_fire import DesignFireCalculator
+from app.calculations.t_squared import TSquaredCalculator
+
+def test_design_fire_curves():
+    """
+    Test growth, plateau, decay and ventilation capping across a batch of scenarios.
+    """
+    print("\nTesting Design Fire Curves:")
+    print("-" * 40)
+
+    time = DesignFireCalculator.time_grid(3600, 1.0)
+    alpha = TSquaredCalculator.GROWTH_COEFFICIENTS['fast']
+    curves = DesignFireCalculator.design_fire_curve_batch(
+        alpha, [2000, 2000, 5000, -1], time,
+        fuel_load=[np.inf, 1000, 2000, 1000],
+        A0=[np.nan, np.nan, 1.0, np.nan], H0=[np.nan, np.nan, 2.0, np.nan],
+    )
+    hrr = curves['hrr']
+
+    print(f"Peak HRR: {curves['peak_hrr'].values} kW")
+    assert hrr.values.shape == (len(time), 4)
+    assert hrr.values.flags['C_CONTIGUOUS']
+
+    # Growth follows the t-squared model until the peak
+    assert math.isclose(hrr.values[100, 0], TSquaredCalculator.calculate_hrr(alpha, 100))
+    assert hrr.values[-1, 0] == 2000
+
+    # Energy released over a decaying curve equals the fuel load (MJ)
+    assert math.isclose(np.trapezoid(hrr.values[:, 1], time) / 1000, 1000, rel_tol=1e-3)
+    assert hrr.values[-1, 1] == 0
+
+    # Ventilation limit: 1500 * A0 * √H0
+    assert math.isclose(curves['peak_hrr'].values[2], 1500 * math.sqrt(2))
+
+    assert hrr.errors()[3] == "Peak HRR must be positive."
+    assert np.isnan(hrr.values[:, 3]).all()
+
+if __name__ == "__main__":
+    test_design_fire_curves()
@@ -0,0 +1,56 @@
+import math
+
+import numpy as np
+
+from app.calculations.detector_activation import DetectorActivationCalculator
+
+def _reference(H, r, rti, activation_temp, alpha, dt=0.01):
+    """Explicit fine-step integration of the RTI equation for one link, Alpert written out."""
+    t, rise = 0.0, 0.0
+    while rise < activation_temp - 20.0:
+        Q = alpha * (t + dt / 2)**2
+        gas = math.pow(Q, 2/3) * (16.9 / H**(5/3) if r / H <= 0.18 else 5.38 / r**(2/3) / H)
+        u = math.pow(Q, 1/3) * (0.96 / H**(1/3) if r / H <= 0.15 else 0.195 * H**0.5 / r**(5/6))
+        rise += math.sqrt(u) / rti * (gas - rise) * dt
+        t += dt
+    return t
+
+def test_detector_activation():
+    """
+    Test batched sprinkler and detector activation against a fine-step reference.
+    """
+    print("\nTesting Detector Activation:")
+    print("-" * 40)
+
+    # Standard response sprinkler, 68 °C, under a fast fire
+    result = DetectorActivationCalculator.activation_time(3.0, 2.0, 100.0, 68.0, 0.0469)
+    reference = _reference(3.0, 2.0, 100.0, 68.0, 0.0469)
+    print(f"Activation: {result['activation_time']:.1f} s at {result['hrr']:.0f} kW (reference {reference:.1f} s)")
+    assert abs(result['activation_time'] - reference) < 0.2
+    assert math.isclose(result['hrr'], 0.0469 * result['activation_time']**2)
+
+    # Positions × fires: the plume region, the jet region and an invalid position
+    growth = np.array([0.00293, 0.01172, 0.0469, 0.1876])
+    batch = DetectorActivationCalculator.activation_time_batch(
+        H=[3.0, 3.0, -1.0], r=[0.3, 4.0, 1.0], rti=[50.0, 100.0, 100.0], activation_temp=68.0,
+        alpha=growth, peak_hrr=[np.inf, np.inf, np.inf, 100.0],
+    )
+    times = batch['activation_time']
+    print(f"Activation times:\n{times.values.round(1)}")
+    assert times.values.shape == (3, 4)
+    assert np.all(np.diff(times.values[0, :3]) < 0)
+    assert times.errors()[7] == "Not activated within 3600 s"
+    assert times.errors()[8] == "Ceiling height must be positive"
+    assert abs(times.values[1, 1] - _reference(3.0, 4.0, 100.0, 68.0, 0.01172)) < 0.5
+
+    # Conduction losses delay activation, and imperial inputs give the same time
+    slower = DetectorActivationCalculator.activation_time(3.0, 2.0, 100.0, 68.0, 0.0469, conduction=0.5)
+    assert slower['activation_time'] > result['activation_time']
+    imperial = DetectorActivationCalculator.activation_time(
+        3.0 / 0.3048, 2.0 / 0.3048, 100.0 / math.sqrt(0.3048), 68.0 * 1.8 + 32, 0.0469 / 1.055056,
+        ambient_temp=68.0, units='imperial',
+    )
+    assert math.isclose(imperial['activation_time'], result['activation_time'], rel_tol=1e-3)
+
+if __name__ == "__main__":
+    test_detector_activation()
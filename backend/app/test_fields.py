@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+
+from app.calculations.ceiling_jet import CeilingJetCalculator
+from app.calculations.radiation import RadiationCalculator
+from app.fields import ceiling_jet_field, radiation_field, radiation_field_tiles
+
+def test_fields():
+    """
+    Test tiled radiation and ceiling jet fields against the single point calculators.
+    """
+    print("\nTesting Fields:")
+    print("-" * 40)
+
+    x, y = np.linspace(-10.0, 10.0, 301), np.linspace(-8.0, 8.0, 257)
+    sources = ([0.0, 4.0], [0.0, -2.0], [1.0, 0.5], [1000.0, 2500.0])
+
+    # Two fires superpose; tiles of any size give the same float32 field
+    flux = radiation_field(*sources, 0.3, x, y, z=1.5, tile_rows=64)
+    assert flux.dtype == np.float32 and flux.shape == (301, 257)
+    i, j = 40, 200
+    expected = sum(
+        RadiationCalculator.calculate_heat_flux(Q, math.dist((x[i], y[j], 1.5), (sx, sy, sz)), 0.3)
+        for sx, sy, sz, Q in zip(*sources)
+    )
+    print(f"Flux at ({x[i]:.2f}, {y[j]:.2f}): {flux[i, j]:.4f} kW/m² (expected {expected:.4f})")
+    assert math.isclose(flux[i, j], expected, rel_tol=1e-6)
+    assert np.array_equal(flux, radiation_field(*sources, 0.3, x, y, z=1.5, tile_rows=1000))
+
+    # A height axis gives a 3-D field; tiles stream the same values
+    heights = np.array([0.0, 1.5, 3.0])
+    volume = radiation_field(*sources, 0.3, x, y, z=heights)
+    assert volume.shape == (301, 257, 3)
+    assert np.array_equal(volume[..., 1], flux)
+    rows, tile = next(radiation_field_tiles(*sources, 0.3, x, y, z=heights, tile_rows=10))
+    assert rows == slice(0, 10) and np.array_equal(tile, volume[:10])
+
+    # Ceiling jet: the hottest jet of the two fires, filled into a caller's array
+    out = np.zeros((301, 257), dtype=np.float32)
+    jet = ceiling_jet_field(*sources, 4.0, x, y, out=out)
+    assert jet is out
+    expected = max(
+        CeilingJetCalculator.calculate_temperature_rise(Q, 4.0 - sz, math.hypot(x[i] - sx, y[j] - sy))
+        for sx, sy, sz, Q in zip(*sources)
+    )
+    assert math.isclose(jet[i, j], expected, rel_tol=1e-6)
+    velocity = ceiling_jet_field(*sources, 4.0, x, y, quantity='velocity')
+    assert np.all(velocity > 0)
+
+    # Invalid sources are reported by index
+    try:
+        radiation_field([0, 1], [0, 1], [0, 0], [100.0, -5.0], 0.3, x, y)
+        assert False, "Negative HRR should be rejected"
+    except ValueError as e:
+        print(f"Invalid source: {e}")
+        assert str(e).startswith("Source 1:")
+
+if __name__ == "__main__":
+    test_fields()
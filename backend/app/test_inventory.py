@@ -0,0 +1,140 @@
+import json
+import math
+
+import numpy as np
+
+import api
+from api import app
+from app.calculations.fire_load import FireLoadCalculator
+from app.calculations.material_properties import MaterialProperties
+from app.inventory import LEVELS, FireLoadInventory
+from app.streaming import RowError
+
+def test_fire_load_inventory():
+    """
+    Test streaming aggregation of item inventories into room, floor and building fire loads.
+    """
+    print("\nTesting Fire Load Inventory:")
+    print("-" * 40)
+
+    nylon = MaterialProperties.get_heat_of_combustion('nylon')
+    pvc = MaterialProperties.get_heat_of_combustion('pvc')
+
+    # Two chunks over three rooms on two floors, with rejected items
+    inventory = FireLoadInventory()
+    first = inventory.add(['nylon', 'pvc', 'nope', 'nylon'], [10.0, 20.0, 5.0, -1.0],
+                          ['101', '101', '102', '102'], floors='1', buildings='A')
+    inventory.add(['pvc', 'nylon'], [4.0, 6.0], ['102', '201'], floors=['1', '2'], buildings='A')
+    inventory.set_areas(['101', '102', '201'], [20.0, 10.0, 30.0], floors=['1', '1', '2'], buildings='A')
+
+    print(f"Row energies: {first.values}, errors {inventory.errors}")
+    assert math.isclose(first.values[1], 20.0 * pvc)
+    assert first.errors()[2:] == ["Material 'nope' not found in database", 'Mass must be a positive number']
+    assert inventory.rows == 6 and len(inventory) == 3
+    assert inventory.errors == {"Material 'nope' not found in database": [1, 2],
+                                'Mass must be a positive number': [1, 3]}
+
+    rooms = inventory.totals()
+    assert rooms['room'] == ['101', '102', '201'] and rooms['floor'] == ['1', '1', '2']
+    assert rooms['items'].tolist() == [2, 1, 1]
+    assert np.allclose(rooms['energy'], [10 * nylon + 20 * pvc, 4 * pvc, 6 * nylon])
+    assert math.isclose(rooms['fire_load_density'].values[0],
+                        FireLoadCalculator.calculate_total_fire_load([10.0, 20.0], [nylon, pvc]) / 20.0)
+
+    floors = inventory.totals('floor')
+    print(f"Floor fire loads: {floors['fire_load_density'].values} MJ/m²")
+    assert floors['floor'] == ['1', '2'] and 'room' not in floors
+    assert np.allclose(floors['mass'], [34.0, 6.0])
+    assert np.allclose(floors['floor_area'], [30.0, 30.0])
+    buildings = inventory.totals('building')
+    assert math.isclose(buildings['energy'][0], rooms['energy'].sum())
+    assert math.isclose(buildings['fire_load_density'].values[0], rooms['energy'].sum() / 60.0)
+
+    # A room without an area has no density, and neither has its floor
+    inventory.add(['nylon'], [1.0], ['202'], floors='2', buildings='A')
+    floors = inventory.totals('floor')
+    assert math.isnan(floors['floor_area'][1]) and floors['fire_load_density'].codes[1] != 0
+
+    # Streamed rows match the same items added as columns
+    rows = [{'material': 'nylon', 'mass': str(m), 'room': f'R{m % 7}', 'floor': f'{m % 7 // 3}'}
+            for m in range(1, 500)]
+    streamed = FireLoadInventory()
+    streamed.add_rows(rows + [RowError('Invalid JSON: x'), {'material': 'pvc', 'mass': 'heavy', 'room': 'R0'}, 'hi'],
+                      chunk_rows=64)
+    columns = FireLoadInventory()
+    columns.add(['nylon'] * len(rows), [r['mass'] for r in rows], [r['room'] for r in rows],
+                [r['floor'] for r in rows])
+    assert streamed.rows == 502
+    assert streamed.errors == {'Invalid JSON: x': [1, 499], 'Mass must be a positive number': [1, 500],
+                               'Each row must be a JSON object': [1, 501]}
+    assert np.allclose(streamed.totals('floor')['energy'], columns.totals('floor')['energy'])
+
+    # Nothing added, or every row rejected: empty totals
+    empty = FireLoadInventory()
+    empty.add_rows([{'material': 'nylon', 'mass': 1, 'room': ['101', '102']}, {'area': 5, 'room': {'id': 1}}])
+    assert empty.errors == {'Room, floor and building must be single labels': [2, 0]}
+    for level in LEVELS:
+        totals = empty.totals(level)
+        assert totals[level] == [] and totals['energy'].size == 0 and totals['floor_area'].dtype == float
+        assert totals['fire_load_density'].values.size == 0
+
+    try:
+        inventory.totals('wing')
+        assert False
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+def test_fire_load_inventory_endpoint():
+    """
+    Test /api/fire_load_inventory with CSV and NDJSON bodies across chunk boundaries.
+    """
+    client = app.test_client()
+    default_chunk_rows, api.STREAM_CHUNK_ROWS = api.STREAM_CHUNK_ROWS, 2
+    try:
+        csv_body = (
+            "item,material,mass,room,floor,building,area\n"
+            "chair,nylon,10,101,1,A,\n"
+            "desk,plywood,30,101,1,A,\n"
+            ",,,101,1,A,25\n"
+            "box,unobtainium,3,102,1,A,\n"
+        )
+        response = client.post('/api/fire_load_inventory?level=floor', data=csv_body, content_type='text/csv')
+        data = response.get_json()
+        print(f"CSV inventory: {data}")
+        energy = 10 * MaterialProperties.get_heat_of_combustion('nylon') \
+            + 30 * MaterialProperties.get_heat_of_combustion('plywood')
+        assert data['building'] == ['A'] and data['floor'] == ['1']
+        assert data['rows'] == 4 and data['items'] == [2]
+        # Room 102 only holds a rejected item, so it is not part of the floor
+        assert math.isclose(data['energy'][0], energy) and data['floor_area'] == [25.0]
+        assert math.isclose(data['fire_load_density'][0], energy / 25.0)
+        assert data['errors'] == {"Material 'unobtainium' not found in database": {"rows": 1, "first_row": 3}}
+
+        body = '\n'.join(json.dumps(row) for row in (
+            {'material': 'pvc', 'mass': 5, 'room': 'K'}, {'room': 'K', 'area': 2.5},
+        ))
+        data = client.post('/api/fire_load_inventory', data=body, content_type='application/x-ndjson').get_json()
+        assert data['room'] == ['K']
+        assert math.isclose(data['fire_load_density'][0], 5 * MaterialProperties.get_heat_of_combustion('pvc') / 2.5)
+
+        response = client.post('/api/fire_load_inventory', data=csv_body.encode().replace(b'desk', b'd\xe9sk'),
+                               content_type='text/csv')
+        assert response.status_code == 200 and response.get_json()['items'] == [1]
+        assert response.get_json()['errors']['Row is not valid UTF-8'] == {'rows': 1, 'first_row': 1}
+
+        data = client.post('/api/fire_load_inventory', data='', content_type='application/x-ndjson').get_json()
+        assert data['room'] == [] and data['energy'] == [] and data['rows'] == 0
+        body = json.dumps({'material': 'pvc', 'mass': 5, 'room': ['K', 'L']})
+        response = client.post('/api/fire_load_inventory?level=building', data=body,
+                               content_type='application/x-ndjson')
+        assert response.status_code == 200 and response.get_json()['building'] == []
+        assert response.get_json()['errors'] == {
+            'Room, floor and building must be single labels': {'rows': 1, 'first_row': 0}}
+
+        assert client.post('/api/fire_load_inventory?level=wing', data='').status_code == 400
+    finally:
+        api.STREAM_CHUNK_ROWS = default_chunk_rows
+
+if __name__ == "__main__":
+    test_fire_load_inventory()
+    test_fire_load_inventory_endpoint()
@@ -0,0 +1,71 @@
+import numpy as np
+
+from app.calculations.flame_height import FlameHeightCalculator
+from app.calculations.smoke_layer import SmokeLayerCalculator
+from app.calculations.temperature_rise import TemperatureRiseCalculator
+from app.inverse import solve_inverse
+from app.runner import CALCULATORS, register_calculator
+from app.utils.batch import BatchResult
+
+def test_inverse_solver():
+    """
+    Test batched inverse solves against forward evaluations and closed-form inverses.
+    """
+    print("\nTesting Inverse Solver:")
+    print("-" * 40)
+
+    # What HRR gives a given MQH temperature rise
+    targets = np.linspace(100, 900, 2000)
+    Q = solve_inverse('mqh_temperature', 'Q', targets, {'A0': 2.0, 'H0': 2.0, 'AT': 50.0, 'hk': 0.03})
+    rise = TemperatureRiseCalculator.calculate_mqh_temperature_batch(Q.values, 2.0, 2.0, 50.0, 0.03).values
+    print(f"HRR for a 500 °C rise: {Q.values[np.searchsorted(targets, 500)]:.1f} kW")
+    assert Q.ok.all()
+    assert np.allclose(rise, targets, rtol=1e-8)
+
+    # Matches the closed-form inverse of the flame height correlation
+    heights = np.array([[1.0, 2.0], [3.0, 4.0]])
+    solved = solve_inverse('flame_height', 'Q', heights, {'D': 1.5})
+    closed = FlameHeightCalculator.calculate_heat_release_batch(heights, 1.5)
+    assert solved.values.shape == (2, 2)
+    assert np.allclose(solved.values, closed.values, rtol=1e-8)
+
+    # Smoke filling time for the second output, broadcast inputs and error rows
+    Q = solve_inverse('smoke_filling_time', 'Q', [120.0, 120.0, np.nan, 1e12],
+                      {'room_height': 3.0, 'floor_area': 100.0, 'target_height': [1.5, 5.0, 1.5, 1.5]})
+    errors = Q.errors()
+    print(f"Filling time HRRs: {Q.values.tolist()}, errors: {errors}")
+    check = SmokeLayerCalculator.calculate_filling_time_batch(Q.values[0], 3.0, 100.0, 1.5).values
+    assert np.isclose(check, 120.0)
+    assert errors[1] == 'Target height must be less than room height'
+    assert errors[2] == 'Target must be a finite number'
+    assert errors[3].startswith('No Q between')
+
+    # Outputs of multi-output calculators are picked by name
+    width = solve_inverse('natural_vent_flow', 'vent_width', 5.0,
+                          {'vent_height': 2.0, 'neutral_plane': 1.0, 'temp_hot': 500.0, 'temp_ambient': 20.0},
+                          output='mass_flow_out')
+    assert width.ok.all()
+
+    # A NaN inside the bracket that the calculator does not flag is not a solution
+    def holed(x):
+        values = np.where((x > 4.8) & (x < 5.2), np.nan, x)
+        return BatchResult(values, np.zeros(values.shape, dtype=np.int32), ())
+
+    register_calculator('holed', holed, ('x',))
+    try:
+        x = solve_inverse('holed', 'x', [5.0, 2.0], {})
+    finally:
+        del CALCULATORS['holed']
+    print(f"Holed solutions: {x.values.tolist()}, errors: {x.errors()}")
+    assert x.errors() == ['Solving for x did not converge', None]
+    assert np.isnan(x.values[0]) and np.isclose(x.values[1], 2.0)
+
+    for bad in (('nope', 'Q'), ('flame_height', 'H')):
+        try:
+            solve_inverse(*bad, 1.0, {'D': 1.0})
+            assert False, "Should have raised"
+        except ValueError as e:
+            print(f"Successfully caught error: {e}")
+
+if __name__ == "__main__":
+    test_inverse_solver()
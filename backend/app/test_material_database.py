@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from app.calculations.heat_release import HeatReleaseCalculator
+from app.calculations.material_database import main, read_database, write_database
+from app.calculations.material_properties import MaterialProperties
+
+def test_material_database():
+    """
+    Test writing, memory-mapping and serving an on-disk material database.
+    """
+    print("\nTesting Material Database:")
+    print("-" * 40)
+
+    fuels = {f'fuel_{i:04d}': {'name': f'Fuel {i}', 'heat_of_combustion': 10.0 + i % 30,
+                               'mass_flux': None if i % 3 == 0 else float(i % 50 + 5)}
+             for i in range(3000)}
+
+    with tempfile.TemporaryDirectory() as path:
+        write_database(path, fuels=fuels)
+        tables = read_database(path)
+        print(f"Tables: {sorted(tables)}, fuels: {len(tables['fuels'])}")
+        assert set(tables) == {'fuels'}
+        assert isinstance(tables['fuels'].columns['mass_flux'], np.memmap)
+        assert tables['fuels'].row('fuel_0004') == {'name': 'Fuel 4', 'heat_of_combustion': 14.0, 'mass_flux': 9.0}
+
+        MaterialProperties.use_database(path)
+        try:
+            assert MaterialProperties.get_heat_of_combustion('fuel_0031') == 11.0
+            # Linings are not in this database, so the built-in table still serves them
+            assert MaterialProperties.get_thermal_properties('brick')['conductivity'] == 0.8
+            result = HeatReleaseCalculator.calculate_hrr_batch(
+                np.array(['fuel_0004', 'fuel_0003', 'gasoline']), np.full(3, 2.0))
+            print(f"HRR: {result.values.tolist()}, errors: {result.errors()}")
+            assert abs(result.values[0] - 252.0) < 1e-9
+            assert result.errors()[1:] == ["Mass flux not available for material: fuel_0003",
+                                           "Material 'gasoline' not found in database"]
+            assert len(MaterialProperties.get_all_fuels()) == 3000
+        finally:
+            MaterialProperties.use_database(None)
+        assert MaterialProperties.get_heat_of_combustion('gasoline') == 43.7
+
+    # Command line build from JSON
+    with tempfile.TemporaryDirectory() as path:
+        source = os.path.join(path, 'source.json')
+        with open(source, 'w') as f:
+            json.dump({'linings': MaterialProperties.THERMAL_PROPERTIES}, f)
+        main([source, os.path.join(path, 'db')])
+        linings = read_database(os.path.join(path, 'db'))['linings']
+        assert linings.value('concrete', 'density') == 2300
+
+def test_database_switch_invalidates_cache():
+    """
+    Test that cached single-item responses are not served across a database switch.
+    """
+    from api import app
+
+    client = app.test_client()
+    payload = {'material': 'heptane', 'burningArea': 1.0}
+    default_version = MaterialProperties.data_version()
+    builtin = client.post('/api/heat_release', json=payload)
+    with tempfile.TemporaryDirectory() as path:
+        write_database(path, fuels={'heptane': {'name': 'Heptane', 'heat_of_combustion': 10.0, 'mass_flux': 100.0}})
+        MaterialProperties.use_database(path)
+        try:
+            assert MaterialProperties.data_version() != default_version
+            switched = client.post('/api/heat_release', json=payload)
+            print(f"Built-in: {builtin.get_json()}, database: {switched.get_json()}")
+            assert switched.headers['X-Cache'] == 'MISS'
+            assert abs(switched.get_json()['value'] - 1000.0) < 1e-9
+        finally:
+            MaterialProperties.use_database(None)
+    assert MaterialProperties.data_version() == default_version
+    again = client.post('/api/heat_release', json=payload)
+    assert again.headers['X-Cache'] == 'HIT' and again.get_data() == builtin.get_data()
+
+if __name__ == "__main__":
+    test_material_database()
+    test_database_switch_invalidates_cache()
@@ -1,4 +1,7 @@
-from calculations.material_properties import MaterialProperties
+import numpy as np
+
+from calculations.material_properties import MaterialProperties, MaterialTable
+from utils.batch import MaskedValidator
 
 def test_material_properties():
     """
@@ -42,5 +45,57 @@ def test_material_properties():
     except ValueError as e:
         print(f"Successfully caught error: {e}")
 
+def test_material_table():
+    """
+    Test the columnar material table against the dictionaries it indexes.
+    """
+    print("\nTesting Material Table:")
+    print("-" * 40)
+
+    fuels = MaterialProperties.fuel_table()
+    assert fuels is MaterialTable.of(MaterialProperties.FUELS)
+    assert len(fuels) == len(MaterialProperties.FUELS)
+    for key, entry in MaterialProperties.FUELS.items():
+        assert fuels.value(key, 'heat_of_combustion') == entry['heat_of_combustion']
+        assert np.isnan(fuels.value(key, 'mass_flux')) == (entry['mass_flux'] is None)
+
+    keys = np.array(['gasoline', 'kerosene', 'unobtainium', 'gasoline'])
+    check = MaskedValidator(keys.shape)
+    indices = fuels.lookup(keys, check)
+    flux = fuels.take('mass_flux', indices, check, missing_message="No flux for {key}")
+    print(f"Indices: {indices.tolist()}, mass flux: {flux.tolist()}")
+    assert indices[0] == indices[3] == fuels.index['gasoline'] and indices[2] == -1
+    assert flux[0] == 55.0 and np.isnan(flux[1:3]).all()
+    assert check.messages == ["Material 'unobtainium' not found in database", "No flux for kerosene"]
+    assert check.codes.tolist() == [0, 2, 1, 0]
+
+    # A table without a column flags its rows instead of failing with KeyError
+    trimmed = MaterialTable.from_entries({'a': {'name': 'A', 'density': 1.0}, 'b': {'name': 'B', 'density': 2.0}})
+    keys = np.array(['b', 'x', 'a', 'y', 'x'])
+    check = MaskedValidator(keys.shape)
+    flux = trimmed.take('mass_flux', trimmed.lookup(keys, check), check, missing_message="No flux for {key}")
+    assert np.isnan(flux).all()
+    assert check.messages == ["Material 'x' not found in database", "Material 'y' not found in database",
+                              "No flux for a", "No flux for b"]
+    assert check.codes.tolist() == [4, 1, 3, 2, 1]
+    try:
+        trimmed.take('heat_of_combustion', np.array([0]))
+        assert False
+    except ValueError as e:
+        print(f"Expected error: {e}")
+
+    # A single broadcast key is looked up once
+    single = fuels.lookup(np.broadcast_to(np.asarray('heptane'), (1000,)))
+    assert (single == fuels.index['heptane']).all()
+
+    properties = MaterialProperties.get_thermal_properties('concrete')
+    assert properties == {'name': 'Concrete', 'conductivity': 1.6, 'density': 2300.0, 'specific_heat': 0.92}
+    try:
+        MaterialProperties.get_mass_burning_flux('kerosene')
+        assert False, "Should have raised for a fuel without mass flux"
+    except ValueError as e:
+        print(f"Successfully caught error: {e}")
+
 if __name__ == "__main__":
-    test_material_properties()
\ No newline at end of file
+    test_material_properties()
+    test_material_table()
\ No newline at end of file
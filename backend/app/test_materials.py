@@ -0,0 +1,76 @@
+import tempfile
+
+from api import app
+from app.calculations.material_database import write_database
+from app.calculations.material_properties import MaterialProperties
+from app.materials import MaterialCatalog
+
+def test_materials_endpoint():
+    """
+    Test filtering, pagination and ETag revalidation of /api/materials.
+    """
+    print("\nTesting Materials Endpoint:")
+    print("-" * 40)
+
+    client = app.test_client()
+    full = client.get('/api/materials')
+    fuels = full.get_json()
+    print(f"Full list: {len(fuels)} fuels, ETag {full.headers['ETag']}")
+    assert fuels == MaterialProperties.get_all_fuels()
+    assert list(fuels) == sorted(fuels)
+
+    revalidated = client.get('/api/materials', headers={'If-None-Match': full.headers['ETag']})
+    assert revalidated.status_code == 304
+
+    filtered = client.get('/api/materials?q=PMMA&has_mass_flux=true').get_json()
+    print(f"PMMA with mass flux: {list(filtered)}")
+    assert list(filtered) == ['pmma_granular']
+
+    in_range = client.get('/api/materials?min_hoc=40&max_hoc=44').get_json()
+    assert in_range and all(40 <= fuel['heat_of_combustion'] <= 44 for fuel in in_range.values())
+
+    page = client.get('/api/materials?has_mass_flux=false&limit=5&offset=5').get_json()
+    missing = [key for key, fuel in fuels.items() if fuel['mass_flux'] is None]
+    print(f"Page: total {page['total']}, keys {list(page['materials'])}")
+    assert page['total'] == len(missing) and list(page['materials']) == missing[5:10]
+    assert client.get('/api/materials?limit=5&offset=5').headers['ETag'] != full.headers['ETag']
+
+    assert client.get('/api/materials?min_hoc=abc').status_code == 400
+    assert client.get('/api/materials?limit=0').status_code == 400
+
+def test_catalog_follows_database():
+    """
+    Test that the listing switches when a material database is loaded.
+    """
+    print("\nTesting Materials Catalog with a Database:")
+    print("-" * 40)
+
+    builtin = MaterialCatalog.current()
+    with tempfile.TemporaryDirectory() as path:
+        write_database(path, fuels={'wax': {'name': 'Paraffin Wax', 'heat_of_combustion': 43.0, 'mass_flux': None}})
+        MaterialProperties.use_database(path)
+        try:
+            listing = app.test_client().get('/api/materials').get_json()
+            print(f"Database listing: {listing}")
+            assert listing == {'wax': {'heat_of_combustion': 43.0, 'mass_flux': None, 'name': 'Paraffin Wax'}}
+        finally:
+            MaterialProperties.use_database(None)
+    assert MaterialCatalog.current().etag == builtin.etag
+
+    # A fuel table without a mass_flux column lists and filters as if no fuel had one
+    with tempfile.TemporaryDirectory() as path:
+        write_database(path, fuels={'wax': {'name': 'Paraffin Wax', 'heat_of_combustion': 43.0}})
+        MaterialProperties.use_database(path)
+        try:
+            client = app.test_client()
+            response = client.get('/api/materials')
+            assert response.status_code == 200
+            assert response.get_json() == {'wax': {'heat_of_combustion': 43.0, 'name': 'Paraffin Wax'}}
+            assert MaterialCatalog.current().select(has_mass_flux=True).size == 0
+            assert MaterialCatalog.current().select(has_mass_flux=False).tolist() == [0]
+        finally:
+            MaterialProperties.use_database(None)
+
+if __name__ == "__main__":
+    test_materials_endpoint()
+    test_catalog_follows_database()
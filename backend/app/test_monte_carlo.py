@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+
+from app.monte_carlo import run_monte_carlo
+from app.utils.sketch import QuantileSketch
+
+ROOM = {
+    'room_length': ('uniform', 3, 8),
+    'room_width': ('uniform', 3, 6),
+    'room_height': ('normal', 2.6, 0.15),
+    'opening_width': ('triangular', 0.7, 0.9, 1.8),
+    'opening_height': ('uniform', 1.9, 2.2),
+    'wall_material': ('choice', ['gypsum_board', 'concrete'], [0.7, 0.3]),
+    'fuel': ('choice', ['gasoline', 'heptane', 'kerosene']),
+    'burning_area': ('lognormal', 0, 0.5),
+}
+
+def test_monte_carlo_run():
+    """
+    Test that chunked Monte Carlo runs are reproducible and count rejected samples.
+    """
+    print("\nTesting Monte Carlo Engine:")
+    print("-" * 40)
+
+    results = run_monte_carlo(ROOM, 30000, seed=7, chunk_size=4000, exceedance={'temperature_rise': [200, 400]})
+    temperature = results['outputs']['temperature_rise']
+
+    print(f"Temperature rise percentiles: {temperature['percentiles']}")
+    assert results == run_monte_carlo(ROOM, 30000, seed=7, chunk_size=4000, exceedance={'temperature_rise': [200, 400]})
+
+    # Kerosene has no mass flux in the database, so about a third of the samples are rejected
+    assert results['valid'] + results['errors']["Mass flux not available for material: kerosene"] == 30000
+    assert temperature['percentiles'][5] < temperature['percentiles'][50] < temperature['percentiles'][95]
+    assert 0 < temperature['exceedance'][400] < temperature['exceedance'][200] < 1
+
+def test_quantile_sketch():
+    """
+    Test that the streaming quantile sketch stays within its relative accuracy.
+    """
+    values = np.random.default_rng(0).lognormal(3, 1, 200000)
+    sketch = QuantileSketch(relative_accuracy=0.005)
+    for chunk in np.array_split(values, 9):
+        sketch.add(chunk)
+
+    for q, estimate in zip((0.05, 0.5, 0.95), sketch.quantiles([0.05, 0.5, 0.95])):
+        assert math.isclose(estimate, np.quantile(values, q, method='lower'), rel_tol=0.01)
+
+if __name__ == "__main__":
+    test_monte_carlo_run()
+    test_quantile_sketch()
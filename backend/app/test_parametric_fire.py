@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+
+from app.calculations.fire_load import FireLoadCalculator
+from app.calculations.parametric_fire import ParametricFireCalculator
+
+def _heating(t_star):
+    return 20 + 1325 * (1 - 0.324 * math.exp(-0.2 * t_star) - 0.204 * math.exp(-1.7 * t_star)
+                        - 0.472 * math.exp(-19 * t_star))
+
+def test_parametric_fire():
+    """
+    Test Eurocode parametric temperature-time curves for batches of compartments.
+    """
+    print("\nTesting Parametric Fire Curves:")
+    print("-" * 40)
+
+    # Concrete room, O = 0.04: ventilation controlled, burning out after one hour
+    q_f = FireLoadCalculator.calculate_fire_load_density(20000.0, 25.0)
+    curve = ParametricFireCalculator.temperature_curve(4.0, 1.0, 100.0, 25.0, q_f, 'concrete',
+                                                       times=np.arange(0.0, 8 * 3600.0 + 1, 60.0))
+    gamma = (0.04 / math.sqrt(1.6 * 2300 * 920))**2 / (0.04 / 1160)**2
+    print(f"Peak {curve['peak_temperature']:.1f} °C after {curve['peak_time'] / 60:.0f} min")
+    assert math.isclose(curve['peak_time'], 3600.0)
+    assert math.isclose(curve['peak_temperature'], _heating(gamma))
+    assert math.isclose(curve['temperature'][30], _heating(gamma * 0.5))
+    # Cooling at 625 °C per hour of t* (t*_max = Γ < 0.5), down to ambient within eight hours
+    assert math.isclose(curve['temperature'][90], curve['peak_temperature'] - 625 * gamma * 0.5)
+    assert curve['temperature'][-1] == 20.0
+
+    # Compartments × times, with a fuel controlled gypsum room and invalid rooms
+    times = np.arange(0.0, 3 * 3600.0 + 1, 60.0)
+    batch = ParametricFireCalculator.temperature_curve_batch(
+        Av=[4.0, 10.0, 4.0, 4.0], heq=[1.0, 2.0, 1.0, 1.0], At=[100.0, 200.0, 100.0, 100.0],
+        Af=[25.0, 50.0, 25.0, 600.0], fire_load_density=[800.0, 300.0, 800.0, 800.0],
+        wall_material=['concrete', 'gypsum_board', 'brick', 'concrete'], growth=['medium', 'fast', 'rapid', 'slow'],
+        times=times,
+    )
+    temperature = batch['temperature']
+    print(f"Temperatures every 30 min:\n{temperature.values[:, ::30].round(0)}")
+    assert temperature.values.shape == (4, times.size)
+    assert np.array_equal(temperature.values[0], np.array(curve['temperature'])[:times.size])
+    assert batch['peak_time'].values[1] == 15 * 60.0
+    peak_index = 15
+    assert math.isclose(temperature.values[1, peak_index], batch['peak_temperature'].values[1])
+    assert temperature.values[1, peak_index + 1] < batch['peak_temperature'].values[1]
+    assert batch['peak_temperature'].errors()[2:] == [
+        "Fire growth rate must be 'slow', 'medium' or 'fast'",
+        "Opening and floor areas must be less than the enclosure area",
+    ]
+    assert np.isnan(temperature.values[2]).all() and temperature.errors()[3 * times.size] is not None
+
+if __name__ == "__main__":
+    test_parametric_fire()
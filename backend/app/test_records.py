@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+from app.calculations.area_volume import AreaVolumeCalculator
+from app.calculations.vent_flow import VentFlowCalculator
+from app.records import calculator_records
+from app.runner import ScenarioRunner
+
+def test_calculator_records():
+    """
+    Test typed input/result records and their structured array equivalents.
+    """
+    print("\nTesting Calculator Records:")
+    print("-" * 40)
+
+    # Scalar path: one parse on construction, same result as the scalar method
+    vents = calculator_records('natural_vent_flow')
+    inputs = vents.Inputs.from_dict({'vent_height': '2.0', 'vent_width': 1, 'neutral_plane': 1.0,
+                                     'temp_hot': 300, 'temp_ambient': 20, 'units': 'SI'})
+    result = vents.evaluate(inputs)
+    print(f"{inputs} -> {result}")
+    assert inputs.vent_height == 2.0 and not hasattr(inputs, '__dict__')
+    assert result.as_dict() == VentFlowCalculator.natural_vent_flow(2.0, 1.0, 1.0, 300.0, 20.0)
+
+    failed = vents.evaluate(vents.Inputs(vent_height=2.0, vent_width=1.0, neutral_plane=1.0,
+                                         temp_hot=10.0, temp_ambient=20.0))
+    assert math.isnan(failed.mass_flow_in)
+    assert failed.as_dict() == {'error': 'Hot gas temperature cannot be below ambient temperature'}
+
+    # Batch path: records pack into a structured array evaluated with one call
+    rooms = calculator_records('rectangular_compartment')
+    batch = [rooms.Inputs(length=4.0, width=3.0, height=h) for h in (2.4, -1.0, 3.0)]
+    table = rooms.to_array(batch)
+    out, messages = rooms.evaluate_array(table)
+    print(f"Structured results: {out}")
+    assert table.dtype.names == ('length', 'width', 'height')
+    assert out['code'].tolist() == [0, 1, 0] and messages == ('All dimensions must be positive',)
+    assert out['volume'][2] == AreaVolumeCalculator.rectangular_compartment(4.0, 3.0, 3.0)['volume']
+    assert rooms.from_array(table) == batch
+    unpacked = rooms.from_array(out, messages)
+    assert unpacked[0] == rooms.evaluate(batch[0]) and unpacked[1].error == messages[0]
+
+    # Structured arrays feed the scenario runner directly; material keys are typed text
+    fires = calculator_records('heat_release')
+    table = fires.to_array([fires.Inputs(material_key=key, burning_area=2.0) for key in ('heptane', 'nope')])
+    assert np.isnan(fires.Inputs.DEFAULTS['manual_mass_flux']) and table.dtype['material_key'].kind == 'U'
+    values = ScenarioRunner(workers=1).run('heat_release', table)['value']
+    assert values.values[0] == fires.evaluate_array(table)[0]['value'][0]
+    assert values.codes[1] != 0
+
+    for bad, message in (({'length': 1.0}, 'Missing inputs: width, height'),
+                         ({'length': 'x', 'width': 1, 'height': 1}, "Input 'length' must be a number"),
+                         ({'length': 1, 'width': 1, 'height': 1, 'depth': 1}, 'Unknown inputs: depth')):
+        try:
+            rooms.Inputs(**bad)
+            assert False
+        except ValueError as e:
+            print(f"Expected error: {e}")
+            assert str(e) == message
+
+if __name__ == "__main__":
+    test_calculator_records()
@@ -0,0 +1,37 @@
+import numpy as np
+
+from app.calculations.flashover import FlashoverCalculator
+from app.runner import ScenarioRunner
+
+def test_scenario_runner():
+    """
+    Test that a sweep split across worker processes matches one vectorized call.
+    """
+    print("\nTesting Scenario Runner:")
+    print("-" * 40)
+
+    rng = np.random.default_rng(0)
+    scenarios = {
+        'At': rng.uniform(50, 300, 5000),
+        'A0': rng.uniform(-0.5, 4, 5000),
+        'H0': rng.uniform(1.5, 2.5, 5000),
+        'wall_material': rng.choice(['gypsum_board', 'concrete', 'not_a_wall'], 5000),
+    }
+    results = ScenarioRunner(workers=2, chunk_size=700).run('mccaffrey_flashover', scenarios)
+    expected = FlashoverCalculator.mccaffrey_correlation_batch(
+        scenarios['At'], scenarios['A0'], scenarios['H0'], scenarios['wall_material']
+    )
+
+    print(f"Error messages: {results['value'].messages}")
+    assert np.array_equal(results['value'].values, expected.values, equal_nan=True)
+    assert results['value'].errors() == expected.errors()
+
+    # Constants broadcast against columns, and multi-output calculators share one code column
+    flows = ScenarioRunner(workers=1).run('natural_vent_flow', {
+        'vent_height': 2.0, 'vent_width': 1.0, 'neutral_plane': [1.0, 3.0],
+        'temp_hot': 500, 'temp_ambient': 20,
+    })
+    assert flows['mass_flow_in'].errors() == [None, "Neutral plane must lie within the vent opening"]
+
+if __name__ == "__main__":
+    test_scenario_runner()
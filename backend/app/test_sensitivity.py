@@ -0,0 +1,91 @@
+import numpy as np
+
+from api import app
+from app.runner import CALCULATORS
+from app.sensitivity import JACOBIANS, evaluate_with_jacobian, sensitivity_report
+
+CASES = {
+    'mccaffrey_flashover': {'At': [40.0, 80.0], 'A0': [1.5, 2.5], 'H0': [1.2, 2.1], 'wall_material': 'concrete'},
+    'babrauskas_flashover': {'A0': [1.5, 2.5], 'H0': [1.2, 2.1]},
+    'thomas_flashover': {'At': [40.0, 80.0], 'A0': [1.5, 2.5], 'H0': [1.2, 2.1]},
+    'mqh_temperature': {'Q': [200.0, 800.0], 'A0': 2.0, 'H0': 2.0, 'AT': 50.0, 'hk': 0.03},
+    'ceiling_jet_temperature': {'Q': [200.0, 800.0], 'H': 3.0, 'r': [0.3, 2.0]},
+    'ceiling_jet_velocity': {'Q': [200.0, 800.0], 'H': 3.0, 'r': [0.3, 2.0]},
+    'natural_vent_flow': {'vent_height': 2.0, 'vent_width': 1.0, 'neutral_plane': [0.6, 1.3],
+                          'temp_hot': [250.0, 550.0], 'temp_ambient': 20.0},
+}
+
+def _output(result, name):
+    return (result if name == 'value' else result[name]).values
+
+def test_jacobians():
+    """
+    Test every analytic Jacobian against central finite differences.
+    """
+    print("\nTesting Analytic Jacobians:")
+    print("-" * 40)
+
+    assert set(CASES) == set(JACOBIANS)
+    for calculator, inputs in CASES.items():
+        calculate = CALCULATORS[calculator][0]
+        results, jacobian = evaluate_with_jacobian(calculator, inputs)
+        worst = 0.0
+        for output, partials in jacobian.items():
+            for name, partial in partials.items():
+                x = np.asarray(inputs[name], dtype=float)
+                h = 1e-6 * np.maximum(np.abs(x), 1.0)
+                up = _output(calculate(**dict(inputs, **{name: x + h})), output)
+                down = _output(calculate(**dict(inputs, **{name: x - h})), output)
+                numeric = (up - down) / (2 * h)
+                assert np.allclose(partial, numeric, rtol=1e-6, atol=1e-9), (calculator, output, name)
+                worst = max(worst, float(np.max(np.abs(partial - numeric))))
+        print(f"{calculator}: largest difference {worst:.2e}")
+
+    # Failed rows have NaN partials
+    results, jacobian = evaluate_with_jacobian('mqh_temperature', {'Q': [500.0, -1.0], 'A0': 2.0, 'H0': 2.0,
+                                                                   'AT': 50.0, 'hk': 0.03})
+    assert np.isnan(jacobian['value']['Q'][1]) and not np.isnan(jacobian['value']['Q'][0])
+
+def test_sensitivity_report():
+    """
+    Test elasticities, tornado data and the sensitivity endpoints.
+    """
+    print("\nTesting Sensitivity Report:")
+    print("-" * 40)
+
+    report = sensitivity_report('mqh_temperature', {'Q': 500.0, 'A0': 2.0, 'H0': 2.0, 'AT': 50.0, 'hk': 0.03})
+    elasticity = report['value']['elasticity']
+    print(f"Elasticities: {elasticity}")
+    assert np.isclose(elasticity['Q'], 2/3) and np.isclose(elasticity['H0'], -1/6)
+    tornado = report['value']['tornado']
+    assert tornado[0]['input'] == 'Q'
+    assert [entry['swing'] for entry in tornado] == sorted((entry['swing'] for entry in tornado), reverse=True)
+
+    client = app.test_client()
+    response = client.post('/api/jacobian', json={
+        'calculator': 'ceiling_jet_velocity', 'inputs': {'Q': [500, -1], 'H': 3, 'r': 2},
+    })
+    data = response.get_json()
+    print(f"Jacobian response: {data}")
+    assert data['errors'] == [None, 'Heat release rate must be positive']
+    assert data['jacobian']['value']['Q'][1] is None
+
+    response = client.post('/api/sensitivity', json={
+        'calculator': 'natural_vent_flow', 'variation': 0.05,
+        'inputs': {'vent_height': 2, 'vent_width': 1, 'neutral_plane': 1, 'temp_hot': 400, 'temp_ambient': 20},
+    })
+    assert response.status_code == 200
+    assert set(response.get_json()) == {'mass_flow_in', 'mass_flow_out'}
+    assert client.post('/api/sensitivity', json={'calculator': 'thomas_flashover',
+                                                 'inputs': {'At': 60, 'A0': -2, 'H0': 2}}).status_code == 400
+
+    # Missing or non-numeric values of numeric inputs are client errors
+    for inputs in ({'Q': None, 'H': 3, 'r': 2}, {'Q': [500, None], 'H': 3, 'r': 2}, {'Q': 'big', 'H': 3, 'r': 2}):
+        for route in ('/api/jacobian', '/api/sensitivity'):
+            response = client.post(route, json={'calculator': 'ceiling_jet_velocity', 'inputs': inputs})
+            assert response.status_code == 400
+            assert response.get_json() == {'error': "Input 'Q' must be a number"}
+
+if __name__ == "__main__":
+    test_jacobians()
+    test_sensitivity_report()
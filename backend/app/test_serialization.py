@@ -0,0 +1,86 @@
+import json
+import math
+
+import numpy as np
+
+import app.serialization as serialization
+from api import app
+from app.serialization import (FLOAT_ARRAYS, FloatArraySerializer, JsonSerializer, negotiate,
+                               round_significant)
+
+def test_serializers():
+    """
+    Test JSON and float-array encoding of responses holding NumPy arrays.
+    """
+    print("\nTesting Response Serializers:")
+    print("-" * 40)
+
+    values = np.array([1234.5678, np.nan, -0.000123456, 0.0])
+    response = {'values': values, 'codes': np.array([0, 1, 0, 0], dtype=np.int32), 'name': 'x', 'n': np.int64(4)}
+
+    # JSON writes arrays directly, failed rows as null; the stdlib fallback matches
+    text = JsonSerializer().dumps(response)
+    print(f"JSON: {text}")
+    assert json.loads(text) == {'values': [1234.5678, None, -0.000123456, 0.0], 'codes': [0, 1, 0, 0],
+                                'name': 'x', 'n': 4}
+    default_orjson, serialization.orjson = serialization.orjson, None
+    try:
+        assert json.loads(JsonSerializer().dumps(response)) == json.loads(text)
+        # Python and NumPy floats outside arrays become null too, not the invalid NaN token
+        fallback = JsonSerializer().dumps({'a': float('nan'), 'b': [1.0, float('inf')], 'c': np.float32('nan')})
+        assert fallback == b'{"a":null,"b":[1.0,null],"c":null}'
+    finally:
+        serialization.orjson = default_orjson
+
+    # Precision rounds to significant digits and shortens the text
+    assert round_significant(values, 3)[[0, 2, 3]].tolist() == [1230.0, -0.000123, 0.0]
+    assert json.loads(JsonSerializer(3).dumps({'a': values, 'b': [2 / 3, 1.0], 'c': 123456.0}))['b'] == [0.667, 1.0]
+    assert JsonSerializer(3).dumps({'c': 123456.0}) == b'{"c":123000.0}'
+
+    # Float arrays round trip bit for bit, NaN included, with non-array fields in the header
+    body = FloatArraySerializer().dumps({'results': response, 'list': [values[:2], 'text']})
+    decoded = FloatArraySerializer.loads(body)
+    print(f"Float arrays: {len(body)} bytes -> {decoded}")
+    assert body[:4] == b'FCA1' and len(body) % 8 == 0
+    assert np.array_equal(decoded['results']['values'], values, equal_nan=True)
+    assert decoded['results']['codes'].dtype == np.dtype('<i4')
+    assert decoded['results']['name'] == 'x' and decoded['list'][1] == 'text'
+    single = FloatArraySerializer.loads(FloatArraySerializer(6).dumps({'v': values}))['v']
+    assert single.dtype == np.dtype('<f4') and np.allclose(single, values, equal_nan=True)
+
+    assert isinstance(negotiate(None), JsonSerializer)
+    for bad in ('0', '18', 'abc'):
+        try:
+            negotiate(None, bad)
+            assert False
+        except ValueError as e:
+            print(f"Expected error: {e}")
+
+def test_negotiated_responses():
+    """
+    Test content negotiation and precision on the API.
+    """
+    client = app.test_client()
+    body = {'calculator': 'thomas_flashover', 'inputs': {'At': [40.0, -1.0], 'A0': 2.0, 'H0': 2.0}}
+
+    data = client.post('/api/jacobian', json=body).get_json()
+    assert data['values']['value'][1] is None and data['errors'][0] is None
+
+    rounded = client.post('/api/jacobian?precision=3', json=body).get_json()
+    assert rounded['values']['value'][0] == float(f"{data['values']['value'][0]:.3g}")
+    assert client.post('/api/jacobian?precision=x', json=body).status_code == 400
+
+    response = client.post('/api/jacobian', json=body, headers={'Accept': FLOAT_ARRAYS})
+    assert response.mimetype == FLOAT_ARRAYS
+    decoded = FloatArraySerializer.loads(response.get_data())
+    assert decoded['values']['value'][0] == data['values']['value'][0]
+    assert math.isnan(decoded['values']['value'][1])
+
+    batch = client.post('/api/batch?precision=4', json=[
+        {'calculator': 't_squared_growth', 'calculateMode': 'heatRelease', 'growthRate': 'fast', 'time': 61},
+    ]).get_json()
+    assert batch['results'][0]['value'] == float(f"{0.04689 * 61**2:.4g}")
+
+if __name__ == "__main__":
+    test_serializers()
+    test_negotiated_responses()
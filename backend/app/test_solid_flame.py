@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+import numpy as np
+
+from app.calculations import view_factor
+from app.calculations.solid_flame import SolidFlameCalculator
+from app.calculations.view_factor import CYLINDER_TABLE, VIEW_FACTOR_RTOL, ViewFactorTable, cylinder_view_factors
+
+def _integrated_view_factors(h, S, n=400):
+    """Vertical and horizontal view factors of a unit radius cylinder by direct surface integration."""
+    angle = (np.arange(n) + 0.5) * 2 * np.pi / n
+    z = ((np.arange(n) + 0.5) * h / n)[:, np.newaxis]
+    x, y = np.cos(angle), np.sin(angle)
+    dx, distance2 = x - S, (x - S)**2 + y**2 + z**2
+    surface = np.maximum(-(x * dx + y * y) / np.sqrt(distance2), 0)
+    weight = surface / (np.pi * distance2) * (2 * np.pi / n) * (h / n)
+    return np.sum(weight * -dx / np.sqrt(distance2)), np.sum(weight * z / np.sqrt(distance2))
+
+def test_solid_flame():
+    """
+    Test the solid flame model, its view factors and the interpolated table.
+    """
+    print("\nTesting Solid Flame Radiation:")
+    print("-" * 40)
+
+    # Mudan's closed forms against surface integration (h = 2 Hf / D, S = 2 L / D)
+    for h, S in [(2.0, 2.0), (6.0, 3.0), (1.0, 1.5)]:
+        exact = np.array(cylinder_view_factors(h, S))
+        integrated = np.array(_integrated_view_factors(h, S))
+        print(f"h={h}, S={S}: Fv, Fh = {exact.round(5)} (integrated {integrated.round(5)})")
+        assert np.allclose(exact, integrated, rtol=1e-4)
+
+    # The table stays within its documented bound everywhere on its range
+    rng = np.random.default_rng(7)
+    h = np.exp(rng.uniform(np.log(1e-2), np.log(1e3), 200000))
+    S = 1 + np.exp(rng.uniform(np.log(1e-4), np.log(1e4), 200000))
+    error = np.max(np.abs(CYLINDER_TABLE(h, S) / CYLINDER_TABLE.exact(h, S) - 1))
+    print(f"Largest table error: {error:.2e}")
+    assert error < VIEW_FACTOR_RTOL
+
+    # 3 m pool with a 6 m flame, target 1.5 m from its edge
+    E = SolidFlameCalculator.emissive_power(3.0)
+    flux = SolidFlameCalculator.cylinder_heat_flux(E, 3.0, 6.0, 3.0)
+    exact = SolidFlameCalculator.cylinder_heat_flux(E, 3.0, 6.0, 3.0, exact=True)
+    print(f"E = {E:.2f} kW/m², flux at 3 m: {flux:.3f} kW/m² (exact {exact:.3f})")
+    assert abs(E - 58 * 10**(-0.00823 * 3.0)) < 1e-12
+    assert abs(flux / exact - 1) < VIEW_FACTOR_RTOL
+
+    batch = SolidFlameCalculator.cylinder_heat_flux_batch(E, 3.0, [6.0, 6.0, -1.0], [3.0, 1.0, 3.0])
+    assert batch.errors()[1] == "Target must be outside the flame."
+    assert batch.errors()[2] == "Flame size and height must be positive."
+
+    # A very large flame front fills the target's view
+    assert abs(SolidFlameCalculator.plane_heat_flux(50.0, 1e6, 1e6, 1.0) - 25.0) < 1e-3
+    plane = SolidFlameCalculator.plane_heat_flux_batch(50.0, 4.0, [3.0, 3.0], [2.0, 0.0])
+    assert plane.values[0] < 25.0 and plane.errors()[1] == "Distance (S) must be positive."
+
+    # Tables are written to the cache directory once and read back afterwards
+    with tempfile.TemporaryDirectory() as path:
+        default, view_factor.VIEW_FACTOR_CACHE = view_factor.VIEW_FACTOR_CACHE, path
+        try:
+            table = ViewFactorTable('cylinder', CYLINDER_TABLE.exact, (1e-2, 1e3), (1e-4, 1e4), offset=1.0, points=33)
+            built = table(h[:10], S[:10])
+            assert os.path.exists(table.path)
+            reloaded = ViewFactorTable('cylinder', CYLINDER_TABLE.exact, (1e-2, 1e3), (1e-4, 1e4), offset=1.0, points=33)
+            assert np.array_equal(reloaded(h[:10], S[:10]), built)
+        finally:
+            view_factor.VIEW_FACTOR_CACHE = default
+
+if __name__ == "__main__":
+    test_solid_flame()
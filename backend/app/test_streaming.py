@@ -0,0 +1,67 @@
+import json
+
+import api
+from api import app
+
+def test_stream_endpoint():
+    """
+    Test NDJSON and CSV bulk evaluation through /api/stream, across chunk boundaries.
+    """
+    print("\nTesting Streaming Endpoint:")
+    print("-" * 40)
+
+    client = app.test_client()
+    default_chunk_rows, api.STREAM_CHUNK_ROWS = api.STREAM_CHUNK_ROWS, 2
+    try:
+        _check_stream_formats(client)
+    finally:
+        api.STREAM_CHUNK_ROWS = default_chunk_rows
+
+def _check_stream_formats(client):
+
+    rows = [
+        {'calculateMode': 'heatRelease', 'growthRate': 'fast', 'time': t}
+        for t in (60, 120, 180)
+    ]
+    body = '\n'.join(json.dumps(row) for row in rows) + '\n\nnot json\n"hi"\n'
+    response = client.post('/api/stream/t_squared_growth', data=body, content_type='application/x-ndjson')
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    print(f"NDJSON results: {results}")
+    assert response.mimetype == 'application/x-ndjson'
+    assert len(results) == 5
+    assert results[1] == client.post('/api/t_squared_growth', json=rows[1]).get_json()
+    assert results[3]['error'].startswith('Invalid JSON')
+    # A JSON string is a parsed row, not a parse error
+    assert results[4] == {'error': 'Each item must be a JSON object'}
+
+    # A line that is not UTF-8 is an error row, and the rows after it are still evaluated
+    body = json.dumps(rows[0]).encode() + b'\n{"time": "\xff"}\n' + json.dumps(rows[1]).encode() + b'\n'
+    response = client.post('/api/stream/t_squared_growth', data=body, content_type='application/x-ndjson')
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert results[1] == {'error': 'Row is not valid UTF-8'} and len(results) == 3
+
+    csv_body = (
+        "\nroomLength,roomWidth,roomHeight,openingWidth,openingHeight,surfaceMaterial\n"
+        "4,3,2.4,0.9,2.0,gypsum_board\n"
+        "4,3,2.4,-0.9,2.0,concrete\n"
+        "  \n"
+        "5,4,2.4,0.9,2.0,brick\n"
+    )
+    response = client.post('/api/stream/flashover', data=csv_body, content_type='text/csv')
+    lines = response.get_data(as_text=True).splitlines()
+
+    print(f"CSV results: {lines}")
+    assert lines[0] == 'mqh,thomas,babrauskas,error'
+    assert len(lines) == 4
+    assert lines[2] == ',,,All dimensions must be positive'
+
+    response = client.post('/api/stream/flashover', data=csv_body.encode().replace(b'concrete', b'concr\xe9te'),
+                           content_type='text/csv')
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 4 and lines[2] == ',,,Row is not valid UTF-8'
+
+    assert client.post('/api/stream/nope', data='', content_type='text/csv').status_code == 404
+
+if __name__ == "__main__":
+    test_stream_endpoint()
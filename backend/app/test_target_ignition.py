@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+
+from app.calculations.target_ignition import TargetIgnitionCalculator
+
+def _reference(R, ftp_threshold, alpha, critical_flux, n, Xr=0.3, dt=0.001):
+    """Fine-step midpoint integration of the flux-time product for one target."""
+    t, ftp = 0.0, 0.0
+    while ftp < ftp_threshold:
+        flux = Xr * alpha * (t + dt / 2)**2 / (4 * math.pi * R**2)
+        ftp += max(flux - critical_flux, 0.0)**n * dt
+        t += dt
+    return t
+
+def test_target_ignition():
+    """
+    Test flux-time product ignition of targets near a growing fire.
+    """
+    print("\nTesting Target Ignition:")
+    print("-" * 40)
+
+    # A fire at its peak from the start reproduces the constant flux ignition times
+    flux = 0.3 * 2000.0 / (4 * math.pi * 2.0**2)
+    thick = TargetIgnitionCalculator.thermally_thick_batch(2.0, 0.5, 300.0, 1e9, peak_hrr=2000.0, dt=0.01)
+    expected = math.pi / 4 * 0.5 * 280.0**2 / flux**2
+    print(f"Thick target: {thick['ignition_time'].scalar():.2f} s (constant flux {expected:.2f} s)")
+    assert abs(thick['ignition_time'].scalar() - expected) < 0.01
+    assert math.isclose(thick['flux'].scalar(), flux)
+    thin = TargetIgnitionCalculator.thermally_thin_batch(2.0, 500.0, 1.0, 0.001, 300.0, 1e9, peak_hrr=2000.0, dt=0.01)
+    assert abs(thin['ignition_time'].scalar() - 500.0 * 0.001 * 280.0 / flux) < 0.01
+
+    # Growing fire with a critical flux and a fractional index
+    result = TargetIgnitionCalculator.ignition_time(3.0, 1e4, 0.0469, critical_flux=5.0, n=1.5)
+    reference = _reference(3.0, 1e4, 0.0469, 5.0, 1.5)
+    print(f"FTP target: {result['ignition_time']:.2f} s at {result['flux']:.2f} kW/m² (reference {reference:.2f} s)")
+    assert abs(result['ignition_time'] - reference) < 0.01
+    assert math.isclose(result['hrr'], 0.0469 * result['ignition_time']**2)
+
+    # Targets × fires, with invalid targets and targets the fire never ignites
+    batch = TargetIgnitionCalculator.thermally_thick_batch(
+        [2.0, 6.0, -1.0, 3.0], [0.5, 0.5, 0.5, -1.0], 300.0, [0.0469, 0.00293],
+        critical_flux=10.0, peak_hrr=[np.inf, 3000.0], t_max=1200.0,
+    )
+    times = batch['ignition_time']
+    print(f"Ignition times:\n{times.values.round(1)}")
+    assert times.values.shape == (4, 2)
+    assert times.errors()[3] == "Not ignited within 1200 s"
+    assert times.errors()[4] == "Distance (R) must be positive."
+    assert times.errors()[6] == "Thermal inertia must be positive"
+    assert times.values[0, 0] < times.values[1, 0]
+
+    # Each cell matches the same target solved alone
+    alone = TargetIgnitionCalculator.thermally_thick_batch(6.0, 0.5, 300.0, 0.0469, critical_flux=10.0)
+    assert math.isclose(alone['ignition_time'].scalar(), times.values[1, 0])
+
+if __name__ == "__main__":
+    test_target_ignition()
@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+
+from app.calculations.ceiling_jet import CeilingJetCalculator
+from app.calculations.smoke_layer import SmokeLayerCalculator
+from app.utils.units import AREA, LENGTH, TEMPERATURE, imperial_mask
+
+def test_unit_schemas():
+    """
+    Test that unit schemas convert at the boundary, for whole systems and per-row masks.
+    """
+    print("\nTesting Unit Schemas:")
+    print("-" * 40)
+
+    # A mask converts only the imperial rows
+    mask = imperial_mask(['SI', 'imperial', 'Imperial'])
+    lengths = LENGTH.to_si(np.array([10.0, 10.0, 10.0]), mask)
+    print(f"Lengths in m: {lengths}")
+    assert mask.tolist() == [False, True, True]
+    # Unhashable JSON values mean SI instead of failing
+    assert imperial_mask([['imperial'], {'units': 'imperial'}]).tolist() == [False, False]
+    assert lengths[0] == 10.0 and math.isclose(lengths[1], 3.048)
+
+    assert math.isclose(TEMPERATURE.from_si(100.0, True), 212.0)
+    assert math.isclose(TEMPERATURE.to_si(212.0, True), 100.0)
+    assert math.isclose(AREA.to_si(10.7639, True), 1.0)
+
+    # Imperial scalar calls agree with converting by hand
+    H_ft, r_ft = 10.0, 6.5
+    delta_T = CeilingJetCalculator.calculate_temperature_rise(1000, H_ft, r_ft, 'imperial')
+    delta_T_si = CeilingJetCalculator.calculate_temperature_rise(1000, H_ft * 0.3048, r_ft * 0.3048)
+    assert math.isclose(delta_T, delta_T_si * 1.8)
+
+    # Floor area is an area: 200 ft² is about 18.6 m²
+    time = SmokeLayerCalculator.calculate_filling_time(500, 10, 200, 4, 'imperial')
+    time_si = SmokeLayerCalculator.calculate_filling_time(500, 3.048, 200 / 10.7639, 1.2192)
+    print(f"Filling time: {time:.1f} s")
+    assert math.isclose(time, time_si)
+
+    try:
+        SmokeLayerCalculator.calculate_filling_time(500, 10, -200, 4, 'imperial')
+        assert False, "Should have caught negative floor area"
+    except ValueError as e:
+        print(f"Successfully caught error: {e}")
+
+if __name__ == "__main__":
+    test_unit_schemas()
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+
+from app.calculations.vent_flow import VentFlowCalculator
+from app.calculations.vent_network import AMBIENT, VentNetworkCalculator
+
+def test_vent_network():
+    """
+    Test the multi-room vent network solver.
+    """
+    print("\nTesting Vent Network:")
+    print("-" * 40)
+
+    # One hot room, one door: (H - N) / N = (T_amb / T_hot)^(1/3) balances in and out flows
+    single = VentNetworkCalculator.solve([500.0], [0], [AMBIENT], 1.0, 0.0, 2.0)
+    ratio = (293.15 / 773.15)**(1/3)
+    print(f"Neutral plane: {single['neutral_plane'][0]:.4f} m (analytic {2.0 * ratio / (1 + ratio):.4f} m)")
+    assert math.isclose(single['neutral_plane'][0], 2.0 * ratio / (1 + ratio), rel_tol=1e-8)
+    # The outflow above the neutral plane is the zone model's layer outflow
+    outflow = VentFlowCalculator.layer_outflow(1.0, 2.0 - single['neutral_plane'][0], 353 / 773.15, 353 / 293.15)
+    assert math.isclose(single['flow_forward'][0], outflow, rel_tol=1e-8)
+
+    # Fire room opening into a corridor with two exits: every room balances
+    network = VentNetworkCalculator.solve(
+        [500.0, 200.0], [0, 1, 1], [1, AMBIENT, AMBIENT], [1.0, 0.9, 0.5], [0.0, 0.0, 1.5], [2.0, 2.1, 2.0],
+        sources=[0.5, 0.0],
+    )
+    print(f"Pressures: {network['pressure'].round(3)} Pa, vent flows: {network['mass_flow'].round(4)} kg/s")
+    assert network['residual'] < 1e-9
+    assert math.isclose(network['mass_flow'][0], 0.5, rel_tol=1e-8)
+    assert math.isclose(network['mass_flow'][1] + network['mass_flow'][2], 0.5, rel_tol=1e-8)
+
+    # A building with thousands of vents
+    rng = np.random.default_rng(3)
+    rooms = 2000
+    vent_from = np.concatenate([rng.integers(0, rooms, 4000), np.arange(rooms)])
+    vent_to = np.concatenate([rng.integers(AMBIENT, rooms, 4000),
+                              np.where(np.arange(rooms) % 40 == 0, AMBIENT, np.arange(rooms) - 1)])
+    vent_to = np.where(vent_to == vent_from, AMBIENT, vent_to)
+    bottom = rng.uniform(0.0, 1.0, vent_from.size)
+    sources = np.where(rng.random(rooms) < 0.05, 1.0, 0.0)
+    large = VentNetworkCalculator.solve(rng.uniform(20.0, 600.0, rooms), vent_from, vent_to,
+                                        rng.uniform(0.2, 2.0, vent_from.size), bottom, bottom + 1.5, sources=sources)
+    print(f"{vent_from.size} vents: {large['iterations']} iterations, error {large['residual']:.2e} kg/s")
+    assert large['residual'] < 1e-9
+    outside = large['mass_flow'][vent_to == AMBIENT].sum() - large['mass_flow'][vent_from == AMBIENT].sum()
+    assert math.isclose(outside, sources.sum(), rel_tol=1e-6)
+
+    # Invalid networks
+    for args, message in [
+        (([20.0, 20.0], [0, 1], [AMBIENT, 1], 1.0, 0.0, 2.0), "Vent 1: Vent must join two different rooms"),
+        (([20.0, 20.0], [0], [AMBIENT], 1.0, 0.0, 2.0), "Room 1 has no vent path to the outside"),
+        (([20.0], [0], [3], 1.0, 0.0, 2.0), "Vent 0: Vent must join rooms of the network"),
+        (([20.0, float('nan')], [0, 1], [AMBIENT, 0], 1.0, 0.0, 2.0), "Temperatures must be finite"),
+        (([20.0], [0], [AMBIENT], 1.0, 0.0, 2.0, 0.0, float('nan')), "Temperatures must be finite"),
+        (([20.0], [0], [AMBIENT], 1.0, 0.0, 2.0, float('nan')), "Sources must be finite"),
+    ]:
+        try:
+            VentNetworkCalculator.solve(*args)
+            assert False, message
+        except ValueError as e:
+            assert str(e) == message
+
+if __name__ == "__main__":
+    test_vent_network()
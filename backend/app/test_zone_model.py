@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+
+from app.calculations.design_fire import DesignFireCalculator
+from app.calculations.zone_model import ZoneModelCalculator
+
+def test_zone_model_batch():
+    """
+    Test smoke layer descent for closed and vented rooms integrated as one batch.
+    """
+    print("\nTesting Zone Model:")
+    print("-" * 40)
+
+    time = DesignFireCalculator.time_grid(600, 1.0)
+    results = ZoneModelCalculator.integrate_layer_batch(
+        time, np.full(time.size, 1000.0), [3.0, 3.0, -1.0], 50.0,
+        vent_width=[0.0, 2.0, 0.0], vent_height=[0.0, 2.0, 0.0],
+    )
+    height = results['layer_height'].values
+    temperature = results['layer_temperature'].values
+
+    print(f"Layer height at 60 s: {height[60]} m")
+    assert height.shape == (time.size, 3)
+
+    # The layer only descends in a closed room, nearly to the floor, where the
+    # fire runs out of air: the layer temperature levels off instead of running away
+    assert (np.diff(height[:, 0]) <= 1e-9).all()
+    assert height[-1, 0] < 0.05
+    assert np.isfinite(temperature[:, 0]).all() and (np.diff(temperature[:, 0]) >= -1e-6).all()
+    assert 400.0 < temperature[-1, 0] < 600.0
+    assert math.isclose(temperature[-1, 0], temperature[-120, 0], rel_tol=1e-2)
+
+    # A small, nearly sealed room stays bounded and does not depend on the rest of the batch
+    hrr = np.full(time.size, 2000.0)
+    alone = ZoneModelCalculator.integrate_layer_batch(time, hrr, 3.0, 20.0, vent_width=0.01, vent_height=0.01)
+    batched = ZoneModelCalculator.integrate_layer_batch(time, hrr, 3.0, [20.0, 50.0, 200.0],
+                                                        vent_width=0.01, vent_height=0.01)
+    alone = alone['layer_temperature'].values[:, 0]
+    assert np.isfinite(alone).all() and alone.max() < 1000.0
+    assert np.allclose(batched['layer_temperature'].values[:, 0], alone, rtol=1e-2)
+
+    # A vent holds the layer at a steady height above the floor
+    assert 0.5 < height[-1, 1] < 2.0
+    assert math.isclose(height[-1, 1], height[-100, 1], rel_tol=1e-2)
+    assert temperature[-1, 1] > 20.0
+
+    assert results['layer_height'].errors()[2] == "All dimensions must be positive"
+    assert np.isnan(height[:, 2]).all()
+
+    # Rooms with an ambient temperature that is not physical are flagged, not integrated
+    results = ZoneModelCalculator.integrate_layer_batch(time, np.full(time.size, 1000.0), 3.0, 50.0,
+                                                        ambient_temp=[20.0, np.nan, -300.0])
+    assert results['layer_height'].errors()[1:] == ["Ambient temperature must be above absolute zero"] * 2
+    assert np.isnan(results['layer_height'].values[:, 1:]).all()
+    assert np.allclose(results['layer_height'].values[:, 0], height[:, 0], atol=1e-2)
+
+    for kwargs in ({'rtol': 0.0}, {'rtol': -1e-3}):
+        try:
+            ZoneModelCalculator.integrate_layer_batch(time, np.full(time.size, 1000.0), 3.0, 50.0, **kwargs)
+            assert False
+        except ValueError as e:
+            print(f"Expected error: {e}")
+
+    # The step budget bounds the integration instead of letting it spin
+    default_steps, ZoneModelCalculator.MAX_STEPS = ZoneModelCalculator.MAX_STEPS, 5
+    try:
+        ZoneModelCalculator.integrate_layer_batch(time, np.full(time.size, 1000.0), 3.0, 50.0, max_step=1.0)
+        assert False
+    except ValueError as e:
+        print(f"Expected error: {e}")
+    finally:
+        ZoneModelCalculator.MAX_STEPS = default_steps
+
+def test_zone_model_design_fire():
+    """
+    Test that a batch of design fire curves drives the zone model directly.
+    """
+    time = DesignFireCalculator.time_grid(900, 1.0)
+    fires = DesignFireCalculator.design_fire_curve_batch([0.0117, 0.0469], 1500, time, fuel_load=800)
+    results = ZoneModelCalculator.integrate_layer_batch(time, fires['hrr'].values, 4.0, 100.0)
+
+    # The faster fire fills the room first
+    height = results['layer_height'].values
+    assert np.argmax(height[:, 1] < 2.0) < np.argmax(height[:, 0] < 2.0)
+
+if __name__ == "__main__":
+    test_zone_model_batch()
+    test_zone_model_design_fire()
@@ -0,0 +1,115 @@
+import numpy as np
+
+
+class BatchResult:
+    """
+    Holds the output of a vectorized calculation.
+
+    Rows that failed validation are NaN in `values` and carry a non-zero code in
+    `codes`, which indexes into `messages`. Keeping errors as small integer codes
+    means a batch of a million rows costs one int32 array, not a million strings.
+    """
+
+    __slots__ = ('values', 'codes', 'messages')
+
+    def __init__(self, values: np.ndarray, codes: np.ndarray, messages: tuple):
+        self.values = values
+        self.codes = codes
+        self.messages = messages
+
+    @property
+    def ok(self) -> np.ndarray:
+        """Boolean mask of rows that passed validation."""
+        return self.codes == 0
+
+    def errors(self) -> list:
+        """Returns one entry per row: None for valid rows, the error message otherwise."""
+        lookup = (None,) + self.messages
+        return [lookup[code] for code in self.codes.ravel().tolist()]
+
+    def scalar(self) -> float:
+        """
+        Unwraps a single-row result, raising ValueError exactly like the
+        original scalar methods did when validation fails.
+        """
+        code = int(self.codes.flat[0])
+        if code:
+            raise ValueError(self.messages[code - 1])
+        return float(self.values.flat[0])
+
+
+class MaskedValidator:
+    """
+    Applies validation rules to whole arrays at once.
+
+    Each rule marks the rows that break it; a row keeps the first error it hits,
+    which mirrors the order the scalar methods raise in.
+    """
+
+    def __init__(self, shape):
+        self.codes = np.zeros(shape, dtype=np.int32)
+        self.messages = []
+        self._index = {}
+
+    def _code(self, message: str) -> int:
+        if message not in self._index:
+            self.messages.append(message)
+            self._index[message] = len(self.messages)
+        return self._index[message]
+
+    def require(self, valid: np.ndarray, message: str) -> None:
+        """Flags every still-valid row where `valid` is False with `message`."""
+        failed = ~np.asarray(valid, dtype=bool) & (self.codes == 0)
+        if failed.any():
+            self.codes[failed] = self._code(message)
+
+    def require_each(self, valid: np.ndarray, labels: np.ndarray, messages) -> None:
+        """
+        Flags every still-valid row where `valid` is False with messages[labels[row]],
+        one message per group of rows (e.g. per unknown key) in a single pass.
+        """
+        failed = ~np.asarray(valid, dtype=bool) & (self.codes == 0)
+        if failed.any():
+            labels = np.broadcast_to(labels, failed.shape)[failed]
+            codes = np.zeros(len(messages), dtype=np.int32)
+            for label in np.unique(labels).tolist():
+                codes[label] = self._code(messages[label])
+            self.codes[failed] = codes[labels]
+
+    def reject(self, index, message: str) -> None:
+        """Flags a single row (e.g. one that could not be parsed) unless it already failed."""
+        if self.codes[index] == 0:
+            self.codes[index] = self._code(message)
+
+    def absorb(self, result: BatchResult, where=True) -> None:
+        """
+        Carries over the errors of an upstream BatchResult computed on the same rows,
+        optionally only for the rows selected by the `where` mask.
+        """
+        for code, message in enumerate(result.messages, start=1):
+            self.require((result.codes != code) | ~np.asarray(where, dtype=bool), message)
+
+    @property
+    def ok(self) -> np.ndarray:
+        return self.codes == 0
+
+    def result(self, values) -> BatchResult:
+        """Packs the computed values, blanking out rows that failed validation."""
+        values = np.array(np.broadcast_to(values, self.codes.shape), dtype=float)
+        values[self.codes != 0] = np.nan
+        return BatchResult(values, self.codes, tuple(self.messages))
+
+
+def as_arrays(*values):
+    """
+    Converts scalars, lists and arrays to float arrays broadcast to a common shape.
+    """
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
+
+def safe(valid: np.ndarray, values: np.ndarray, fill: float = 1.0) -> np.ndarray:
+    """
+    Replaces entries of invalid rows with a harmless placeholder so the math
+    that follows does not emit warnings on rows that will be discarded anyway.
+    """
+    return np.where(valid, values, fill)
@@ -0,0 +1,132 @@
+# backend/app/utils/sketch.py
+"""
+Streaming summary statistics for results too large to keep in memory.
+
+Both accumulators take whole NumPy chunks at a time and keep a fixed, small
+amount of state no matter how many values they have seen, so a Monte Carlo
+run of 10^7 samples never needs a 10^7-element result array.
+"""
+
+import math
+
+import numpy as np
+
+
+class RunningMoments:
+    """
+    Count, mean, standard deviation, minimum and maximum, merged chunk by chunk
+    with Chan's parallel update so the result does not depend on chunking.
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, values: np.ndarray) -> None:
+        n = values.size
+        if not n:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean)**2).sum())
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.m2 += chunk_m2 + delta**2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (NaN for fewer than two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+
+class _BucketStore:
+    """Dense counts for a contiguous, growable range of integer bucket indices."""
+
+    __slots__ = ('offset', 'counts')
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, indices: np.ndarray) -> None:
+        if not indices.size:
+            return
+        lo, hi = int(indices.min()), int(indices.max())
+        if not self.counts.size:
+            self.offset, self.counts = lo, np.zeros(hi - lo + 1, dtype=np.int64)
+        else:
+            new_lo = min(lo, self.offset)
+            new_hi = max(hi, self.offset + self.counts.size - 1)
+            if new_lo < self.offset or new_hi >= self.offset + self.counts.size:
+                grown = np.zeros(new_hi - new_lo + 1, dtype=np.int64)
+                start = self.offset - new_lo
+                grown[start:start + self.counts.size] = self.counts
+                self.offset, self.counts = new_lo, grown
+        start = lo - self.offset
+        self.counts[start:start + hi - lo + 1] += np.bincount(indices - lo, minlength=hi - lo + 1)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile estimator with bounded relative error (the DDSketch scheme).
+
+    Values are counted in logarithmic buckets whose width is set by
+    `relative_accuracy`: every reported quantile is within that relative error
+    of the exact sample quantile. Memory grows with the logarithm of the value
+    range, not with the number of values, and is typically a few thousand counters.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.005, min_value: float = 1e-12):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.count = 0
+        self.zero_count = 0
+        self._positive = _BucketStore()
+        self._negative = _BucketStore()
+
+    def _index(self, magnitudes: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def add(self, values: np.ndarray) -> None:
+        """Counts every finite value of a chunk."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        self.count += values.size
+        positive = values > self.min_value
+        negative = values < -self.min_value
+        self.zero_count += int(values.size - positive.sum() - negative.sum())
+        self._positive.add(self._index(values[positive]))
+        self._negative.add(self._index(-values[negative]))
+
+    def _value(self, index: np.ndarray) -> np.ndarray:
+        # Midpoint of bucket (γ^(i-1), γ^i] in the relative sense
+        return 2 * self.gamma**index / (self.gamma + 1)
+
+    def quantiles(self, q) -> np.ndarray:
+        """Estimated quantiles for q in [0, 1] (NaN if nothing has been added)."""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if not self.count:
+            return np.full(q.shape, np.nan)
+        ranks = np.clip(np.floor(q * (self.count - 1)), 0, self.count - 1)
+
+        # Ascending order: negatives from the largest magnitude down, zeros, positives up
+        negative = self._negative.counts[::-1]
+        counts = np.concatenate((negative, [self.zero_count], self._positive.counts))
+        values = np.concatenate((
+            -self._value(self._negative.offset + np.arange(negative.size)[::-1]),
+            [0.0],
+            self._value(self._positive.offset + np.arange(self._positive.counts.size)),
+        ))
+        bucket = np.searchsorted(np.cumsum(counts), ranks, side='right')
+        return values[bucket]
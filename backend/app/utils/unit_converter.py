@@ -1,161 +1,230 @@
+import sys
+
+import numpy as np
+
+
+class LinearConversion:
+    """
+    One compiled unit conversion: value * scale + offset.
+
+    Instances are callable and can be kept around for hot loops. Scalars stay
+    scalars; lists and tuples come back as NumPy arrays.
+    """
+
+    __slots__ = ('scale', 'offset')
+
+    def __init__(self, scale: float, offset: float = 0.0):
+        self.scale = scale
+        self.offset = offset
+
+    def __call__(self, value):
+        if isinstance(value, (list, tuple)):
+            value = np.asarray(value, dtype=float)
+        if self.offset:
+            return value * self.scale + self.offset
+        return value * self.scale
+
+
+class _Identity(LinearConversion):
+    """Same unit on both sides: hands the value back untouched."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(1.0)
+
+    def __call__(self, value):
+        if isinstance(value, (list, tuple)):
+            return np.asarray(value, dtype=float)
+        return value
+
+
+IDENTITY = _Identity()
+
+
+# Conversion factors per quantity, keyed by lowercase (from, to) unit pairs.
+# Each direction keeps its own published factor rather than the reciprocal of the other.
+_FACTORS = {
+    'temperature': {
+        ('c', 'f'): (9/5, 32),
+        ('f', 'c'): (5/9, -32 * 5/9),
+        ('c', 'k'): (1, 273.15),
+        ('k', 'c'): (1, -273.15),
+        ('f', 'k'): (5/9, -32 * 5/9 + 273.15),
+        ('k', 'f'): (9/5, -273.15 * 9/5 + 32),
+    },
+    'length': {
+        ('m', 'ft'): (3.28084,),  # 1 meter = 3.28084 feet
+        ('ft', 'm'): (0.3048,),   # 1 foot = 0.3048 meters
+    },
+    'velocity': {
+        ('m/s', 'ft/s'): (3.28084,),
+        ('ft/s', 'm/s'): (0.3048,),
+    },
+    'area': {
+        ('m2', 'ft2'): (10.7639,),  # 1 m² = 10.7639 ft²
+        ('ft2', 'm2'): (1 / 10.7639,),
+    },
+    'volume': {
+        ('m3', 'ft3'): (35.3147,),  # 1 m³ = 35.3147 ft³
+        ('ft3', 'm3'): (0.0283168,),
+    },
+    'heat_release': {
+        ('kw', 'btu/s'): (0.947817,),  # 1 kW = 0.947817 BTU/s
+        ('btu/s', 'kw'): (1.055056,),  # 1 BTU/s = 1.055056 kW
+    },
+    'heat_flux': {
+        ('kw/m2', 'btu/ft2/s'): (0.08811,),
+        ('btu/ft2/s', 'kw/m2'): (11.349,),
+    },
+    # Same factor as heat release: the time component (s²) is the same in both systems
+    'alpha': {
+        ('kw/s2', 'btu/s3'): (0.947817,),
+        ('btu/s3', 'kw/s2'): (1 / 0.947817,),
+    },
+    'mass_flow': {
+        ('kg/s', 'lb/s'): (2.205,),
+        ('lb/s', 'kg/s'): (1 / 2.205,),
+    },
+}
+
+
+def _compile(factors: dict) -> dict:
+    """
+    Builds the registry: interned (from, to) pairs mapped to a LinearConversion,
+    including the identity pair for every unit of the quantity.
+    """
+    registry = {}
+    for quantity, pairs in factors.items():
+        table = {}
+        for (from_unit, to_unit), factor in pairs.items():
+            for unit in (from_unit, to_unit):
+                table[sys.intern(unit), sys.intern(unit)] = IDENTITY
+            table[sys.intern(from_unit), sys.intern(to_unit)] = LinearConversion(*factor)
+        registry[quantity] = table
+    return registry
+
+
+_REGISTRY = _compile(_FACTORS)
+_ALL_CONVERSIONS = {pair: conversion for table in _REGISTRY.values() for pair, conversion in table.items()}
+
+# Conversions already resolved for the exact unit strings a caller passed,
+# so repeated calls skip normalizing the strings altogether
+_RESOLVED = {}
+
+
+def _resolve(quantity, from_unit: str, to_unit: str):
+    key = (quantity, from_unit, to_unit)
+    conversion = _RESOLVED.get(key)
+    if conversion is None:
+        table = _ALL_CONVERSIONS if quantity is None else _REGISTRY[quantity]
+        conversion = table.get((str(from_unit).lower(), str(to_unit).lower()))
+        if conversion is not None:
+            _RESOLVED[key] = conversion
+    return conversion
+
+
 class UnitConverter:
     """
     A utility class that handles all unit conversions needed for fire dynamics calculations.
     This ensures consistent and accurate conversions between different measurement systems.
+
+    Every conversion is precompiled into a single multiply-add. The converters accept
+    scalars, lists and NumPy arrays; `converter_for` returns the compiled callable itself.
     """
-    
+
+    @staticmethod
+    def converter_for(from_unit: str, to_unit: str) -> LinearConversion:
+        """
+        Returns a reusable callable converting values from `from_unit` to `to_unit`,
+        for any quantity in the registry (unit names are case-insensitive).
+
+        Example:
+            to_meters = UnitConverter.converter_for('ft', 'm')
+            to_meters(np.array([10.0, 20.0])) -> [3.048, 6.096]
+        """
+        conversion = _resolve(None, from_unit, to_unit)
+        if conversion is None:
+            raise ValueError(f"No conversion from '{from_unit}' to '{to_unit}'")
+        return conversion
+
     @staticmethod
     def temperature_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts temperatures between Celsius, Fahrenheit, and Kelvin.
         This is crucial for fire calculations as different equations may require different scales.
-        
+
         Example:
             20°C -> 68°F
             100°C -> 373.15K
         """
-        # First convert to Kelvin as our common reference point
-        # Think of Kelvin as our "universal language" for temperature
-        if from_unit == 'C':
-            kelvin = value + 273.15
-        elif from_unit == 'F':
-            kelvin = (value - 32) * 5/9 + 273.15
-        elif from_unit == 'K':
-            kelvin = value
-        else:
-            raise ValueError("Input unit must be 'C', 'F', or 'K'")
-            
-        # Now convert from Kelvin to our target unit
-        if to_unit == 'C':
-            return kelvin - 273.15
-        elif to_unit == 'F':
-            return (kelvin - 273.15) * 9/5 + 32
-        elif to_unit == 'K':
-            return kelvin
-        else:
+        conversion = _resolve('temperature', from_unit, to_unit)
+        if conversion is None:
+            if str(from_unit).lower() not in ('c', 'f', 'k'):
+                raise ValueError("Input unit must be 'C', 'F', or 'K'")
             raise ValueError("Output unit must be 'C', 'F', or 'K'")
+        return conversion(value)
 
     @staticmethod
     def length_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts lengths between meters and feet.
         Important for dimensions in fire calculations like room size and flame height.
-        
+
         Example:
             1 meter -> 3.28084 feet
             10 feet -> 3.048 meters
         """
-        # Define our conversion factors
-        conversions = {
-            'm_to_ft': 3.28084,  # 1 meter = 3.28084 feet
-            'ft_to_m': 0.3048    # 1 foot = 0.3048 meters
-        }
-        
-        # If units are the same, no conversion needed
-        if from_unit == to_unit:
-            return value
-        # Convert from meters to feet
-        elif from_unit == 'm' and to_unit == 'ft':
-            return value * conversions['m_to_ft']
-        # Convert from feet to meters
-        elif from_unit == 'ft' and to_unit == 'm':
-            return value * conversions['ft_to_m']
-        else:
-            raise ValueError("Units must be 'm' or 'ft'")
-         # --- ADD THIS ENTIRE NEW METHOD ---
+        return UnitConverter._convert('length', value, from_unit, to_unit, "Units must be 'm' or 'ft'")
+
     @staticmethod
     def heat_release_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts heat release rates between kilowatts (kW) and British Thermal Units per second (BTU/s).
-        
+
         Example:
             1000 kW -> 947.817 BTU/s
         """
-        conversions = {
-            'kw_to_btu': 0.947817, # 1 kW = 0.947817 BTU/s
-            'btu_to_kw': 1.055056  # 1 BTU/s = 1.055056 kW
-        }
-
-        from_unit = from_unit.lower()
-        to_unit = to_unit.lower()
-        
-        if from_unit == to_unit:
-            return value
-        elif from_unit == 'kw' and to_unit == 'btu/s':
-            return value * conversions['kw_to_btu']
-        elif from_unit == 'btu/s' and to_unit == 'kw':
-            return value * conversions['btu_to_kw']
-        else:
-            raise ValueError("Units must be 'kW' or 'BTU/s'")
-        
-        # Add this method inside the UnitConverter class in unit_converter.py
-
-    # Add this entire method to your UnitConverter class
+        return UnitConverter._convert('heat_release', value, from_unit, to_unit, "Units must be 'kW' or 'BTU/s'")
 
     @staticmethod
     def heat_flux_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts heat flux between kW/m² and BTU/ft²/s.
         """
-        conversions = {
-            'kw/m2_to_btu/ft2/s': 0.08811,
-            'btu/ft2/s_to_kw/m2': 11.349
-        }
-        
-        from_unit = from_unit.lower()
-        to_unit = to_unit.lower()
-
-        if from_unit == to_unit:
-            return value
-        elif from_unit == 'kw/m2' and to_unit == 'btu/ft2/s':
-            return value * conversions['kw/m2_to_btu/ft2/s']
-        elif from_unit == 'btu/ft2/s' and to_unit == 'kw/m2':
-            return value * conversions['btu/ft2/s_to_kw/m2']
-        else:
-            raise ValueError("Units must be 'kW/m2' or 'BTU/ft2/s'")
-        
-       # Add this entire method to your UnitConverter class in unit_converter.py
+        return UnitConverter._convert('heat_flux', value, from_unit, to_unit, "Units must be 'kW/m2' or 'BTU/ft2/s'")
 
     @staticmethod
     def alpha_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts the fire growth coefficient (alpha) between kW/s² and BTU/s³.
         """
-        # This conversion factor is the same as for heat release (kW to BTU/s)
-        # because the time component (s²) is the same in both systems.
-        CONVERSION_FACTOR = 0.947817 
-
-        from_unit = from_unit.lower()
-        to_unit = to_unit.lower()
-
-        if from_unit == to_unit:
-            return value
-        elif from_unit == 'kw/s2' and to_unit == 'btu/s3':
-            return value * CONVERSION_FACTOR
-        elif from_unit == 'btu/s3' and to_unit == 'kw/s2':
-            return value / CONVERSION_FACTOR
-        else:
-            raise ValueError("Units must be 'kW/s2' or 'BTU/s3'")
-        
-      # Add this method inside the UnitConverter class in unit_converter.py
-
-# Add this entire method to your UnitConverter class in unit_converter.py
+        return UnitConverter._convert('alpha', value, from_unit, to_unit, "Units must be 'kW/s2' or 'BTU/s3'")
 
     @staticmethod
     def area_converter(value: float, from_unit: str, to_unit: str) -> float:
         """
         Converts area between square meters (m²) and square feet (ft²).
         """
-        CONVERSION_FACTOR = 10.7639  # 1 m² = 10.7639 ft²
+        return UnitConverter._convert('area', value, from_unit, to_unit, "Units must be 'm2' or 'ft2'")
 
-        from_unit = from_unit.lower()
-        to_unit = to_unit.lower()
+    @staticmethod
+    def volume_converter(value: float, from_unit: str, to_unit: str) -> float:
+        """
+        Converts volume between cubic meters (m³) and cubic feet (ft³).
+        """
+        return UnitConverter._convert('volume', value, from_unit, to_unit, "Units must be 'm3' or 'ft3'")
+
+    @staticmethod
+    def mass_flow_converter(value: float, from_unit: str, to_unit: str) -> float:
+        """
+        Converts mass flow rates between kg/s and lb/s.
+        """
+        return UnitConverter._convert('mass_flow', value, from_unit, to_unit, "Units must be 'kg/s' or 'lb/s'")
 
-        if from_unit == to_unit:
-            return value
-        elif from_unit == 'm2' and to_unit == 'ft2':
-            return value * CONVERSION_FACTOR
-        elif from_unit == 'ft2' and to_unit == 'm2':
-            return value / CONVERSION_FACTOR
-        else:
-            raise ValueError("Units must be 'm2' or 'ft2'")
+    @staticmethod
+    def _convert(quantity: str, value, from_unit: str, to_unit: str, message: str):
+        conversion = _resolve(quantity, from_unit, to_unit)
+        if conversion is None:
+            raise ValueError(message)
+        return conversion(value)
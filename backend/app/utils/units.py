@@ -0,0 +1,144 @@
+# backend/app/utils/units.py
+"""
+Declarative unit handling for the calculators and request handlers.
+
+Every calculation works in SI internally. Instead of branching on the
+`units` string inside each method, a calculation declares a UnitSchema that
+names the physical quantity of each input and output. The schema converts
+whole arrays at the boundary: inputs to SI before the `_batch` call, outputs
+back to the caller's system afterwards. Each conversion is a precomputed
+multiply-add, applied either to everything (a single unit system) or through
+a boolean mask (a batch mixing SI and imperial rows). The factors come from
+UnitConverter's compiled registry.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import BatchResult
+from .unit_converter import LinearConversion, UnitConverter
+
+
+def is_imperial(units) -> bool:
+    """
+    Resolves a `units` value ('SI', 'imperial', any casing) to a flag. Values
+    that are not strings (e.g. a JSON list) are compared by their str(), so
+    they mean SI rather than failing the request.
+    """
+    return _is_imperial(units if isinstance(units, str) else str(units))
+
+
+@lru_cache(maxsize=64)
+def _is_imperial(units: str) -> bool:
+    # Each distinct string is only normalized the first time it is seen
+    return units.lower() == 'imperial'
+
+
+def imperial_mask(values) -> np.ndarray:
+    """Boolean mask of the rows whose `units` value asks for imperial units."""
+    return np.fromiter((is_imperial(value) for value in values), dtype=bool, count=len(values))
+
+
+class Quantity:
+    """
+    A physical quantity with its SI and imperial units, and the two compiled
+    UnitConverter conversions between them (value * scale + offset).
+    """
+
+    __slots__ = ('si_unit', 'imperial_unit', 'to_si_scale', 'to_si_offset', 'from_si_scale', 'from_si_offset')
+
+    def __init__(self, si_unit: str, imperial_unit: str, to_si: LinearConversion = None,
+                 from_si: LinearConversion = None):
+        to_si = to_si or UnitConverter.converter_for(imperial_unit, si_unit)
+        from_si = from_si or UnitConverter.converter_for(si_unit, imperial_unit)
+        self.si_unit = si_unit
+        self.imperial_unit = imperial_unit
+        self.to_si_scale, self.to_si_offset = to_si.scale, to_si.offset
+        self.from_si_scale, self.from_si_offset = from_si.scale, from_si.offset
+
+    def to_si(self, values, imperial):
+        """Converts imperial values to SI where `imperial` (a flag or row mask) is set."""
+        return _convert(values, imperial, self.to_si_scale, self.to_si_offset)
+
+    def from_si(self, values, imperial):
+        """Converts SI values to imperial where `imperial` (a flag or row mask) is set."""
+        return _convert(values, imperial, self.from_si_scale, self.from_si_offset)
+
+
+def _convert(values, imperial, scale: float, offset: float):
+    if isinstance(imperial, (bool, np.bool_)):
+        if not imperial:
+            return values
+        values = np.asarray(values, dtype=float) * scale
+        return values + offset if offset else values
+    values = np.asarray(values, dtype=float)
+    return np.where(imperial, values * scale + offset, values)
+
+
+# --- Quantities used by the calculators ---
+
+LENGTH = Quantity('m', 'ft')
+AREA = Quantity('m2', 'ft2')
+VELOCITY = Quantity('m/s', 'ft/s')
+TEMPERATURE = Quantity('C', 'F')
+# A temperature difference scales like a temperature but has no offset
+TEMPERATURE_RISE = Quantity('C', 'F', to_si=LinearConversion(1 / 1.8), from_si=LinearConversion(1.8))
+HEAT_RELEASE = Quantity('kW', 'BTU/s')
+HEAT_FLUX = Quantity('kW/m2', 'BTU/ft2/s')
+ALPHA = Quantity('kW/s2', 'BTU/s3')
+MASS_FLOW = Quantity('kg/s', 'lb/s')
+# Response time index of a detector or sprinkler link, √(length · time)
+RTI = Quantity('(m·s)^1/2', '(ft·s)^1/2', to_si=LinearConversion(math.sqrt(0.3048)),
+               from_si=LinearConversion(1 / math.sqrt(0.3048)))
+
+
+class UnitSchema:
+    """
+    Declares the quantity of each named input and output of one calculation.
+
+    Names that are not declared (dimensionless values, or values that are
+    always SI such as Q in kW for several correlations) pass through untouched.
+    """
+
+    __slots__ = ('inputs', 'outputs')
+
+    def __init__(self, inputs: dict = None, outputs: dict = None):
+        self.inputs = inputs or {}
+        self.outputs = outputs or {}
+
+    def to_si(self, imperial, values: dict) -> dict:
+        """Converts a dict of named input columns to SI."""
+        inputs = self.inputs
+        return {
+            name: inputs[name].to_si(value, imperial) if name in inputs else value
+            for name, value in values.items()
+        }
+
+    def from_si(self, imperial, values: dict) -> dict:
+        """Converts a dict of named SI output columns to the requested unit system."""
+        outputs = self.outputs
+        return {
+            name: outputs[name].from_si(value, imperial) if name in outputs else value
+            for name, value in values.items()
+        }
+
+    def evaluate(self, calculate, units, **inputs):
+        """
+        Runs a `_batch` method with its keyword inputs converted to SI and converts
+        its result back. `units` is a unit system name or a boolean imperial row mask.
+        The result is a BatchResult (converted with the 'value' output) or a dict of
+        BatchResults keyed by output name.
+        """
+        imperial = units if isinstance(units, np.ndarray) else is_imperial(units)
+        result = calculate(**self.to_si(imperial, inputs))
+        if isinstance(result, BatchResult):
+            return self._convert_result(imperial, 'value', result)
+        return {name: self._convert_result(imperial, name, value) for name, value in result.items()}
+
+    def _convert_result(self, imperial, name: str, result: BatchResult) -> BatchResult:
+        if name not in self.outputs:
+            return result
+        values = self.outputs[name].from_si(result.values, imperial)
+        return BatchResult(np.asarray(values, dtype=float), result.codes, result.messages)
@@ -0,0 +1,24 @@
+# backend/asgi.py
+"""
+Production entry point: serves the routes of api.py under an ASGI server.
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+or `python asgi.py`, which does the same with HOST and PORT from the
+environment. See app/asgi.py for the worker pools and per-route limits.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api import app as flask_app
+from app.asgi import AsgiServer
+
+app = AsgiServer(flask_app)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host=os.environ.get('HOST', '0.0.0.0'), port=int(os.environ.get('PORT', 8000)))
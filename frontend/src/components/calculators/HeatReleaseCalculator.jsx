@@ -22,6 +22,29 @@ import {
   Spinner
 } from '@chakra-ui/react';
 
+// The material list is fetched once per page load and shared by every mount.
+// The browser revalidates it with its ETag, so a reload usually costs a 304.
+let materialsRequest = null;
+
+const loadMaterials = () => {
+  if (!materialsRequest) {
+    materialsRequest = fetch(`${import.meta.env.VITE_API_BASE_URL}/api/materials`)
+      .then(async (response) => {
+        const data = await response.json();
+        if (!response.ok) {
+          throw new Error(data.error || 'Failed to fetch materials.');
+        }
+        return data;
+      })
+      .catch((error) => {
+        // Allow a later mount to retry
+        materialsRequest = null;
+        throw error;
+      });
+  }
+  return materialsRequest;
+};
+
 const HeatReleaseCalculator = () => {
   // --- NEW: State to hold the materials fetched from the API ---
   const [materials, setMaterials] = useState({});
@@ -40,12 +63,7 @@ const HeatReleaseCalculator = () => {
   useEffect(() => {
     const fetchMaterials = async () => {
       try {
-        const response = await fetch('http://127.0.0.1:5000/api/materials');
-        const data = await response.json();
-        if (!response.ok) {
-          throw new Error(data.error || 'Failed to fetch materials.');
-        }
-        setMaterials(data);
+        setMaterials(await loadMaterials());
       } catch (error) {
         toast({
           title: 'Failed to Load Materials',